@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Pool Decoder Throughput Benchmark
+Decodes recorded logsNotification fixtures in a loop and reports messages
+per second and microseconds per message for each platform
+
+Usage:
+    python benchmarks/decode_throughput.py --rounds 500
+    python benchmarks/decode_throughput.py --fixtures captured.json --json
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from monitoring.decoders import decode_pumpfun_logs, decode_raydium_transaction, raydium_init_from_logs
+from pool_fixtures import FIXTURE_PATH, load_fixtures
+
+def decode(fixture: dict):
+    """Full decode path of the monitor, with getTransaction answered from the fixture"""
+    value = fixture["notification"]["value"]
+    if fixture["platform"] == "pumpfun":
+        event = decode_pumpfun_logs(value)
+    else:
+        init_log = raydium_init_from_logs(value["logs"])
+        if init_log is None:
+            return None
+        tx = fixture["transaction"]
+        event = decode_raydium_transaction(base64.b64decode(tx["transaction"][0]),
+                                           tx["meta"].get("loadedAddresses"), init_log)
+    return event.as_dict() if event else None
+
+def run(args) -> dict:
+    fixtures = load_fixtures(args.fixtures)
+    report = {"rounds": args.rounds, "messages": len(fixtures), "platforms": {}}
+
+    for platform in sorted({f["platform"] for f in fixtures}):
+        subset = [f for f in fixtures if f["platform"] == platform]
+        pools = sum(1 for f in subset if decode(f))
+
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for fixture in subset:
+                decode(fixture)
+        elapsed = time.perf_counter() - start
+
+        decoded = args.rounds * len(subset)
+        report["platforms"][platform] = {
+            "messages": len(subset),
+            "pool_creations": pools,
+            "messages_per_sec": round(decoded / elapsed, 1),
+            "us_per_message": round(elapsed / decoded * 1e6, 3)
+        }
+    return report
+
+def print_report(report: dict):
+    print("=" * 60)
+    print(f"Fixture messages: {report['messages']}  Rounds: {report['rounds']}")
+    print("=" * 60)
+    print(f"{'platform':<12}{'msgs':>6}{'pools':>7}{'msg/s':>14}{'us/msg':>10}")
+    for platform, stats in report["platforms"].items():
+        print(f"{platform:<12}{stats['messages']:>6}{stats['pool_creations']:>7}"
+              f"{stats['messages_per_sec']:>14,.1f}{stats['us_per_message']:>10.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pool-creation decoder throughput")
+    parser.add_argument("--rounds", type=int, default=200, help="Passes over the fixture set")
+    parser.add_argument("--fixtures", default=FIXTURE_PATH, help="Fixture JSON file")
+    parser.add_argument("--json", action="store_true", help="Print the raw report as JSON")
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+if __name__ == "__main__":
+    main()
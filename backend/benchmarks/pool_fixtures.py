@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Pool Notification Fixtures
+Builds logsNotification messages (and getTransaction payloads) in the exact
+on-chain layouts of Raydium AMM v4 initialize2 and pump.fun create, plus
+unrelated program traffic, and writes them to fixtures/pool_notifications.json.
+Leader-wallet swaps (pump.fun trade logs and jsonParsed Raydium swaps) feed
+the copy trader tests.
+
+Usage:
+    python benchmarks/pool_fixtures.py
+"""
+
+import base64
+import json
+import os
+import random
+import struct
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.transaction import Transaction
+
+from monitoring.decoders import (
+    INITIALIZE2,
+    PUMPFUN_CREATE_EVENT,
+    PUMPFUN_PROGRAM,
+    PUMPFUN_TRADE_EVENT,
+    RAY_LOG_INIT,
+    RAYDIUM_AMM_V4,
+    SOL_MINT,
+)
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "pool_notifications.json")
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+def _borsh_string(value: str) -> bytes:
+    encoded = value.encode()
+    return struct.pack("<I", len(encoded)) + encoded
+
+def _notification(slot: int, signature: str, logs: list) -> dict:
+    return {"context": {"slot": slot}, "value": {"signature": signature, "err": None, "logs": logs}}
+
+def _pumpfun_trade_event(mint: Pubkey, sol_lamports: int, token_amount: int, is_buy: bool, user: Pubkey) -> bytes:
+    return (PUMPFUN_TRADE_EVENT + bytes(mint) + struct.pack("<QQ?", sol_lamports, token_amount, is_buy)
+            + bytes(user) + struct.pack("<qQQ", 1_700_000_000, 30_000_000_000, 1_073_000_000_000_000))
+
+def pumpfun_create(slot: int, name: str, symbol: str, dev_buy_lamports: int = 0) -> dict:
+    """pump.fun create (optionally followed by the creator's buy) as a logsNotification result"""
+    mint, curve, user = Pubkey.new_unique(), Pubkey.new_unique(), Pubkey.new_unique()
+    create = (PUMPFUN_CREATE_EVENT + _borsh_string(name) + _borsh_string(symbol)
+              + _borsh_string(f"https://ipfs.io/ipfs/{symbol.lower()}") + bytes(mint) + bytes(curve) + bytes(user))
+    logs = [
+        f"Program {PUMPFUN_PROGRAM} invoke [1]",
+        "Program log: Instruction: Create",
+        f"Program data: {_b64(create)}",
+        f"Program {PUMPFUN_PROGRAM} consumed 120000 of 400000 compute units",
+        f"Program {PUMPFUN_PROGRAM} success",
+    ]
+    if dev_buy_lamports:
+        trade = _pumpfun_trade_event(mint, dev_buy_lamports, 35_000_000_000_000, True, user)
+        logs += [
+            f"Program {PUMPFUN_PROGRAM} invoke [1]",
+            "Program log: Instruction: Buy",
+            f"Program data: {_b64(trade)}",
+            f"Program {PUMPFUN_PROGRAM} success",
+        ]
+    expected = {"token_address": str(mint), "pool_address": str(curve), "creator": str(user),
+                "token_symbol": symbol, "liquidity": dev_buy_lamports / 1e9}
+    return {"platform": "pumpfun", "notification": _notification(slot, str(Keypair().pubkey()), logs),
+            "expected": expected}
+
+def raydium_initialize2(slot: int, pc_lamports: int, coin_amount: int) -> dict:
+    """Raydium initialize2 logsNotification plus the getTransaction payload it needs"""
+    user = Keypair()
+    accounts = [Pubkey.new_unique() for _ in range(21)]
+    accounts[8] = Pubkey.new_unique()                 # coin mint (the new token)
+    accounts[9] = Pubkey.from_string(SOL_MINT)        # pc mint
+    accounts[17] = user.pubkey()                      # user wallet
+    metas = [AccountMeta(key, is_signer=(i == 17), is_writable=i not in (0, 1, 2, 3, 9, 15))
+             for i, key in enumerate(accounts)]
+    data = INITIALIZE2.pack(1, 254, 0, pc_lamports, coin_amount)
+    ix = Instruction(Pubkey.from_string(RAYDIUM_AMM_V4), data, metas)
+    tx = Transaction([user], Message([ix], user.pubkey()), Hash.new_unique())
+
+    ray_log = RAY_LOG_INIT.pack(0, 1_700_000_000, 9, 6, 1, 1, pc_lamports, coin_amount) + bytes(Pubkey.new_unique())
+    logs = [
+        "Program ComputeBudget111111111111111111111111111111 invoke [1]",
+        "Program ComputeBudget111111111111111111111111111111 success",
+        f"Program {RAYDIUM_AMM_V4} invoke [1]",
+        f"Program log: initialize2: InitializeInstruction2 {{ nonce: 254, open_time: 0, "
+        f"init_pc_amount: {pc_lamports}, init_coin_amount: {coin_amount} }}",
+        "Program 11111111111111111111111111111111 invoke [2]",
+        "Program 11111111111111111111111111111111 success",
+        f"Program log: ray_log: {_b64(ray_log)}",
+        f"Program {RAYDIUM_AMM_V4} consumed 90000 of 200000 compute units",
+        f"Program {RAYDIUM_AMM_V4} success",
+    ]
+    signature = str(tx.signatures[0])
+    expected = {"token_address": str(accounts[8]), "pool_address": str(accounts[4]),
+                "creator": str(user.pubkey()), "liquidity": pc_lamports / 1e9}
+    return {
+        "platform": "raydium",
+        "notification": _notification(slot, signature, logs),
+        "transaction": {"slot": slot, "transaction": [_b64(bytes(tx)), "base64"],
+                        "meta": {"err": None, "loadedAddresses": {"writable": [], "readonly": []}}},
+        "expected": expected,
+    }
+
+def swap_noise(slot: int, platform: str) -> dict:
+    """Ordinary swap traffic on the same programs; decoders must reject it"""
+    program = RAYDIUM_AMM_V4 if platform == "raydium" else PUMPFUN_PROGRAM
+    payload = bytes([3]) + os.urandom(56)
+    logs = [
+        f"Program {program} invoke [1]",
+        "Program log: Instruction: Swap" if platform == "raydium" else "Program log: Instruction: Sell",
+        f"Program log: ray_log: {_b64(payload)}" if platform == "raydium" else f"Program data: {_b64(os.urandom(120))}",
+        f"Program {program} success",
+    ]
+    return {"platform": platform, "notification": _notification(slot, str(Keypair().pubkey()), logs),
+            "expected": None}
+
+def pumpfun_trade(slot: int, user: str, mint: str, sol_lamports: int, token_amount: int, is_buy: bool) -> dict:
+    """A wallet's pump.fun buy or sell as a logsNotification result"""
+    trade = _pumpfun_trade_event(Pubkey.from_string(mint), sol_lamports, token_amount, is_buy,
+                                 Pubkey.from_string(user))
+    logs = [
+        f"Program {PUMPFUN_PROGRAM} invoke [1]",
+        f"Program log: Instruction: {'Buy' if is_buy else 'Sell'}",
+        f"Program data: {_b64(trade)}",
+        f"Program {PUMPFUN_PROGRAM} success",
+    ]
+    expected = {"wallet": user, "token_address": mint, "side": "buy" if is_buy else "sell",
+                "sol_amount": sol_lamports / 1e9}
+    return {"platform": "pumpfun", "notification": _notification(slot, str(Keypair().pubkey()), logs),
+            "expected": expected}
+
+def raydium_swap(slot: int, user: str, mint: str, sol_lamports: int, token_amount: int, is_buy: bool,
+                 held: int = 0) -> dict:
+    """
+    A wallet's Raydium swap through WSOL: the logsNotification (no mint in the
+    logs) plus the jsonParsed getTransaction result with the token transfers
+    as inner instructions
+    """
+    wsol_account, token_account = str(Pubkey.new_unique()), str(Pubkey.new_unique())
+    pool_pc, pool_coin = str(Pubkey.new_unique()), str(Pubkey.new_unique())
+    authority = "5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1"
+    keys = [user, wsol_account, token_account, pool_pc, pool_coin, RAYDIUM_AMM_V4,
+            "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"]
+
+    def transfer(source, destination, owner, amount):
+        return {"program": "spl-token", "programId": keys[6], "stackHeight": 2,
+                "parsed": {"type": "transfer", "info": {"source": source, "destination": destination,
+                                                          "authority": owner, "amount": str(amount)}}}
+
+    if is_buy:
+        transfers = [transfer(wsol_account, pool_pc, user, sol_lamports),
+                     transfer(pool_coin, token_account, authority, token_amount)]
+    else:
+        transfers = [transfer(token_account, pool_coin, user, token_amount),
+                     transfer(pool_pc, wsol_account, authority, sol_lamports)]
+
+    def balance(index, mint_address, owner, amount):
+        return {"accountIndex": index, "mint": mint_address, "owner": owner,
+                "uiTokenAmount": {"amount": str(amount), "decimals": 6}}
+
+    signature = str(Keypair().pubkey())
+    ray_log = bytes([3]) + struct.pack("<QQQQQQQ", sol_lamports if is_buy else token_amount, 0, 1 if is_buy else 2,
+                                       0, 10**15, 10**12, token_amount if is_buy else sol_lamports)
+    logs = [
+        f"Program {RAYDIUM_AMM_V4} invoke [1]",
+        f"Program log: ray_log: {_b64(ray_log)}",
+        f"Program {keys[6]} invoke [2]",
+        f"Program {keys[6]} success",
+        f"Program {keys[6]} invoke [2]",
+        f"Program {keys[6]} success",
+        f"Program {RAYDIUM_AMM_V4} success",
+    ]
+    transaction = {
+        "slot": slot,
+        "blockTime": 1_700_000_000,
+        "transaction": {
+            "signatures": [signature],
+            "message": {
+                "accountKeys": [{"pubkey": key, "signer": i == 0, "writable": i < 5, "source": "transaction"}
+                                for i, key in enumerate(keys)],
+                "instructions": [{"programId": RAYDIUM_AMM_V4, "accounts": keys[:5], "data": "", "stackHeight": None}]
+            }
+        },
+        "meta": {
+            "err": None,
+            "fee": 5000,
+            "preBalances": [10**10, 2039280, 2039280, 2039280, 2039280, 1, 1],
+            "postBalances": [10**10 - 5000, 2039280, 2039280, 2039280, 2039280, 1, 1],
+            "preTokenBalances": [balance(1, SOL_MINT, user, sol_lamports if is_buy else 0),
+                                 balance(2, mint, user, held), balance(3, SOL_MINT, authority, 10**15),
+                                 balance(4, mint, authority, 10**15)],
+            "postTokenBalances": [],
+            "innerInstructions": [{"index": 0, "instructions": transfers}],
+            "logMessages": logs
+        }
+    }
+    expected = {"wallet": user, "token_address": mint, "side": "buy" if is_buy else "sell",
+                "sol_amount": sol_lamports / 1e9}
+    return {"platform": "raydium", "notification": _notification(slot, signature, logs),
+            "transaction": transaction, "expected": expected}
+
+def build_copy_fixtures(leader: str, seed: int = 7) -> list:
+    """
+    A leader's session: pump.fun and Raydium buys, a partial and a full
+    sell, a swap by another wallet in the same subscription feed and a
+    non-swap transaction mentioning the leader
+    """
+    random.seed(seed)
+    other = str(Keypair().pubkey())
+    pump_mint, ray_mint = str(Pubkey.new_unique()), str(Pubkey.new_unique())
+    slot = 310_000_000
+    fixtures = [
+        pumpfun_trade(slot + 1, leader, pump_mint, 2 * 10**9, 70_000_000_000, True),
+        pumpfun_trade(slot + 2, other, str(Pubkey.new_unique()), 10**9, 30_000_000_000, True),
+        raydium_swap(slot + 3, leader, ray_mint, 5 * 10**8, 9_000_000, True),
+        pumpfun_trade(slot + 5, leader, pump_mint, 10**9, 35_000_000_000, False),
+        raydium_swap(slot + 6, leader, ray_mint, 6 * 10**8, 9_000_000, False, held=9_000_000),
+    ]
+    transfer_logs = ["Program 11111111111111111111111111111111 invoke [1]",
+                     "Program 11111111111111111111111111111111 success"]
+    fixtures.insert(2, {"platform": None, "expected": None,
+                        "notification": _notification(slot + 2, str(Keypair().pubkey()), transfer_logs)})
+    return fixtures
+
+def build_fixtures(seed: int = 7) -> list:
+    """Mixed message set: mostly swap noise with pool creations sprinkled in"""
+    random.seed(seed)
+    fixtures = []
+    slot = 300_000_000
+    for i in range(40):
+        slot += 1
+        if i % 8 == 0:
+            fixtures.append(raydium_initialize2(slot, random.randint(5, 200) * 10**9, random.randint(10**12, 10**15)))
+        elif i % 8 == 4:
+            fixtures.append(pumpfun_create(slot, f"Token {i}", f"TK{i}", random.choice([0, 2 * 10**9])))
+        else:
+            fixtures.append(swap_noise(slot, random.choice(["raydium", "pumpfun"])))
+    return fixtures
+
+def load_fixtures(path: str = FIXTURE_PATH) -> list:
+    with open(path) as f:
+        return json.load(f)
+
+def main():
+    fixtures = build_fixtures()
+    os.makedirs(os.path.dirname(FIXTURE_PATH), exist_ok=True)
+    with open(FIXTURE_PATH, "w") as f:
+        json.dump(fixtures, f, indent=1)
+    print(f"Wrote {len(fixtures)} notifications to {FIXTURE_PATH}")
+
+if __name__ == "__main__":
+    main()
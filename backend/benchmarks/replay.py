@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Pool Event Replay Backtester
+Feeds a WebSocket recording (see monitoring/recorder.py and WS_RECORD_PATH)
+through PoolMonitor decoding and SniperBot.on_new_pool at recorded speed,
+N times faster or as fast as possible, with a simulated analyzer and
+executor, and reports messages and pool events per second, the sniper's
+decisions and its latency percentiles
+
+Without --recording the pool fixtures are written to a temporary recording
+first. Raydium creations need their transaction: it is answered from the
+fixtures, or from --rpc for live recordings.
+
+Usage:
+    python benchmarks/replay.py
+    python benchmarks/replay.py --recording pools.rec --speed 10 --rpc https://api.mainnet-beta.solana.com
+    python benchmarks/replay.py --speed 0 --rpc-delay 0.02 --json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from solders.keypair import Keypair
+
+from core.database import close_db
+from monitoring.event_bus import PoolEventBus
+from monitoring.pool_monitor import PROGRAM_IDS, PoolMonitor
+from monitoring.recorder import MessageRecorder, read_recording
+from monitoring.ws_mux import WebSocketMux
+from trading.sniper import SniperBot
+from trading.traded_mints import TradedMintRegistry
+from utils.timing import RollingStages
+from pool_fixtures import build_fixtures
+
+class FixtureRpc:
+    """Answers the monitor's getTransaction calls from recorded transactions"""
+
+    def __init__(self, transactions: dict):
+        self.transactions = transactions
+
+    async def call(self, method: str, params: list):
+        if method != "getTransaction":
+            raise ValueError(f"{method} is not recorded")
+        return self.transactions.get(params[0])
+
+class SimulatedAnalyzer:
+    """Analyzer with fixed RPC delays; a seeded share of mints keep their authorities"""
+
+    def __init__(self, rpc_delay: float = 0.0, unsafe_ratio: float = 0.3, seed: int = 7):
+        self.rpc_delay = rpc_delay
+        self.unsafe_ratio = unsafe_ratio
+        self.seed = seed
+
+    def _renounced(self, token_address: str) -> bool:
+        return random.Random(f"{self.seed}:{token_address}").random() >= self.unsafe_ratio
+
+    async def fetch_mint(self, token_address: str, commitment: str = "confirmed") -> bool:
+        await asyncio.sleep(self.rpc_delay)
+        return self._renounced(token_address)
+
+    def check_mint_authority(self, mint: bool) -> bool:
+        return mint
+
+    def check_freeze_authority(self, mint: bool) -> bool:
+        return mint
+
+    async def analyze_token(self, token_address: str, commitment: str = "confirmed") -> dict:
+        await asyncio.sleep(self.rpc_delay * 2)
+        renounced = self._renounced(token_address)
+        return {"address": token_address, "mint_renounced": renounced, "freeze_renounced": renounced,
+                "safety_score": 100 if renounced else 40, "is_safe": renounced}
+
+class SimulatedExecutor:
+    """Executor whose buys take a fixed quote and send time and always land"""
+
+    def __init__(self, quote_delay: float = 0.0, send_delay: float = 0.0):
+        self.quote_delay = quote_delay
+        self.send_delay = send_delay
+        self.buys = 0
+
+    async def execute_buy(self, token_address: str, sol_amount: float, slippage: float = 1.0,
+                          strategy: str = "manual", quote: dict = None) -> dict:
+        started = time.perf_counter()
+        if quote is None:
+            await asyncio.sleep(self.quote_delay)
+        quoted = time.perf_counter()
+        await asyncio.sleep(self.send_delay)
+        self.buys += 1
+        signature = f"replay-{self.buys}"
+        return {
+            "success": True,
+            "signature": signature,
+            "explorer_url": f"https://solscan.io/tx/{signature}",
+            "timings": {"quote": (quoted - started) * 1000, "send": (time.perf_counter() - quoted) * 1000}
+        }
+
+def write_fixture_recording(fixtures: list, path: str, interval: float = 0.05) -> dict:
+    """
+    Record fixtures as logsNotification messages spaced ``interval`` apart
+
+    Returns:
+        {signature: getTransaction result} for the Raydium creations
+    """
+    recorder = MessageRecorder(path)
+    start = time.time()
+    for i, fixture in enumerate(fixtures):
+        message = {"jsonrpc": "2.0", "method": "logsNotification",
+                   "params": {"result": fixture["notification"], "subscription": 1}}
+        recorder.record(json.dumps(message), start + i * interval)
+    recorder.close()
+    return {f["notification"]["value"]["signature"]: f["transaction"] for f in fixtures if f.get("transaction")}
+
+def platforms_of(result: dict) -> list:
+    """Platforms whose program the notification's logs invoke, as logsSubscribe mentions would route it"""
+    logs = (result.get("value") or {}).get("logs") or ()
+    return [platform for platform, program in PROGRAM_IDS.items()
+            if any(line.startswith(f"Program {program} invoke") for line in logs)]
+
+async def replay(path: str, speed: float, sniper: SniperBot, rpc) -> dict:
+    """Feed every recorded notification to the monitors, paced at ``speed`` (0 = max)"""
+    mux = WebSocketMux(url="ws://replay")
+    monitors = {}
+    for platform in PROGRAM_IDS:
+        monitor = PoolMonitor(platform, mux=mux, rpc=rpc, commitment="confirmed")
+        monitor.is_running = True
+        monitor.on_new_pool = sniper.on_new_pool
+        monitors[platform] = monitor
+
+    messages = notifications = 0
+    max_lag = 0.0
+    first = None
+    start = time.perf_counter()
+    for recorded_at, message in read_recording(path):
+        messages += 1
+        data = json.loads(message)
+        if data.get("method") != "logsNotification":
+            continue
+        notifications += 1
+
+        if first is None:
+            first = recorded_at
+        if speed > 0:
+            due = start + (recorded_at - first) / speed
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                max_lag = max(max_lag, -delay)
+
+        result = data["params"]["result"]
+        result["received_at"] = time.perf_counter()
+        for platform in platforms_of(result):
+            await monitors[platform]._on_notification(dict(result))
+
+    # Raydium decodes run as tasks, as they do off the live socket
+    pending = [task for monitor in monitors.values() for task in monitor._decoding]
+    if pending:
+        await asyncio.gather(*pending)
+    await mux.close()
+
+    return {"messages": messages, "notifications": notifications,
+            "elapsed": time.perf_counter() - start, "max_lag_ms": max_lag * 1000}
+
+def run(args) -> dict:
+    transactions = {}
+    path = args.recording
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "fixtures.rec")
+        transactions = write_fixture_recording(build_fixtures(args.seed) * args.repeat, path, args.interval)
+
+    config = {"min_liquidity": args.min_liquidity, "min_safety_score": args.min_safety_score}
+    sniper = SniperBot(0, Keypair(), config, sniper_id="replay", bus=PoolEventBus(monitor_factory=None))
+    sniper.analyzer = SimulatedAnalyzer(args.rpc_delay, args.unsafe_ratio, args.seed)
+    sniper.executor = SimulatedExecutor(args.rpc_delay, args.send_delay)
+    sniper.traded = TradedMintRegistry()
+    sniper.traded._loaded = True
+    sniper.latency = RollingStages(window=1_000_000)
+
+    if args.rpc:
+        from core.rpc import AsyncRpc
+        rpc = AsyncRpc(args.rpc)
+    else:
+        rpc = FixtureRpc(transactions)
+
+    # The sniper narrates every pool; keep that out of the measurement
+    output = sys.stdout if args.verbose else open(os.devnull, "w")
+    with contextlib.redirect_stdout(output):
+        totals = asyncio.run(replay(path, args.speed, sniper, rpc))
+    close_db(sniper.db)
+
+    elapsed = totals["elapsed"]
+    return {
+        "recording": args.recording or "fixtures",
+        "speed": args.speed or "max",
+        "messages": totals["messages"],
+        "pool_events": sniper.pools_detected,
+        "decisions": {"bought": sniper.tokens_bought, "skipped": sniper.tokens_skipped},
+        "rejections": {stage["name"]: stage["rejected"] for stage in sniper.filters.get_stats()["stages"]},
+        "elapsed_s": round(elapsed, 3),
+        "messages_per_sec": round(totals["notifications"] / elapsed, 1),
+        "events_per_sec": round(sniper.pools_detected / elapsed, 1),
+        "max_lag_ms": round(totals["max_lag_ms"], 3),
+        "latency_ms": sniper.latency.summary()
+    }
+
+def print_report(report: dict):
+    print("=" * 60)
+    print(f"Recording: {report['recording']}  Speed: {report['speed']}")
+    print("=" * 60)
+    print(f"Messages:     {report['messages']} ({report['messages_per_sec']:,.1f}/s)")
+    print(f"Pool events:  {report['pool_events']} ({report['events_per_sec']:,.1f}/s)")
+    print(f"Bought:       {report['decisions']['bought']}  Skipped: {report['decisions']['skipped']}")
+    print(f"Rejections:   {', '.join(f'{name}={count}' for name, count in report['rejections'].items())}")
+    print(f"Elapsed:      {report['elapsed_s']}s  Max lag: {report['max_lag_ms']} ms")
+    print("-" * 60)
+    print(f"{'stage':<28}{'count':>7}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for stage, stats in sorted(report["latency_ms"].items()):
+        print(f"{stage:<28}{stats['count']:>7}{stats['p50']:>9.3f}{stats['p95']:>9.3f}{stats['p99']:>9.3f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded pool traffic through the sniper")
+    parser.add_argument("--recording", help="Recording written with WS_RECORD_PATH (default: pool fixtures)")
+    parser.add_argument("--speed", type=float, default=0, help="Replay speed multiplier; 0 replays as fast as possible")
+    parser.add_argument("--rpc", help="RPC endpoint for Raydium transactions of a live recording")
+    parser.add_argument("--repeat", type=int, default=25, help="Fixture set repetitions when no recording is given")
+    parser.add_argument("--interval", type=float, default=0.05, help="Seconds between fixture messages")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for fixtures and simulated mint safety")
+    parser.add_argument("--rpc-delay", type=float, default=0.0, help="Simulated seconds per analyzer RPC and quote")
+    parser.add_argument("--send-delay", type=float, default=0.0, help="Simulated seconds per buy send")
+    parser.add_argument("--unsafe-ratio", type=float, default=0.3, help="Share of mints with live authorities")
+    parser.add_argument("--min-liquidity", type=float, default=1.0, help="Sniper min_liquidity (SOL)")
+    parser.add_argument("--min-safety-score", type=int, default=70, help="Sniper min_safety_score")
+    parser.add_argument("--verbose", action="store_true", help="Keep the sniper's per-pool output")
+    parser.add_argument("--json", action="store_true", help="Print the raw report as JSON")
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+if __name__ == "__main__":
+    main()
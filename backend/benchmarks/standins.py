@@ -0,0 +1,175 @@
+"""
+Local Stand-in Servers
+Minimal Jupiter and Solana JSON-RPC servers with injectable latency,
+used by the benchmark scripts instead of the public endpoints
+"""
+
+import base64
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse, parse_qs
+
+from solders.hash import Hash
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.system_program import TransferParams, transfer
+from solders.transaction import VersionedTransaction
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+
+class Latency:
+    """Fixed delay plus uniform jitter, in milliseconds"""
+
+    def __init__(self, base_ms: float = 0.0, jitter_ms: float = 0.0):
+        self.base_ms = base_ms
+        self.jitter_ms = jitter_ms
+
+    def sleep(self):
+        delay = self.base_ms + random.uniform(0, self.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+def _signature_from_wire(raw: bytes) -> str:
+    """First signature of a serialized transaction (single-byte compact length)"""
+    return str(Signature.from_bytes(raw[1:65]))
+
+def build_swap_transaction(user_public_key: str) -> str:
+    """Unsigned v0 transaction payable by ``user_public_key``, base64 encoded"""
+    payer = Pubkey.from_string(user_public_key)
+    ix = transfer(TransferParams(from_pubkey=payer, to_pubkey=payer, lamports=1))
+    message = MessageV0.try_compile(payer, [ix], [], Hash.new_unique())
+    tx = VersionedTransaction.populate(message, [Signature.default()])
+    return base64.b64encode(bytes(tx)).decode()
+
+class _Handler(BaseHTTPRequestHandler):
+    """Shared plumbing; subclasses implement the routes"""
+
+    latency: Latency = Latency()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, payload: Any, status: int = 200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> Any:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"null")
+
+class JupiterHandler(_Handler):
+    """Serves ``GET /quote`` and ``POST /swap`` like Jupiter v6"""
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if not url.path.endswith("/quote"):
+            return self._reply({"error": "not found"}, 404)
+
+        self.latency.sleep()
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        amount = int(params.get("amount", "0"))
+        self._reply({
+            "inputMint": params.get("inputMint"),
+            "outputMint": params.get("outputMint"),
+            "inAmount": str(amount),
+            "outAmount": str(amount * 1000),
+            "otherAmountThreshold": str(amount * 990),
+            "slippageBps": int(params.get("slippageBps", 50)),
+            "priceImpactPct": "0.001",
+            "routePlan": [],
+        })
+
+    def do_POST(self):
+        if not self.path.endswith("/swap"):
+            return self._reply({"error": "not found"}, 404)
+
+        self.latency.sleep()
+        payload = self._body()
+        self._reply({
+            "swapTransaction": build_swap_transaction(payload["userPublicKey"]),
+            "lastValidBlockHeight": 1000,
+        })
+
+class RpcHandler(_Handler):
+    """Answers the JSON-RPC methods used by the trade pipeline"""
+
+    slot = 1000
+    confirmation_status: Optional[str] = "confirmed"
+    overrides: Dict[str, Callable[[list], Any]] = {}
+
+    def do_POST(self):
+        request = self._body()
+        self.latency.sleep()
+
+        if isinstance(request, list):
+            return self._reply([self._dispatch(item) for item in request])
+        self._reply(self._dispatch(request))
+
+    def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        method = request.get("method")
+        params = request.get("params") or []
+        context = {"slot": self.slot, "apiVersion": "1.18.0"}
+
+        if method in self.overrides:
+            result = self.overrides[method](params)
+        elif method == "sendTransaction":
+            result = _signature_from_wire(base64.b64decode(params[0]))
+        elif method == "getSignatureStatuses":
+            status = None
+            if self.confirmation_status:
+                status = {
+                    "slot": self.slot,
+                    "confirmations": None,
+                    "err": None,
+                    "status": {"Ok": None},
+                    "confirmationStatus": self.confirmation_status,
+                }
+            result = {"context": context, "value": [status for _ in params[0]]}
+        elif method == "getLatestBlockhash":
+            result = {
+                "context": context,
+                "value": {"blockhash": str(Hash.new_unique()), "lastValidBlockHeight": self.slot + 150},
+            }
+        elif method == "getBalance":
+            result = {"context": context, "value": 100 * 10**9}
+        elif method in ("getBlockHeight", "getSlot"):
+            result = self.slot
+        elif method == "getHealth":
+            result = "ok"
+        else:
+            return {"jsonrpc": "2.0", "id": request.get("id"),
+                    "error": {"code": -32601, "message": f"Method not found: {method}"}}
+
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+class StandinServer:
+    """Run a handler class on a background thread bound to localhost"""
+
+    def __init__(self, handler: type, latency: Latency = None, **attrs):
+        # Per-server handler subclass so latency/overrides are not shared
+        self.handler = type(handler.__name__, (handler,), {"latency": latency or Latency(), **attrs})
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self.handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
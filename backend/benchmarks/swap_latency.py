@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Swap Pipeline Latency Benchmark
+Runs N swaps through JupiterClient against local stand-in Jupiter and RPC
+servers and reports p50/p95/p99 for every pipeline stage
+
+Usage:
+    python benchmarks/swap_latency.py --swaps 200 --jupiter-latency-ms 40 --rpc-latency-ms 25
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from solders.keypair import Keypair
+
+from standins import JupiterHandler, Latency, RpcHandler, StandinServer, SOL_MINT
+from trading.jupiter import JupiterClient
+from utils.timing import StageTimer, summarize
+
+STAGES = ["quote", "swap_transaction", "decode", "sign", "send", "confirm", "total"]
+
+async def run(args) -> dict:
+    jupiter_latency = Latency(args.jupiter_latency_ms, args.jitter_ms)
+    rpc_latency = Latency(args.rpc_latency_ms, args.jitter_ms)
+
+    with StandinServer(JupiterHandler, jupiter_latency) as jupiter, \
+            StandinServer(RpcHandler, rpc_latency) as rpc:
+        client = JupiterClient(api_url=jupiter.url, rpc_endpoint=rpc.url)
+        keypair = Keypair()
+        token = str(Keypair().pubkey())
+
+        samples = []
+        failures = 0
+        for _ in range(args.swaps):
+            timer = StageTimer()
+            # The client prints every signature; keep the report readable
+            with contextlib.redirect_stdout(io.StringIO()):
+                signature = await client.swap(keypair, SOL_MINT, token, 10_000_000, timer=timer)
+            if signature:
+                samples.append(timer.as_dict())
+            else:
+                failures += 1
+
+    return {"swaps": args.swaps, "failures": failures, "stages": summarize(samples)}
+
+def print_report(report: dict):
+    print("=" * 60)
+    print(f"Swaps: {report['swaps']}  Failures: {report['failures']}")
+    print("=" * 60)
+    print(f"{'stage':<18}{'p50':>10}{'p95':>10}{'p99':>10}{'mean':>10}")
+    for stage in STAGES:
+        stats = report["stages"].get(stage)
+        if stats:
+            print(f"{stage:<18}{stats['p50']:>10.2f}{stats['p95']:>10.2f}{stats['p99']:>10.2f}{stats['mean']:>10.2f}")
+    print("(milliseconds)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark swap pipeline stage latency")
+    parser.add_argument("--swaps", type=int, default=100, help="Number of swaps to run")
+    parser.add_argument("--jupiter-latency-ms", type=float, default=30.0, help="Injected Jupiter API latency")
+    parser.add_argument("--rpc-latency-ms", type=float, default=20.0, help="Injected RPC latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="Uniform jitter added to each request")
+    parser.add_argument("--json", action="store_true", help="Print the raw report as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+from fastapi import APIRouter, HTTPException, Depends
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from typing import List, Optional
+import asyncio
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import get_db, close_db, Wallet
+from core.wallet import import_wallet
+from utils.encryption import decrypt_private_key
+from trading.copy_trader import get_copy_trade_manager
+
+router = APIRouter(prefix="/copy", tags=["copy"])
+
+# Pydantic models
+class CopyStartRequest(BaseModel):
+    leaders: List[str]
+    wallet_ids: List[int]
+    password: str
+    copier_id: Optional[str] = None
+    buy_amount: float = 0.1
+    size_mode: str = "fixed"  # fixed or ratio
+    size_ratio: float = 1.0
+    max_buy_amount: Optional[float] = None
+    min_leader_sol: float = 0.0
+    copy_sells: bool = True
+    repeat_buys: bool = False
+    slippage: float = 5.0
+
+# Routes
+@router.post("/start")
+async def start_copy_trader(request: CopyStartRequest, db: Session = Depends(get_db)):
+    """
+    Start mirroring leader wallets from our wallets
+
+    Every follower wallet is unlocked once here; leader trades are then
+    copied without further key derivation.
+    """
+    try:
+        if request.size_mode not in ("fixed", "ratio"):
+            raise HTTPException(status_code=400, detail="size_mode must be fixed or ratio")
+
+        wallets = db.query(Wallet).filter(Wallet.id.in_(request.wallet_ids)).all()
+        if len(wallets) != len(set(request.wallet_ids)):
+            raise HTTPException(status_code=404, detail="Wallet not found")
+
+        # Key derivation is CPU bound; decrypt all wallets off the event loop
+        loop = asyncio.get_running_loop()
+        try:
+            private_keys = await asyncio.gather(*[
+                loop.run_in_executor(None, decrypt_private_key, wallet.encrypted_private_key, request.password)
+                for wallet in wallets
+            ])
+        except Exception:
+            raise HTTPException(status_code=401, detail="Invalid password")
+
+        followers = [
+            (wallet.id, import_wallet(private_key, "private_key"))
+            for wallet, private_key in zip(wallets, private_keys)
+        ]
+        config = request.dict(exclude={"leaders", "wallet_ids", "password", "copier_id"})
+
+        manager = get_copy_trade_manager()
+        return await manager.start(request.leaders, followers, config, request.copier_id)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        close_db(db)
+
+@router.post("/stop")
+async def stop_copy_trader(copier_id: Optional[str] = None):
+    """Stop one copy trader, or all of them when no copier_id is given"""
+    try:
+        return await get_copy_trade_manager().stop(copier_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/status")
+async def get_copy_status():
+    """Running copy traders with their mirrored trades and leader-to-follower lag"""
+    try:
+        return get_copy_trade_manager().get_status()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
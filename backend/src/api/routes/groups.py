@@ -1,15 +1,21 @@
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Optional, List
+import json
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.database import get_db, close_db
+from core.database import get_db, close_db, Wallet
 from core.group_manager import get_group_manager
 from core.bulk_operations import get_bulk_operations
+from core.lookup_tables import LookupTableManager, get_lookup_table_cache
+from core.panic_sell import PanicSeller
+from core.wallet import import_wallet
+from utils.encryption import decrypt_private_key
 
 router = APIRouter(prefix="/group", tags=["wallet-groups"])
 
@@ -25,6 +31,7 @@ class DistributeSOLRequest(BaseModel):
     to_group_id: int
     amount_per_wallet: float
     password: str
+    use_lookup_table: bool = False
 
 class CollectSOLRequest(BaseModel):
     from_group_id: int
@@ -32,6 +39,10 @@ class CollectSOLRequest(BaseModel):
     password: str
     leave_amount: float = 0.001
 
+class RegisterLookupTableRequest(BaseModel):
+    authority_wallet_id: int
+    password: str
+
 class BulkBuyRequest(BaseModel):
     group_id: int
     token_address: str
@@ -46,6 +57,11 @@ class BulkSellRequest(BaseModel):
     slippage: float = 1.0
     password: str
 
+class PanicSellAllRequest(BaseModel):
+    password: str
+    slippage: float = 15.0
+    group_ids: Optional[List[int]] = None  # None = every group
+
 # Routes
 @router.post("/create")
 def create_group(request: CreateGroupRequest, db: Session = Depends(get_db)):
@@ -143,8 +159,50 @@ def delete_group(group_id: int, db: Session = Depends(get_db)):
     finally:
         close_db(db)
 
+@router.post("/{group_id}/lookup-table")
+def register_lookup_table(group_id: int, request: RegisterLookupTableRequest, db: Session = Depends(get_db)):
+    """
+    Register all group wallets into the group's address lookup tables
+    
+    The authority wallet pays for and owns the tables. Run again after
+    adding wallets to extend the tables with the new addresses only.
+    """
+    try:
+        wallet = db.query(Wallet).filter(Wallet.id == request.authority_wallet_id).first()
+        if not wallet:
+            raise HTTPException(status_code=404, detail="Wallet not found")
+        
+        try:
+            private_key = decrypt_private_key(wallet.encrypted_private_key, request.password)
+        except:
+            raise HTTPException(status_code=401, detail="Invalid password")
+        
+        authority = import_wallet(private_key, "private_key")
+        return LookupTableManager().register_group(group_id, authority)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        close_db(db)
+
+@router.get("/{group_id}/lookup-table")
+def get_lookup_tables(group_id: int):
+    """Get the cached lookup tables for a group"""
+    try:
+        tables = get_lookup_table_cache().for_group(group_id)
+        return {
+            "group_id": group_id,
+            "tables": [
+                {"address": str(t.key), "address_count": len(t.addresses)}
+                for t in tables
+            ]
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/distribute-sol")
-def distribute_sol(request: DistributeSOLRequest, db: Session = Depends(get_db)):
+async def distribute_sol(request: DistributeSOLRequest, db: Session = Depends(get_db)):
     """
     Distribute SOL from one wallet to all wallets in a group
     
@@ -152,11 +210,12 @@ def distribute_sol(request: DistributeSOLRequest, db: Session = Depends(get_db))
     """
     try:
         bulk_ops = get_bulk_operations()
-        result = bulk_ops.distribute_sol(
+        result = await bulk_ops.distribute_sol(
             from_wallet_id=request.from_wallet_id,
             to_group_id=request.to_group_id,
             amount_per_wallet=request.amount_per_wallet,
-            password=request.password
+            password=request.password,
+            use_lookup_table=request.use_lookup_table
         )
         return result
     except Exception as e:
@@ -165,7 +224,7 @@ def distribute_sol(request: DistributeSOLRequest, db: Session = Depends(get_db))
         close_db(db)
 
 @router.post("/collect-sol")
-def collect_sol(request: CollectSOLRequest, db: Session = Depends(get_db)):
+async def collect_sol(request: CollectSOLRequest, db: Session = Depends(get_db)):
     """
     Collect SOL from all wallets in group to one wallet
     
@@ -173,7 +232,7 @@ def collect_sol(request: CollectSOLRequest, db: Session = Depends(get_db)):
     """
     try:
         bulk_ops = get_bulk_operations()
-        result = bulk_ops.collect_sol(
+        result = await bulk_ops.collect_sol(
             from_group_id=request.from_group_id,
             to_wallet_id=request.to_wallet_id,
             password=request.password,
@@ -228,3 +287,24 @@ def bulk_sell(request: BulkSellRequest, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         close_db(db)
+
+@router.post("/panic-sell-all")
+async def panic_sell_all(request: PanicSellAllRequest):
+    """
+    Sell every token held by every group wallet
+    
+    Streams newline-delimited JSON progress: one "scan" event, one "wallet"
+    event per finished wallet and a final "done" summary
+    """
+    seller = PanicSeller()
+    
+    async def stream():
+        try:
+            async for event in seller.run(request.password, request.slippage, request.group_ids):
+                yield json.dumps(event) + "\n"
+        except Exception as e:
+            yield json.dumps({"event": "error", "error": str(e)}) + "\n"
+        finally:
+            await seller.jupiter.close()
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from typing import Optional
+import asyncio
 import sys
 import os
 
@@ -30,6 +31,7 @@ class SniperStartRequest(BaseModel):
     wallet_id: int
     password: str
     platforms: list = ["raydium", "pumpfun"]
+    sniper_id: Optional[str] = None
 
 class GroupSniperConfigRequest(BaseModel):
     group_id: int
@@ -44,6 +46,16 @@ class GroupSniperConfigRequest(BaseModel):
     password: str
     platforms: list = ["raydium", "pumpfun"]
 
+class GroupSniperStartRequest(BaseModel):
+    group_id: int
+    password: str
+    platforms: list = ["raydium", "pumpfun"]
+    sniper_id: Optional[str] = None
+
+class RugReportRequest(BaseModel):
+    token_address: str
+    creator: Optional[str] = None
+
 # Routes
 @router.post("/config")
 def save_sniper_config(request: SniperConfigRequest, db: Session = Depends(get_db)):
@@ -163,12 +175,19 @@ async def start_sniper(
             "min_safety_score": 70,
             "require_mint_renounced": config.require_mint_renounced,
             "require_freeze_renounced": config.require_freeze_renounced,
-            "max_buy_tax": config.max_buy_tax
+            "max_buy_tax": config.max_buy_tax,
+            "max_sell_tax": config.max_sell_tax
         }
         
         # Start sniper via manager
         manager = SniperManager.get_instance()
-        result = await manager.start(request.wallet_id, keypair, config_dict)
+        result = await manager.start(
+            request.wallet_id,
+            keypair,
+            config_dict,
+            sniper_id=request.sniper_id,
+            platforms=request.platforms
+        )
         
         # Update config status
         config.is_active = True
@@ -184,14 +203,22 @@ async def start_sniper(
         close_db(db)
 
 @router.post("/stop")
-async def stop_sniper(db: Session = Depends(get_db)):
-    """Stop sniper bot"""
+async def stop_sniper(sniper_id: Optional[str] = None, db: Session = Depends(get_db)):
+    """Stop one sniper instance, or all of them when no sniper_id is given"""
     try:
         manager = SniperManager.get_instance()
-        result = await manager.stop()
         
-        # Update all configs to inactive
-        db.query(SniperConfig).update({"is_active": False})
+        if sniper_id is None:
+            result = await manager.stop()
+            # Update all configs to inactive
+            db.query(SniperConfig).update({"is_active": False})
+        else:
+            wallet_id = manager.get_wallet_id(sniper_id)
+            result = await manager.stop(sniper_id)
+            if wallet_id is not None and not any(
+                manager.get_wallet_id(key) == wallet_id for key in manager.get_status()["snipers"]
+            ):
+                db.query(SniperConfig).filter(SniperConfig.wallet_id == wallet_id).update({"is_active": False})
         db.commit()
         
         return result
@@ -202,11 +229,45 @@ async def stop_sniper(db: Session = Depends(get_db)):
         close_db(db)
 
 @router.get("/status")
-def get_sniper_status():
-    """Get sniper bot status"""
+def get_sniper_status(sniper_id: Optional[str] = None):
+    """Get status of one sniper instance or of all instances"""
     try:
         manager = SniperManager.get_instance()
-        return manager.get_status()
+        return manager.get_status(sniper_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/metrics")
+def get_sniper_metrics():
+    """Per-stage latency histograms and send-vs-creation slots of every sniper"""
+    try:
+        return SniperManager.get_instance().get_metrics()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/creators/{address}")
+def get_creator(address: str):
+    """Tokens launched, rugs observed and first-seen time of a pool creator"""
+    try:
+        record = SniperManager.get_instance().bus.creators.get(address)
+        if record is None:
+            raise HTTPException(status_code=404, detail="Creator not indexed")
+        return record.as_dict()
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/creators/rug")
+def report_rug(request: RugReportRequest):
+    """Record a rugged token; its creator's later pools are rejected before any RPC"""
+    try:
+        record = SniperManager.get_instance().bus.creators.report_rug(request.token_address, request.creator)
+        if record is None:
+            raise HTTPException(status_code=404, detail="Token creator unknown, pass creator explicitly")
+        return {"success": True, "creator": record.as_dict()}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -294,3 +355,69 @@ async def setup_group_sniper(
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         close_db(db)
+
+@router.post("/group/start")
+async def start_group_sniper(request: GroupSniperStartRequest, db: Session = Depends(get_db)):
+    """
+    Start a group sniper using the configuration written by /group/setup
+    
+    Every wallet is unlocked once here, so a pool that passes analysis fires
+    buys from all wallets without further key derivation.
+    """
+    try:
+        wallets = db.query(Wallet).filter(Wallet.group_id == request.group_id).order_by(Wallet.wallet_index).all()
+        if not wallets:
+            raise HTTPException(status_code=404, detail="No wallets found in group")
+        
+        config = db.query(SniperConfig).filter(SniperConfig.wallet_id == wallets[0].id).first()
+        if not config:
+            raise HTTPException(status_code=404, detail="Group sniper config not found, run /sniper/group/setup first")
+        
+        # Key derivation is CPU bound; decrypt all wallets off the event loop
+        loop = asyncio.get_running_loop()
+        try:
+            private_keys = await asyncio.gather(*[
+                loop.run_in_executor(None, decrypt_private_key, wallet.encrypted_private_key, request.password)
+                for wallet in wallets
+            ])
+        except Exception:
+            raise HTTPException(status_code=401, detail="Invalid password")
+        
+        unlocked = [
+            (wallet.id, import_wallet(private_key, "private_key"))
+            for wallet, private_key in zip(wallets, private_keys)
+        ]
+        
+        config_dict = {
+            "buy_amount": config.buy_amount,
+            "slippage": config.slippage,
+            "min_liquidity": config.min_liquidity,
+            "min_safety_score": 70,
+            "require_mint_renounced": config.require_mint_renounced,
+            "require_freeze_renounced": config.require_freeze_renounced,
+            "max_buy_tax": config.max_buy_tax,
+            "max_sell_tax": config.max_sell_tax
+        }
+        
+        manager = SniperManager.get_instance()
+        result = await manager.start_group(
+            request.group_id,
+            unlocked,
+            config_dict,
+            sniper_id=request.sniper_id,
+            platforms=request.platforms
+        )
+        
+        db.query(SniperConfig).filter(
+            SniperConfig.wallet_id.in_([wallet.id for wallet in wallets])
+        ).update({"is_active": True}, synchronize_session=False)
+        db.commit()
+        
+        return result
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        close_db(db)
@@ -11,7 +11,8 @@ from core.database import get_db, close_db, Wallet, Trade
 from core.wallet import import_wallet
 from utils.encryption import decrypt_private_key
 from trading.executor import TradeExecutor
-from monitoring.token_analyzer import TokenAnalyzer
+from trading.sender import get_transaction_sender
+from monitoring.token_analyzer import get_token_analyzer
 
 router = APIRouter(prefix="/trade", tags=["trading"])
 
@@ -151,12 +152,19 @@ def get_trade_history(
 async def analyze_token(request: TokenAnalyzeRequest):
     """Analyze token safety"""
     try:
-        analyzer = TokenAnalyzer()
-        result = analyzer.analyze_token(request.token_address)
+        result = await get_token_analyzer().analyze_token(request.token_address)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/analyze/stats")
+def get_analysis_stats():
+    """Analysis cache hit rates and mint batching"""
+    try:
+        return get_token_analyzer().get_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/stats")
 def get_trading_stats(wallet_id: Optional[int] = None, db: Session = Depends(get_db)):
     """Get trading statistics"""
@@ -192,3 +200,11 @@ def get_trading_stats(wallet_id: Optional[int] = None, db: Session = Depends(get
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         close_db(db)
+
+@router.get("/landing-stats")
+def get_landing_stats():
+    """Landing rate of tracked transactions per operation type"""
+    try:
+        return get_transaction_sender().get_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
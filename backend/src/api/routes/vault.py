@@ -0,0 +1,127 @@
+from fastapi import APIRouter, HTTPException, Depends
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from typing import Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import get_db, close_db
+from core.nonce_vault import get_nonce_vault
+
+router = APIRouter(prefix="/vault", tags=["vault"])
+
+# Pydantic models
+class CreateNonceAccountsRequest(BaseModel):
+    group_id: int
+    password: str
+    per_wallet: int = 1
+
+class PresignCollectRequest(BaseModel):
+    group_id: int
+    to_wallet_id: int
+    password: str
+    leave_amount: float = 0.001
+
+class PresignSellRequest(BaseModel):
+    group_id: int
+    token_address: str
+    password: str
+    slippage: float = 15.0
+
+class UnlockVaultRequest(BaseModel):
+    group_id: int
+    password: str
+
+class FireVaultRequest(BaseModel):
+    group_id: int
+    password: Optional[str] = None
+    kind: Optional[str] = None  # sell, collect or None for both
+
+# Routes
+@router.post("/nonce/create")
+def create_nonce_accounts(request: CreateNonceAccountsRequest, db: Session = Depends(get_db)):
+    """
+    Create durable nonce accounts for every wallet in a group
+    
+    Each pre-signed transaction holds one nonce account until broadcast
+    """
+    try:
+        vault = get_nonce_vault()
+        return vault.create_nonce_accounts(request.group_id, request.password, request.per_wallet)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        close_db(db)
+
+@router.post("/presign/collect")
+def presign_collect(request: PresignCollectRequest, db: Session = Depends(get_db)):
+    """Pre-sign a SOL sweep from every group wallet to one wallet"""
+    try:
+        vault = get_nonce_vault()
+        return vault.presign_collect(
+            group_id=request.group_id,
+            to_wallet_id=request.to_wallet_id,
+            password=request.password,
+            leave_amount=request.leave_amount
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        close_db(db)
+
+@router.post("/presign/sell")
+async def presign_sell(request: PresignSellRequest, db: Session = Depends(get_db)):
+    """Pre-sign a full-balance sell of one token from every group wallet"""
+    try:
+        vault = get_nonce_vault()
+        return await vault.presign_sell(
+            group_id=request.group_id,
+            token_address=request.token_address,
+            password=request.password,
+            slippage=request.slippage
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        close_db(db)
+
+@router.post("/unlock")
+def unlock_vault(request: UnlockVaultRequest):
+    """Hold the group's vault keys in memory so firing needs no password"""
+    try:
+        vault = get_nonce_vault()
+        return vault.unlock(request.group_id, request.password)
+    except ValueError:
+        raise HTTPException(status_code=401, detail="Invalid password")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/lock/{group_id}")
+def lock_vault(group_id: int):
+    """Forget the group's vault keys"""
+    return get_nonce_vault().lock(group_id)
+
+@router.post("/fire")
+async def fire_vault(request: FireVaultRequest):
+    """
+    Broadcast every pre-signed exit transaction of a group at once
+    
+    No quote, signing or key derivation happens here when the vault is unlocked
+    """
+    try:
+        vault = get_nonce_vault()
+        return await vault.fire(request.group_id, request.password, request.kind)
+    except ValueError as e:
+        raise HTTPException(status_code=401, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/{group_id}")
+def list_presigned(group_id: int):
+    """List pre-signed transactions for a group"""
+    try:
+        return get_nonce_vault().list_presigned(group_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
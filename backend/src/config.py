@@ -7,6 +7,16 @@ load_dotenv()
 RPC_ENDPOINT = os.getenv("RPC_ENDPOINT", "https://api.devnet.solana.com")
 WS_ENDPOINT = os.getenv("WS_ENDPOINT", "wss://api.devnet.solana.com")
 
+# Requests per second allowed against RPC_ENDPOINT (shared by all async callers)
+RPC_RATE_LIMIT = float(os.getenv("RPC_RATE_LIMIT", "50"))
+
+# Commitment pool monitors subscribe at: "confirmed", or "processed" for
+# fast mode (events are acted on immediately and reconciled afterwards)
+POOL_COMMITMENT = os.getenv("POOL_COMMITMENT", "confirmed")
+
+# Append raw WebSocket messages to this file for replay (empty disables)
+WS_RECORD_PATH = os.getenv("WS_RECORD_PATH", "")
+
 # Database
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./sniper.db")
 
@@ -14,7 +24,7 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./sniper.db")
 ENCRYPTION_KEY = os.getenv("ENCRYPTION_KEY", "default-key-please-change-in-production-min-32-chars")
 
 # Jupiter API
-JUPITER_API_URL = "https://quote-api.jup.ag/v6"
+JUPITER_API_URL = os.getenv("JUPITER_API_URL", "https://quote-api.jup.ag/v6")
 
 # API Configuration
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
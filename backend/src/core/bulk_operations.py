@@ -9,13 +9,18 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
-from solders.transaction import Transaction
+from solders.hash import Hash
+from solders.message import MessageV0
+from solders.transaction import Transaction, VersionedTransaction
 from solders.system_program import TransferParams, transfer
 from solana.rpc.api import Client
 from solana.rpc.commitment import Confirmed
 from core.database import get_db, close_db, Wallet
 from utils.encryption import decrypt_private_key
 from core.wallet import import_wallet
+from core.lookup_tables import compile_packed_transactions, get_lookup_table_cache
+from core.rpc import AsyncRpc, get_async_rpc
+from trading.sender import TransactionSender, get_transaction_sender
 from config import RPC_ENDPOINT
 import asyncio
 from typing import List
@@ -23,18 +28,58 @@ from typing import List
 class BulkOperations:
     """Handle bulk operations for wallet groups"""
     
-    def __init__(self):
+    def __init__(self, rpc: AsyncRpc = None, sender: TransactionSender = None):
         self.client = Client(RPC_ENDPOINT)
+        self.rpc = rpc or get_async_rpc()
+        self.sender = sender or get_transaction_sender()
     
-    def distribute_sol(self, from_wallet_id: int, to_group_id: int, amount_per_wallet: float, password: str):
+    async def _latest_blockhash(self) -> tuple:
+        """Recent blockhash and the block height it stays valid until"""
+        result = await self.rpc.call("getLatestBlockhash", [{"commitment": "confirmed"}])
+        return Hash.from_string(result["value"]["blockhash"]), result["value"]["lastValidBlockHeight"]
+    
+    async def _signed_transfer(self, signer: Keypair, instructions: list) -> tuple:
+        """Sign a legacy transfer transaction with a fresh blockhash"""
+        recent_blockhash, last_valid_block_height = await self._latest_blockhash()
+        tx = Transaction.new_signed_with_payer(instructions, signer.pubkey(), [signer], recent_blockhash)
+        return bytes(tx), last_valid_block_height
+    
+    async def _send_transfer(self, signer: Keypair, instructions: list) -> dict:
+        """
+        Send a transfer through the tracking sender and wait for the outcome
+        
+        A plain SOL transfer whose blockhash expired can no longer land, so
+        re-signing it with a fresh blockhash cannot double-send.
+        """
+        raw, last_valid_block_height = await self._signed_transfer(signer, instructions)
+        return await self.sender.send(
+            raw,
+            "transfer",
+            last_valid_block_height,
+            resign=lambda: self._signed_transfer(signer, instructions)
+        )
+    
+    async def distribute_sol(
+        self,
+        from_wallet_id: int,
+        to_group_id: int,
+        amount_per_wallet: float,
+        password: str,
+        use_lookup_table: bool = False
+    ):
         """
         Distribute SOL from one wallet to all wallets in a group
         
+        Every transfer is tracked by the transaction sender and rebroadcast
+        until it lands; "success" means the transfer confirmed.
+        
         Args:
             from_wallet_id: Source wallet ID
             to_group_id: Target group ID
             amount_per_wallet: SOL amount to send to each wallet
             password: Password to decrypt source wallet
+            use_lookup_table: Pack transfers into v0 transactions that resolve
+                group wallets through the group's cached lookup tables
             
         Returns:
             dict with results
@@ -56,55 +101,39 @@ class BulkOperations:
             if not target_wallets:
                 raise Exception("No wallets found in group")
             
-            # Send to each wallet
-            results = []
-            for wallet in target_wallets:
+            if use_lookup_table:
+                return await self._distribute_sol_packed(source_keypair, to_group_id, target_wallets, amount_per_wallet)
+            
+            lamports = int(amount_per_wallet * 1e9)
+            
+            async def send(wallet):
                 try:
-                    # Create transfer instruction
-                    lamports = int(amount_per_wallet * 1e9)
-                    
-                    transfer_params = TransferParams(
+                    transfer_ix = transfer(TransferParams(
                         from_pubkey=source_keypair.pubkey(),
                         to_pubkey=Pubkey.from_string(wallet.public_key),
                         lamports=lamports
-                    )
-                    
-                    transfer_ix = transfer(transfer_params)
-                    
-                    # Get recent blockhash
-                    blockhash_resp = self.client.get_latest_blockhash()
-                    recent_blockhash = blockhash_resp.value.blockhash
-                    
-                    # Create and sign transaction
-                    tx = Transaction.new_signed_with_payer(
-                        [transfer_ix],
-                        source_keypair.pubkey(),
-                        [source_keypair],
-                        recent_blockhash
-                    )
-                    
-                    # Send transaction
-                    result = self.client.send_transaction(tx)
-                    signature = str(result.value)
-                    
-                    results.append({
-                        "wallet_id": wallet.id,
-                        "wallet_index": wallet.wallet_index,
-                        "address": wallet.public_key,
-                        "amount": amount_per_wallet,
-                        "signature": signature,
-                        "success": True
-                    })
-                    
+                    ))
+                    outcome = await self._send_transfer(source_keypair, [transfer_ix])
+                    result = {
+                        "signature": outcome["signature"],
+                        "resigns": outcome["resigns"],
+                        "success": outcome["landed"]
+                    }
+                    if not outcome["landed"]:
+                        result["error"] = outcome["error"] or outcome["state"]
                 except Exception as e:
-                    results.append({
-                        "wallet_id": wallet.id,
-                        "wallet_index": wallet.wallet_index,
-                        "address": wallet.public_key,
-                        "amount": amount_per_wallet,
-                        "error": str(e),
-                        "success": False
-                    })
+                    result = {"error": str(e), "success": False}
+                
+                return {
+                    "wallet_id": wallet.id,
+                    "wallet_index": wallet.wallet_index,
+                    "address": wallet.public_key,
+                    "amount": amount_per_wallet,
+                    **result
+                }
+            
+            # Send to every wallet at once; the sender tracks them together
+            results = await asyncio.gather(*[send(wallet) for wallet in target_wallets])
             
             # Calculate summary
             successful = sum(1 for r in results if r["success"])
@@ -122,10 +151,87 @@ class BulkOperations:
         finally:
             close_db(db)
     
-    def collect_sol(self, from_group_id: int, to_wallet_id: int, password: str, leave_amount: float = 0.001):
+    async def _distribute_sol_packed(self, source_keypair: Keypair, group_id: int, target_wallets: List[Wallet], amount_per_wallet: float):
+        """
+        Send all distribution transfers packed into v0 transactions
+        
+        Group wallet addresses are resolved from the locally cached lookup
+        tables, so no lookup RPC is needed and one blockhash serves every
+        transaction. Without registered tables the transfers are still packed,
+        just fewer per transaction.
+        """
+        lamports = int(amount_per_wallet * 1e9)
+        instructions = [
+            transfer(TransferParams(
+                from_pubkey=source_keypair.pubkey(),
+                to_pubkey=Pubkey.from_string(wallet.public_key),
+                lamports=lamports
+            ))
+            for wallet in target_wallets
+        ]
+        
+        lookup_tables = get_lookup_table_cache().for_group(group_id)
+        recent_blockhash, last_valid_block_height = await self._latest_blockhash()
+        packed = compile_packed_transactions(source_keypair, instructions, lookup_tables, recent_blockhash)
+        
+        def resigner(ixs):
+            async def resign():
+                fresh_blockhash, fresh_height = await self._latest_blockhash()
+                message = MessageV0.try_compile(source_keypair.pubkey(), ixs, lookup_tables, fresh_blockhash)
+                return bytes(VersionedTransaction(message, [source_keypair])), fresh_height
+            return resign
+        
+        async def send(tx, ixs):
+            try:
+                outcome = await self.sender.send(bytes(tx), "transfer", last_valid_block_height, resign=resigner(ixs))
+                result = {"signature": outcome["signature"], "success": outcome["landed"]}
+                if not outcome["landed"]:
+                    result["error"] = outcome["error"] or outcome["state"]
+                return result
+            except Exception as e:
+                return {"error": str(e), "success": False}
+        
+        sends = []
+        offset = 0
+        for tx, count in packed:
+            sends.append(send(tx, instructions[offset:offset + count]))
+            offset += count
+        outcomes = await asyncio.gather(*sends)
+        
+        results = []
+        offset = 0
+        for (tx, count), outcome in zip(packed, outcomes):
+            batch = target_wallets[offset:offset + count]
+            offset += count
+            
+            for wallet in batch:
+                results.append({
+                    "wallet_id": wallet.id,
+                    "wallet_index": wallet.wallet_index,
+                    "address": wallet.public_key,
+                    "amount": amount_per_wallet,
+                    **outcome
+                })
+        
+        successful = sum(1 for r in results if r["success"])
+        
+        return {
+            "total_wallets": len(results),
+            "successful": successful,
+            "failed": len(results) - successful,
+            "total_sol_sent": successful * amount_per_wallet,
+            "transactions": len(packed),
+            "lookup_tables": [str(t.key) for t in lookup_tables],
+            "results": results
+        }
+    
+    async def collect_sol(self, from_group_id: int, to_wallet_id: int, password: str, leave_amount: float = 0.001):
         """
         Collect SOL from all wallets in group to one wallet
         
+        Balances are read with batched getMultipleAccounts and every transfer
+        is tracked until it lands.
+        
         Args:
             from_group_id: Source group ID
             to_wallet_id: Target wallet ID
@@ -147,80 +253,70 @@ class BulkOperations:
             # Get source wallets
             source_wallets = db.query(Wallet).filter(Wallet.group_id == from_group_id).all()
             
-            results = []
-            total_collected = 0.0
+            # Get balances
+            accounts = await self.rpc.get_multiple_accounts(
+                [wallet.public_key for wallet in source_wallets],
+                data_slice={"offset": 0, "length": 0}
+            )
+            loop = asyncio.get_running_loop()
             
-            for wallet in source_wallets:
+            async def collect(wallet, account):
+                balance_sol = (account["lamports"] if account else 0) / 1e9
                 try:
-                    # Get balance
-                    balance_resp = self.client.get_balance(wallet.public_key)
-                    balance_lamports = balance_resp.value
-                    balance_sol = balance_lamports / 1e9
-                    
                     # Calculate amount to send (leave some for rent)
                     send_amount = balance_sol - leave_amount
                     
                     if send_amount <= 0:
-                        results.append({
+                        return {
                             "wallet_id": wallet.id,
                             "wallet_index": wallet.wallet_index,
                             "balance": balance_sol,
                             "collected": 0,
                             "success": False,
                             "message": "Insufficient balance"
-                        })
-                        continue
+                        }
                     
-                    # Decrypt and import keypair
-                    private_key = decrypt_private_key(wallet.encrypted_private_key, password)
+                    # Decrypt and import keypair (key derivation off the event loop)
+                    private_key = await loop.run_in_executor(
+                        None, decrypt_private_key, wallet.encrypted_private_key, password
+                    )
                     source_keypair = import_wallet(private_key, "private_key")
                     
                     # Create transfer
-                    lamports = int(send_amount * 1e9)
-                    
-                    transfer_params = TransferParams(
+                    transfer_ix = transfer(TransferParams(
                         from_pubkey=source_keypair.pubkey(),
                         to_pubkey=target_pubkey,
-                        lamports=lamports
-                    )
-                    
-                    transfer_ix = transfer(transfer_params)
-                    
-                    # Get blockhash
-                    blockhash_resp = self.client.get_latest_blockhash()
-                    recent_blockhash = blockhash_resp.value.blockhash
-                    
-                    # Create and send tx
-                    tx = Transaction.new_signed_with_payer(
-                        [transfer_ix],
-                        source_keypair.pubkey(),
-                        [source_keypair],
-                        recent_blockhash
-                    )
+                        lamports=int(send_amount * 1e9)
+                    ))
                     
-                    result = self.client.send_transaction(tx)
-                    signature = str(result.value)
-                    
-                    total_collected += send_amount
-                    
-                    results.append({
+                    outcome = await self._send_transfer(source_keypair, [transfer_ix])
+                    result = {
                         "wallet_id": wallet.id,
                         "wallet_index": wallet.wallet_index,
                         "balance": balance_sol,
-                        "collected": send_amount,
-                        "signature": signature,
-                        "success": True
-                    })
+                        "collected": send_amount if outcome["landed"] else 0,
+                        "signature": outcome["signature"],
+                        "resigns": outcome["resigns"],
+                        "success": outcome["landed"]
+                    }
+                    if not outcome["landed"]:
+                        result["error"] = outcome["error"] or outcome["state"]
+                    return result
                     
                 except Exception as e:
-                    results.append({
+                    return {
                         "wallet_id": wallet.id,
                         "wallet_index": wallet.wallet_index,
                         "error": str(e),
                         "success": False
-                    })
+                    }
+            
+            results = await asyncio.gather(*[
+                collect(wallet, account) for wallet, account in zip(source_wallets, accounts)
+            ])
             
             successful = sum(1 for r in results if r["success"])
+            total_collected = sum(r.get("collected", 0) for r in results)
             
             return {
                 "total_wallets": len(results),
@@ -60,6 +60,59 @@ class SniperConfig(Base):
     is_active = Column(Boolean, default=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+class AddressLookupTable(Base):
+    __tablename__ = "address_lookup_tables"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    group_id = Column(Integer, ForeignKey("wallet_groups.id"), nullable=False, index=True)
+    table_address = Column(String, unique=True, nullable=False)
+    authority = Column(String, nullable=False)  # Wallet public key that owns the table
+    addresses = Column(Text, nullable=False, default="[]")  # JSON list of stored addresses
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class NonceAccount(Base):
+    __tablename__ = "nonce_accounts"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    wallet_id = Column(Integer, ForeignKey("wallets.id"), nullable=False, index=True)
+    nonce_address = Column(String, unique=True, nullable=False)  # Authority is the wallet itself
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class PresignedTransaction(Base):
+    __tablename__ = "presigned_transactions"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    wallet_id = Column(Integer, ForeignKey("wallets.id"), nullable=False, index=True)
+    group_id = Column(Integer, ForeignKey("wallet_groups.id"), nullable=True, index=True)
+    nonce_account_id = Column(Integer, ForeignKey("nonce_accounts.id"), nullable=False)
+    kind = Column(String, nullable=False)  # sell or collect
+    token_address = Column(String)  # Token sold (sell only)
+    encrypted_transaction = Column(Text, nullable=False)
+    is_used = Column(Boolean, default=False)
+    signature = Column(String)  # Set once broadcast
+    created_at = Column(DateTime, default=datetime.utcnow)
+    used_at = Column(DateTime)
+
+class Creator(Base):
+    __tablename__ = "creators"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    address = Column(String, unique=True, nullable=False, index=True)  # Pool/token creator wallet
+    tokens_launched = Column(Integer, default=0)
+    rugs_observed = Column(Integer, default=0)
+    first_seen = Column(DateTime, default=datetime.utcnow)
+    last_seen = Column(DateTime, default=datetime.utcnow)
+
+class CreatorToken(Base):
+    __tablename__ = "creator_tokens"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    token_address = Column(String, unique=True, nullable=False, index=True)
+    creator = Column(String, nullable=False, index=True)
+    rugged = Column(Boolean, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
 # Database path
 DB_PATH = "sniper.db"
 
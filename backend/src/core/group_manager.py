@@ -8,7 +8,8 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.wallet import generate_wallet, keypair_to_base58
-from core.database import get_db, close_db, Wallet, WalletGroup
+from core.database import get_db, close_db, Wallet, WalletGroup, AddressLookupTable
+from core.lookup_tables import get_lookup_table_cache
 from utils.encryption import encrypt_private_key
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
@@ -171,10 +172,14 @@ class WalletGroupManager:
             # Delete wallets
             db.query(Wallet).filter(Wallet.group_id == group_id).delete()
             
+            # Forget lookup tables (on-chain tables stay with their authority)
+            db.query(AddressLookupTable).filter(AddressLookupTable.group_id == group_id).delete()
+            
             # Delete group
             db.query(WalletGroup).filter(WalletGroup.id == group_id).delete()
             
             db.commit()
+            get_lookup_table_cache().drop_group(group_id)
             return {"success": True, "message": "Group deleted"}
         except Exception as e:
             db.rollback()
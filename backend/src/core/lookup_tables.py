@@ -0,0 +1,249 @@
+"""
+Address Lookup Tables
+Register group wallets into per-group lookup tables, cache their contents
+locally and pack many instructions into v0 transactions
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.message import MessageV0
+from solders.signature import Signature
+from solders.transaction import VersionedTransaction
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.system_program import (
+    CreateLookupTableParams,
+    ExtendLookupTableParams,
+    create_lookup_table,
+    extend_lookup_table,
+)
+from solana.rpc.api import Client
+from solana.rpc.commitment import Confirmed
+from core.database import get_db, close_db, Wallet, AddressLookupTable
+from config import RPC_ENDPOINT
+from typing import Dict, List, Sequence
+import json
+
+# Maximum serialized transaction size accepted by the cluster
+PACKET_DATA_SIZE = 1232
+
+# A lookup table holds at most 256 addresses
+MAX_TABLE_ADDRESSES = 256
+
+# Addresses per extend instruction that keep the extend transaction under the size limit
+EXTEND_CHUNK_SIZE = 20
+
+def compile_packed_transactions(
+    payer: Keypair,
+    instructions: Sequence[Instruction],
+    lookup_tables: Sequence[AddressLookupTableAccount],
+    recent_blockhash: Hash,
+    max_size: int = PACKET_DATA_SIZE
+) -> List[tuple]:
+    """
+    Greedily pack instructions into as few signed v0 transactions as possible
+
+    Args:
+        payer: Fee payer and only signer
+        instructions: Instructions to pack, kept in order
+        lookup_tables: Tables the compiler may resolve accounts from
+        recent_blockhash: Blockhash shared by every transaction
+        max_size: Serialized size limit per transaction
+
+    Returns:
+        List of (VersionedTransaction, instruction_count) tuples
+    """
+    packed = []
+    chunk: List[Instruction] = []
+
+    def serialized_size(ixs) -> int:
+        message = MessageV0.try_compile(payer.pubkey(), ixs, lookup_tables, recent_blockhash)
+        return len(bytes(VersionedTransaction.populate(message, [Signature.default()])))
+
+    def seal(ixs):
+        message = MessageV0.try_compile(payer.pubkey(), ixs, lookup_tables, recent_blockhash)
+        packed.append((VersionedTransaction(message, [payer]), len(ixs)))
+
+    for ix in instructions:
+        chunk.append(ix)
+        if serialized_size(chunk) > max_size:
+            chunk.pop()
+            if not chunk:
+                raise ValueError("Instruction does not fit in a single transaction")
+            seal(chunk)
+            chunk = [ix]
+
+    if chunk:
+        seal(chunk)
+
+    return packed
+
+class LookupTableCache:
+    """In-memory copy of every registered lookup table, loaded from the database"""
+
+    def __init__(self):
+        self._tables: Dict[int, List[AddressLookupTableAccount]] = {}
+        self._loaded = False
+
+    def load(self):
+        """Load all tables from the database (no RPC)"""
+        db = get_db()
+        try:
+            tables: Dict[int, List[AddressLookupTableAccount]] = {}
+            for row in db.query(AddressLookupTable).order_by(AddressLookupTable.id).all():
+                tables.setdefault(row.group_id, []).append(self._to_account(row))
+            self._tables = tables
+            self._loaded = True
+        finally:
+            close_db(db)
+
+    def for_group(self, group_id: int) -> List[AddressLookupTableAccount]:
+        """Lookup tables registered for a group"""
+        if not self._loaded:
+            self.load()
+        return list(self._tables.get(group_id, []))
+
+    def put(self, row: AddressLookupTable):
+        """Insert or replace one table after it was created or extended"""
+        if not self._loaded:
+            self.load()
+        account = self._to_account(row)
+        tables = [t for t in self._tables.get(row.group_id, []) if t.key != account.key]
+        tables.append(account)
+        self._tables[row.group_id] = tables
+
+    def drop_group(self, group_id: int):
+        self._tables.pop(group_id, None)
+
+    @staticmethod
+    def _to_account(row: AddressLookupTable) -> AddressLookupTableAccount:
+        return AddressLookupTableAccount(
+            key=Pubkey.from_string(row.table_address),
+            addresses=[Pubkey.from_string(a) for a in json.loads(row.addresses)]
+        )
+
+class LookupTableManager:
+    """Create and extend per-group lookup tables on chain"""
+
+    def __init__(self, cache: LookupTableCache = None):
+        self.client = Client(RPC_ENDPOINT)
+        self.cache = cache or get_lookup_table_cache()
+
+    def register_group(self, group_id: int, authority: Keypair) -> dict:
+        """
+        Register every wallet of a group into the group's lookup tables
+
+        Addresses already stored are skipped, so calling this again after
+        adding wallets only extends the tables. New tables are created when
+        the current one is full.
+
+        Args:
+            group_id: Wallet group ID
+            authority: Keypair that pays for and owns the tables
+
+        Returns:
+            dict with table addresses and counts
+        """
+        db = get_db()
+        try:
+            wallets = db.query(Wallet).filter(Wallet.group_id == group_id).order_by(Wallet.wallet_index).all()
+            if not wallets:
+                raise Exception("No wallets found in group")
+
+            rows = db.query(AddressLookupTable).filter(
+                AddressLookupTable.group_id == group_id
+            ).order_by(AddressLookupTable.id).all()
+
+            stored = set()
+            for row in rows:
+                stored.update(json.loads(row.addresses))
+            pending = [w.public_key for w in wallets if w.public_key not in stored]
+
+            signatures = []
+            while pending:
+                row = rows[-1] if rows and len(json.loads(rows[-1].addresses)) < MAX_TABLE_ADDRESSES else None
+                if row is None:
+                    row, signature = self._create_table(group_id, authority)
+                    db.add(row)
+                    rows.append(row)
+                    signatures.append(signature)
+
+                current = json.loads(row.addresses)
+                room = MAX_TABLE_ADDRESSES - len(current)
+                batch, pending = pending[:room], pending[room:]
+
+                for i in range(0, len(batch), EXTEND_CHUNK_SIZE):
+                    chunk = batch[i:i + EXTEND_CHUNK_SIZE]
+                    signatures.append(self._extend_table(row.table_address, authority, chunk))
+                    current.extend(chunk)
+                    row.addresses = json.dumps(current)
+                    db.commit()
+
+            db.commit()
+            for row in rows:
+                db.refresh(row)
+                self.cache.put(row)
+
+            return {
+                "group_id": group_id,
+                "tables": [
+                    {"address": row.table_address, "address_count": len(json.loads(row.addresses))}
+                    for row in rows
+                ],
+                "signatures": signatures
+            }
+        except Exception as e:
+            db.rollback()
+            raise e
+        finally:
+            close_db(db)
+
+    def _create_table(self, group_id: int, authority: Keypair) -> tuple:
+        recent_slot = self.client.get_slot(commitment=Confirmed).value
+        ix, table_address = create_lookup_table(CreateLookupTableParams(
+            authority_address=authority.pubkey(),
+            payer_address=authority.pubkey(),
+            recent_slot=recent_slot
+        ))
+        signature = self._send(authority, [ix])
+
+        row = AddressLookupTable(
+            group_id=group_id,
+            table_address=str(table_address),
+            authority=str(authority.pubkey()),
+            addresses="[]"
+        )
+        return row, signature
+
+    def _extend_table(self, table_address: str, authority: Keypair, addresses: List[str]) -> str:
+        ix = extend_lookup_table(ExtendLookupTableParams(
+            payer_address=authority.pubkey(),
+            lookup_table_address=Pubkey.from_string(table_address),
+            authority_address=authority.pubkey(),
+            new_addresses=[Pubkey.from_string(a) for a in addresses]
+        ))
+        return self._send(authority, [ix])
+
+    def _send(self, signer: Keypair, instructions: List[Instruction]) -> str:
+        blockhash = self.client.get_latest_blockhash().value.blockhash
+        message = MessageV0.try_compile(signer.pubkey(), instructions, [], blockhash)
+        tx = VersionedTransaction(message, [signer])
+        result = self.client.send_transaction(tx)
+        # Extensions must land before the next extend or use of the table
+        self.client.confirm_transaction(result.value, commitment=Confirmed)
+        return str(result.value)
+
+
+# Singleton
+_lookup_table_cache = None
+
+def get_lookup_table_cache():
+    global _lookup_table_cache
+    if _lookup_table_cache is None:
+        _lookup_table_cache = LookupTableCache()
+    return _lookup_table_cache
@@ -0,0 +1,471 @@
+"""
+Nonce Vault
+Durable nonce accounts per wallet and a vault of pre-signed exit
+transactions (sell / collect) that can be broadcast with one call
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.message import MessageV0
+from solders.transaction import Transaction, VersionedTransaction
+from solders.address_lookup_table_account import AddressLookupTable, AddressLookupTableAccount
+from solders.system_program import (
+    AdvanceNonceAccountParams,
+    TransferParams,
+    advance_nonce_account,
+    create_nonce_account,
+    transfer,
+)
+from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.types import TokenAccountOpts, TxOpts
+from core.database import get_db, close_db, Wallet, NonceAccount, PresignedTransaction
+from core.wallet import import_wallet
+from trading.jupiter import JupiterClient, SOL_MINT
+from utils.encryption import decrypt_private_key, derive_key, encrypt_bytes, decrypt_bytes
+from config import RPC_ENDPOINT
+from datetime import datetime
+from typing import Dict, List, Optional
+import asyncio
+import struct
+import time
+
+# Size of a nonce account (version, state, authority, blockhash, fee calculator)
+NONCE_ACCOUNT_LENGTH = 80
+
+# Fee for a single-signature transaction, kept aside when sweeping a wallet
+SIGNATURE_FEE_LAMPORTS = 5000
+
+def parse_nonce_value(data: bytes) -> Hash:
+    """
+    Read the stored durable nonce from raw nonce account data
+
+    Layout: version u32, state u32, authority [32], blockhash [32], fee u64
+    """
+    _version, state = struct.unpack_from("<II", data, 0)
+    if state != 1:
+        raise ValueError("Nonce account is not initialized")
+    return Hash.from_bytes(bytes(data[40:72]))
+
+def build_nonce_transaction(
+    signer: Keypair,
+    nonce_address: Pubkey,
+    nonce_value: Hash,
+    instructions: List[Instruction],
+    lookup_tables: List[AddressLookupTableAccount] = None
+) -> VersionedTransaction:
+    """Sign a v0 transaction that uses a durable nonce instead of a recent blockhash"""
+    advance = advance_nonce_account(AdvanceNonceAccountParams(
+        nonce_pubkey=nonce_address,
+        authorized_pubkey=signer.pubkey()
+    ))
+    # The advance instruction must come first for the runtime to accept the nonce
+    message = MessageV0.try_compile(signer.pubkey(), [advance, *instructions], lookup_tables or [], nonce_value)
+    return VersionedTransaction(message, [signer])
+
+class NonceVault:
+    """Manage nonce accounts and pre-signed exit transactions for wallet groups"""
+
+    def __init__(self):
+        self.client = Client(RPC_ENDPOINT)
+        self.jupiter = JupiterClient()
+        # group_id -> {salt: derived key}; filled by unlock()
+        self._keys: Dict[int, Dict[bytes, bytes]] = {}
+
+    def create_nonce_accounts(self, group_id: int, password: str, per_wallet: int = 1):
+        """
+        Create durable nonce accounts for every wallet in a group
+
+        Each wallet pays rent for and is the authority of its own nonce
+        accounts. A pre-signed transaction holds one nonce account until it is
+        broadcast, so create one per exit transaction you plan to keep ready.
+
+        Args:
+            group_id: Wallet group ID
+            password: Password to decrypt wallets
+            per_wallet: Nonce accounts each wallet should have
+
+        Returns:
+            dict with results
+        """
+        db = get_db()
+        try:
+            wallets = db.query(Wallet).filter(Wallet.group_id == group_id).all()
+            if not wallets:
+                raise Exception("No wallets found in group")
+
+            rent = self.client.get_minimum_balance_for_rent_exemption(NONCE_ACCOUNT_LENGTH).value
+            recent_blockhash = self.client.get_latest_blockhash().value.blockhash
+
+            results = []
+            for wallet in wallets:
+                existing = db.query(NonceAccount).filter(NonceAccount.wallet_id == wallet.id).count()
+                missing = max(per_wallet - existing, 0)
+                if not missing:
+                    results.append({"wallet_id": wallet.id, "created": 0, "success": True})
+                    continue
+
+                try:
+                    private_key = decrypt_private_key(wallet.encrypted_private_key, password)
+                    keypair = import_wallet(private_key, "private_key")
+
+                    signatures = []
+                    for _ in range(missing):
+                        nonce_keypair = Keypair()
+                        ixs = create_nonce_account(keypair.pubkey(), nonce_keypair.pubkey(), keypair.pubkey(), rent)
+                        tx = Transaction.new_signed_with_payer(
+                            list(ixs),
+                            keypair.pubkey(),
+                            [keypair, nonce_keypair],
+                            recent_blockhash
+                        )
+                        result = self.client.send_transaction(tx)
+                        signatures.append(str(result.value))
+
+                        db.add(NonceAccount(wallet_id=wallet.id, nonce_address=str(nonce_keypair.pubkey())))
+                        db.commit()
+
+                    results.append({
+                        "wallet_id": wallet.id,
+                        "created": missing,
+                        "signatures": signatures,
+                        "success": True
+                    })
+                except Exception as e:
+                    db.rollback()
+                    results.append({"wallet_id": wallet.id, "error": str(e), "success": False})
+
+            successful = sum(1 for r in results if r["success"])
+            return {
+                "group_id": group_id,
+                "total_wallets": len(results),
+                "successful": successful,
+                "failed": len(results) - successful,
+                "rent_lamports": rent,
+                "results": results
+            }
+        finally:
+            close_db(db)
+
+    def get_nonce_values(self, addresses: List[str]) -> Dict[str, Hash]:
+        """Fetch current nonce values in batches via getMultipleAccounts"""
+        values = {}
+        for i in range(0, len(addresses), 100):
+            chunk = addresses[i:i + 100]
+            response = self.client.get_multiple_accounts([Pubkey.from_string(a) for a in chunk])
+            for address, account in zip(chunk, response.value):
+                if account is not None:
+                    values[address] = parse_nonce_value(account.data)
+        return values
+
+    def _free_nonce_accounts(self, db, wallet_ids: List[int]) -> Dict[int, List[NonceAccount]]:
+        """Nonce accounts per wallet that are not held by an unused pre-signed transaction"""
+        held = {
+            row.nonce_account_id
+            for row in db.query(PresignedTransaction).filter(PresignedTransaction.is_used == False).all()
+        }
+        free: Dict[int, List[NonceAccount]] = {}
+        for account in db.query(NonceAccount).filter(NonceAccount.wallet_id.in_(wallet_ids)).all():
+            if account.id not in held:
+                free.setdefault(account.wallet_id, []).append(account)
+        return free
+
+    def _lamports(self, addresses: List[str]) -> Dict[str, int]:
+        """Batch SOL balances via getMultipleAccounts"""
+        balances = {}
+        for i in range(0, len(addresses), 100):
+            chunk = addresses[i:i + 100]
+            response = self.client.get_multiple_accounts([Pubkey.from_string(a) for a in chunk])
+            for address, account in zip(chunk, response.value):
+                balances[address] = account.lamports if account is not None else 0
+        return balances
+
+    def _lookup_tables(self, addresses: List[str]) -> List[AddressLookupTableAccount]:
+        """Resolve lookup table contents once, at signing time"""
+        if not addresses:
+            return []
+        response = self.client.get_multiple_accounts([Pubkey.from_string(a) for a in addresses])
+        return [
+            AddressLookupTableAccount(
+                key=Pubkey.from_string(address),
+                addresses=list(AddressLookupTable.deserialize(account.data).addresses)
+            )
+            for address, account in zip(addresses, response.value)
+            if account is not None
+        ]
+
+    def _token_amount(self, owner: Pubkey, mint: Pubkey) -> int:
+        response = self.client.get_token_accounts_by_owner_json_parsed(owner, TokenAccountOpts(mint=mint))
+        return sum(
+            int(item.account.data.parsed["info"]["tokenAmount"]["amount"])
+            for item in response.value
+        )
+
+    def _presign(self, group_id: int, password: str, kind: str, build, token_address: str = None):
+        """
+        Sign one transaction per group wallet with a free nonce account
+
+        Args:
+            build: callable(keypair, wallet) -> (instructions, lookup_tables) or
+                None to skip the wallet
+        """
+        db = get_db()
+        try:
+            wallets = db.query(Wallet).filter(Wallet.group_id == group_id).all()
+            if not wallets:
+                raise Exception("No wallets found in group")
+
+            free = self._free_nonce_accounts(db, [w.id for w in wallets])
+            nonce_values = self.get_nonce_values([
+                accounts[0].nonce_address for accounts in free.values()
+            ])
+
+            # One KDF for the whole batch; every row shares the salt
+            key, salt = derive_key(password)
+
+            results = []
+            for wallet in wallets:
+                accounts = free.get(wallet.id)
+                if not accounts or accounts[0].nonce_address not in nonce_values:
+                    results.append({"wallet_id": wallet.id, "success": False, "error": "No free nonce account"})
+                    continue
+
+                nonce_account = accounts[0]
+                try:
+                    private_key = decrypt_private_key(wallet.encrypted_private_key, password)
+                    keypair = import_wallet(private_key, "private_key")
+
+                    built = build(keypair, wallet)
+                    if built is None:
+                        results.append({"wallet_id": wallet.id, "success": False, "error": "Nothing to sign"})
+                        continue
+
+                    instructions, lookup_tables = built
+                    tx = build_nonce_transaction(
+                        keypair,
+                        Pubkey.from_string(nonce_account.nonce_address),
+                        nonce_values[nonce_account.nonce_address],
+                        instructions,
+                        lookup_tables
+                    )
+
+                    row = PresignedTransaction(
+                        wallet_id=wallet.id,
+                        group_id=group_id,
+                        nonce_account_id=nonce_account.id,
+                        kind=kind,
+                        token_address=token_address,
+                        encrypted_transaction=encrypt_bytes(bytes(tx), key, salt)
+                    )
+                    db.add(row)
+                    db.commit()
+                    results.append({"wallet_id": wallet.id, "presigned_id": row.id, "success": True})
+                except Exception as e:
+                    db.rollback()
+                    results.append({"wallet_id": wallet.id, "success": False, "error": str(e)})
+
+            successful = sum(1 for r in results if r["success"])
+            return {
+                "group_id": group_id,
+                "kind": kind,
+                "total_wallets": len(results),
+                "successful": successful,
+                "failed": len(results) - successful,
+                "results": results
+            }
+        finally:
+            close_db(db)
+
+    def presign_collect(self, group_id: int, to_wallet_id: int, password: str, leave_amount: float = 0.001):
+        """
+        Pre-sign a SOL sweep from every group wallet to one wallet
+
+        The amount is fixed at signing time from the current balance (minus
+        leave_amount and the fee), so re-sign after balances change.
+        """
+        db = get_db()
+        try:
+            target = db.query(Wallet).filter(Wallet.id == to_wallet_id).first()
+            if not target:
+                raise Exception("Target wallet not found")
+            target_pubkey = Pubkey.from_string(target.public_key)
+            wallets = db.query(Wallet).filter(Wallet.group_id == group_id).all()
+        finally:
+            close_db(db)
+
+        balances = self._lamports([w.public_key for w in wallets])
+        keep = int(leave_amount * 1e9) + SIGNATURE_FEE_LAMPORTS
+
+        def build(keypair, wallet):
+            lamports = balances.get(wallet.public_key, 0) - keep
+            if lamports <= 0:
+                return None
+            ix = transfer(TransferParams(from_pubkey=keypair.pubkey(), to_pubkey=target_pubkey, lamports=lamports))
+            return [ix], []
+
+        return self._presign(group_id, password, "collect", build)
+
+    async def presign_sell(self, group_id: int, token_address: str, password: str, slippage: float = 15.0):
+        """
+        Pre-sign a full-balance sell of one token from every group wallet
+
+        The route is fixed when signing, so use a wide slippage: the
+        transaction is meant for exits where landing matters more than price.
+        """
+        db = get_db()
+        try:
+            wallets = db.query(Wallet).filter(Wallet.group_id == group_id).all()
+        finally:
+            close_db(db)
+
+        mint = Pubkey.from_string(token_address)
+        slippage_bps = int(slippage * 100)
+
+        # Quotes and instructions are fetched up front; signing below is local
+        prepared = {}
+        for wallet in wallets:
+            owner = Pubkey.from_string(wallet.public_key)
+            amount = self._token_amount(owner, mint)
+            if amount <= 0:
+                continue
+            quote = await self.jupiter.get_quote(token_address, SOL_MINT, amount, slippage_bps)
+            if not quote:
+                continue
+            swap = await self.jupiter.get_swap_instructions(quote, wallet.public_key)
+            if swap:
+                prepared[wallet.id] = (swap["instructions"], self._lookup_tables(swap["lookup_tables"]))
+
+        return self._presign(
+            group_id,
+            password,
+            "sell",
+            lambda keypair, wallet: prepared.get(wallet.id),
+            token_address=token_address
+        )
+
+    def unlock(self, group_id: int, password: str) -> dict:
+        """Derive and hold the vault keys for a group so fire() needs no KDF"""
+        db = get_db()
+        try:
+            rows = db.query(PresignedTransaction).filter(
+                PresignedTransaction.group_id == group_id,
+                PresignedTransaction.is_used == False
+            ).all()
+
+            cache = dict(self._keys.get(group_id, {}))
+            for row in rows:
+                decrypt_bytes(row.encrypted_transaction, password, cache)
+            self._keys[group_id] = cache
+
+            return {"group_id": group_id, "unlocked": True, "transactions": len(rows)}
+        finally:
+            close_db(db)
+
+    def lock(self, group_id: int) -> dict:
+        self._keys.pop(group_id, None)
+        return {"group_id": group_id, "unlocked": False}
+
+    def is_unlocked(self, group_id: int) -> bool:
+        return bool(self._keys.get(group_id))
+
+    async def fire(self, group_id: int, password: Optional[str] = None, kind: Optional[str] = None):
+        """
+        Broadcast every unused pre-signed transaction of a group at once
+
+        Args:
+            group_id: Wallet group ID
+            password: Needed only when the vault is not unlocked
+            kind: Optional filter ("sell" or "collect")
+
+        Returns:
+            dict with per-transaction signatures and broadcast time
+        """
+        db = get_db()
+        try:
+            query = db.query(PresignedTransaction).filter(
+                PresignedTransaction.group_id == group_id,
+                PresignedTransaction.is_used == False
+            )
+            if kind:
+                query = query.filter(PresignedTransaction.kind == kind)
+            rows = query.all()
+            if not rows:
+                raise Exception("No pre-signed transactions for group")
+
+            # Work on a copy so a password-only fire does not leave the vault unlocked
+            cache = dict(self._keys.get(group_id, {}))
+            raw = [decrypt_bytes(row.encrypted_transaction, password, cache) for row in rows]
+
+            started = time.perf_counter()
+            opts = TxOpts(skip_preflight=True)
+            async with AsyncClient(RPC_ENDPOINT) as client:
+                responses = await asyncio.gather(
+                    *[client.send_raw_transaction(tx, opts=opts) for tx in raw],
+                    return_exceptions=True
+                )
+            broadcast_ms = (time.perf_counter() - started) * 1000
+
+            results = []
+            for row, response in zip(rows, responses):
+                if isinstance(response, Exception):
+                    results.append({"presigned_id": row.id, "wallet_id": row.wallet_id, "kind": row.kind,
+                                    "success": False, "error": str(response)})
+                    continue
+
+                row.is_used = True
+                row.signature = str(response.value)
+                row.used_at = datetime.utcnow()
+                results.append({"presigned_id": row.id, "wallet_id": row.wallet_id, "kind": row.kind,
+                                "signature": row.signature, "success": True})
+            db.commit()
+
+            successful = sum(1 for r in results if r["success"])
+            return {
+                "group_id": group_id,
+                "total": len(results),
+                "successful": successful,
+                "failed": len(results) - successful,
+                "broadcast_ms": round(broadcast_ms, 3),
+                "results": results
+            }
+        finally:
+            close_db(db)
+
+    def list_presigned(self, group_id: int) -> dict:
+        db = get_db()
+        try:
+            rows = db.query(PresignedTransaction).filter(PresignedTransaction.group_id == group_id).all()
+            return {
+                "group_id": group_id,
+                "unlocked": self.is_unlocked(group_id),
+                "transactions": [
+                    {
+                        "id": row.id,
+                        "wallet_id": row.wallet_id,
+                        "kind": row.kind,
+                        "token_address": row.token_address,
+                        "is_used": row.is_used,
+                        "signature": row.signature,
+                        "created_at": str(row.created_at)
+                    }
+                    for row in rows
+                ]
+            }
+        finally:
+            close_db(db)
+
+
+# Singleton
+_nonce_vault = None
+
+def get_nonce_vault():
+    global _nonce_vault
+    if _nonce_vault is None:
+        _nonce_vault = NonceVault()
+    return _nonce_vault
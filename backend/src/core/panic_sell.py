@@ -0,0 +1,207 @@
+"""
+Panic Sell
+Flatten every token position held by any group wallet in one operation
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import base64
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from core.database import get_db, close_db, Wallet, Trade
+from core.rpc import AsyncRpc, RpcError, get_async_rpc
+from core.wallet import import_wallet
+from trading.jupiter import JupiterClient, SOL_MINT
+from trading.sender import TransactionSender, get_transaction_sender
+from utils.encryption import decrypt_private_key
+from utils.token_layout import TOKEN_PROGRAM_IDS, TOKEN_ACCOUNT_PREFIX_SIZE, decode_token_account
+
+class PanicSeller:
+    """Find every non-zero (wallet, mint) across groups and sell it all concurrently"""
+
+    def __init__(self, rpc: AsyncRpc = None, jupiter: JupiterClient = None, concurrency: int = 32,
+                 sender: TransactionSender = None):
+        self.rpc = rpc or get_async_rpc()
+        self.jupiter = jupiter or JupiterClient()
+        self.sender = sender or get_transaction_sender()
+        self.concurrency = concurrency
+
+    async def find_positions(self, wallets: List[Wallet]) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Read token accounts of all wallets with batched getTokenAccountsByOwner
+
+        Only the 72-byte mint/owner/amount prefix is requested.
+
+        Returns:
+            {wallet_id: [{"mint", "amount"}]} for non-zero, non-WSOL balances
+        """
+        config = {
+            "encoding": "base64",
+            "commitment": "confirmed",
+            "dataSlice": {"offset": 0, "length": TOKEN_ACCOUNT_PREFIX_SIZE}
+        }
+        calls = [
+            ("getTokenAccountsByOwner", [wallet.public_key, {"programId": program_id}, config])
+            for wallet in wallets
+            for program_id in TOKEN_PROGRAM_IDS
+        ]
+        results = await self.rpc.batch(calls)
+
+        positions: Dict[int, Dict[str, int]] = {}
+        for index, result in enumerate(results):
+            if isinstance(result, RpcError):
+                continue
+            wallet = wallets[index // len(TOKEN_PROGRAM_IDS)]
+            for item in result["value"]:
+                account = decode_token_account(base64.b64decode(item["account"]["data"][0]))
+                if account.amount and account.mint != SOL_MINT:
+                    held = positions.setdefault(wallet.id, {})
+                    held[account.mint] = held.get(account.mint, 0) + account.amount
+
+        return {
+            wallet_id: [{"mint": mint, "amount": amount} for mint, amount in held.items()]
+            for wallet_id, held in positions.items()
+        }
+
+    async def _sell(self, keypair, mint: str, amount: int, slippage_bps: int) -> Dict[str, Any]:
+        quote = await self.jupiter.get_quote(mint, SOL_MINT, amount, slippage_bps)
+        if not quote:
+            return {"mint": mint, "amount": amount, "success": False, "error": "No quote"}
+
+        swap = await self.jupiter.get_swap_transaction(quote, str(keypair.pubkey()))
+        if not swap:
+            return {"mint": mint, "amount": amount, "success": False, "error": "No swap transaction"}
+
+        swap_tx, last_valid_block_height = swap
+        try:
+            outcome = await self.sender.send(self.jupiter.sign_swap(keypair, swap_tx), "panic_sell",
+                                             last_valid_block_height)
+        except Exception as e:
+            return {"mint": mint, "amount": amount, "success": False, "error": str(e)}
+
+        if not outcome["landed"]:
+            return {"mint": mint, "amount": amount, "signature": outcome["signature"],
+                    "success": False, "error": outcome["error"] or outcome["state"]}
+
+        return {
+            "mint": mint,
+            "amount": amount,
+            "expected_sol": int(quote.get("outAmount", 0)) / 1e9,
+            "signature": outcome["signature"],
+            "success": True
+        }
+
+    async def _flatten_wallet(self, wallet: Wallet, positions: List[Dict[str, Any]], password: str,
+                              slippage_bps: int, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        try:
+            # Key derivation is CPU bound; keep it off the event loop
+            private_key = await loop.run_in_executor(
+                None, decrypt_private_key, wallet.encrypted_private_key, password
+            )
+            keypair = import_wallet(private_key, "private_key")
+        except Exception as e:
+            return {
+                "wallet_id": wallet.id,
+                "group_id": wallet.group_id,
+                "wallet_index": wallet.wallet_index,
+                "success": False,
+                "sells": [
+                    {"mint": p["mint"], "amount": p["amount"], "success": False, "error": str(e)}
+                    for p in positions
+                ]
+            }
+
+        async def sell(position):
+            async with semaphore:
+                return await self._sell(keypair, position["mint"], position["amount"], slippage_bps)
+
+        sells = await asyncio.gather(*[sell(p) for p in positions])
+        return {
+            "wallet_id": wallet.id,
+            "group_id": wallet.group_id,
+            "wallet_index": wallet.wallet_index,
+            "success": all(s["success"] for s in sells),
+            "sells": sells
+        }
+
+    async def run(self, password: str, slippage: float = 15.0,
+                  group_ids: Optional[List[int]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Flatten all positions, yielding progress events as they happen
+
+        Events: "scan" once positions are known, "wallet" per finished wallet
+        and "done" with the summary.
+        """
+        started = time.perf_counter()
+
+        db = get_db()
+        try:
+            query = db.query(Wallet).filter(Wallet.group_id != None)
+            if group_ids:
+                query = query.filter(Wallet.group_id.in_(group_ids))
+            wallets = query.all()
+            # Detach so rows stay readable after the session closes
+            db.expunge_all()
+        finally:
+            close_db(db)
+
+        positions = await self.find_positions(wallets)
+        yield {
+            "event": "scan",
+            "wallets": len(wallets),
+            "wallets_with_positions": len(positions),
+            "positions": sum(len(p) for p in positions.values()),
+            "scan_ms": round((time.perf_counter() - started) * 1000, 3)
+        }
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        slippage_bps = int(slippage * 100)
+        by_id = {wallet.id: wallet for wallet in wallets}
+        tasks = [
+            asyncio.create_task(self._flatten_wallet(by_id[wallet_id], held, password, slippage_bps, semaphore))
+            for wallet_id, held in positions.items()
+        ]
+
+        trades = []
+        sold = failed = 0
+        for finished in asyncio.as_completed(tasks):
+            result = await finished
+            for sell in result["sells"]:
+                if sell["success"]:
+                    sold += 1
+                    trades.append(Trade(
+                        wallet_id=result["wallet_id"],
+                        token_address=sell["mint"],
+                        trade_type="sell",
+                        amount=sell["amount"],
+                        price=0,
+                        revenue=sell["expected_sol"],
+                        signature=sell["signature"],
+                        timestamp=datetime.utcnow(),
+                        strategy="panic"
+                    ))
+                else:
+                    failed += 1
+            yield {"event": "wallet", **result}
+
+        # Record every sell with a single commit
+        if trades:
+            db = get_db()
+            try:
+                db.add_all(trades)
+                db.commit()
+            finally:
+                close_db(db)
+
+        yield {
+            "event": "done",
+            "sold": sold,
+            "failed": failed,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)
+        }
@@ -0,0 +1,131 @@
+"""
+Async RPC Client
+Pooled JSON-RPC client with request batching, behind the shared rate limiter
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import base64
+import itertools
+import httpx
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from config import RPC_ENDPOINT
+from utils.rate_limiter import RateLimiter, get_rate_limiter
+
+# Calls per JSON-RPC batch request and accounts per getMultipleAccounts call
+MAX_BATCH_SIZE = 100
+
+class RpcError(Exception):
+    """Error object returned by the RPC node"""
+
+    def __init__(self, error: Dict[str, Any]):
+        self.code = error.get("code")
+        self.data = error.get("data")
+        super().__init__(error.get("message", str(error)))
+
+class AsyncRpc:
+    """Minimal async Solana JSON-RPC client on one pooled HTTP connection set"""
+
+    def __init__(self, endpoint: str = None, limiter: RateLimiter = None, max_connections: int = 100):
+        self.endpoint = endpoint or RPC_ENDPOINT
+        self.limiter = limiter or get_rate_limiter()
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+        self._ids = itertools.count(1)
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(10.0),
+                limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+            )
+        return self._client
+
+    def _request(self, method: str, params: Optional[list]) -> Dict[str, Any]:
+        return {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params or []}
+
+    async def call(self, method: str, params: Optional[list] = None) -> Any:
+        """Send one request and return its ``result``"""
+        await self.limiter.acquire()
+        response = await self.http.post(self.endpoint, json=self._request(method, params))
+        response.raise_for_status()
+        data = response.json()
+        if "error" in data:
+            raise RpcError(data["error"])
+        return data["result"]
+
+    async def batch(self, calls: Sequence[Tuple[str, Optional[list]]]) -> List[Any]:
+        """
+        Send many requests as JSON-RPC batches
+
+        Returns:
+            Results in call order; failed calls yield an RpcError instance
+        """
+        results: List[Any] = []
+        for i in range(0, len(calls), MAX_BATCH_SIZE):
+            chunk = [self._request(method, params) for method, params in calls[i:i + MAX_BATCH_SIZE]]
+            await self.limiter.acquire(len(chunk))
+            response = await self.http.post(self.endpoint, json=chunk)
+            response.raise_for_status()
+
+            by_id = {item.get("id"): item for item in response.json()}
+            for request in chunk:
+                item = by_id.get(request["id"], {"error": {"message": "Missing response"}})
+                results.append(RpcError(item["error"]) if "error" in item else item["result"])
+        return results
+
+    async def get_multiple_accounts(
+        self,
+        addresses: Sequence[str],
+        commitment: str = "confirmed",
+        data_slice: Optional[Dict[str, int]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch accounts in chunks of 100 with raw data decoded to bytes
+
+        Returns:
+            One entry per address: None or {"lamports", "owner", "data": bytes}
+        """
+        config: Dict[str, Any] = {"encoding": "base64", "commitment": commitment}
+        if data_slice:
+            config["dataSlice"] = data_slice
+
+        accounts: List[Optional[Dict[str, Any]]] = []
+        for i in range(0, len(addresses), MAX_BATCH_SIZE):
+            chunk = list(addresses[i:i + MAX_BATCH_SIZE])
+            result = await self.call("getMultipleAccounts", [chunk, config])
+            for value in result["value"]:
+                if value is None:
+                    accounts.append(None)
+                    continue
+                accounts.append({
+                    "lamports": value["lamports"],
+                    "owner": value["owner"],
+                    "data": base64.b64decode(value["data"][0])
+                })
+        return accounts
+
+    async def send_transaction(self, raw: bytes, skip_preflight: bool = True, max_retries: Optional[int] = None) -> str:
+        """Submit signed transaction bytes and return the signature"""
+        config: Dict[str, Any] = {"encoding": "base64", "skipPreflight": skip_preflight}
+        if max_retries is not None:
+            config["maxRetries"] = max_retries
+        return await self.call("sendTransaction", [base64.b64encode(raw).decode(), config])
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Singleton
+_async_rpc = None
+
+def get_async_rpc():
+    global _async_rpc
+    if _async_rpc is None:
+        _async_rpc = AsyncRpc()
+    return _async_rpc
@@ -0,0 +1,271 @@
+"""
+Creator Reputation Index
+Tokens launched, rugs observed and first-seen time of every pool creator,
+held in memory for O(1) lookups by the sniper's filters and persisted to
+SQLite in small batches on a writer thread, off the event loop
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import get_db, close_db, Creator, CreatorToken
+
+class CreatorRecord:
+    """Reputation of one creator wallet"""
+
+    __slots__ = ("address", "tokens_launched", "rugs_observed", "first_seen", "last_seen")
+
+    def __init__(self, address: str, tokens_launched: int = 0, rugs_observed: int = 0,
+                 first_seen: Optional[datetime] = None, last_seen: Optional[datetime] = None):
+        self.address = address
+        self.tokens_launched = tokens_launched
+        self.rugs_observed = rugs_observed
+        self.first_seen = first_seen or datetime.utcnow()
+        self.last_seen = last_seen or self.first_seen
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "address": self.address,
+            "tokens_launched": self.tokens_launched,
+            "rugs_observed": self.rugs_observed,
+            "first_seen": self.first_seen.isoformat(),
+            "last_seen": self.last_seen.isoformat()
+        }
+
+class CreatorIndex:
+    """Creator reputations loaded from the creators table and updated as pools arrive"""
+
+    def __init__(self, flush_every: int = 50, flush_interval: float = 5.0, recent_tokens: int = 50_000):
+        """
+        Args:
+            flush_every: Write pending changes once this many are queued
+            flush_interval: ...or once the oldest pending change is this old (s)
+            recent_tokens: Token → creator entries kept in memory for rug reports
+        """
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.recent_tokens = recent_tokens
+        self._creators: Dict[str, CreatorRecord] = {}
+        # token → [creator, rugged]; older tokens are looked up in the database
+        self._tokens: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self._pending_tokens: List[Tuple[str, str]] = []
+        self._pending_rugs: set = set()
+        self._dirty: set = set()
+        self._pending_since: Optional[float] = None
+        self._loaded = False
+        # One thread, so batches are written in order and never concurrently
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="creator-index")
+        self.flushes = 0
+
+    def load(self):
+        """Load every creator's counters (no RPC); an unreadable database leaves the index empty"""
+        db = get_db()
+        try:
+            for row in db.query(Creator).all():
+                self._creators[row.address] = CreatorRecord(
+                    row.address, row.tokens_launched or 0, row.rugs_observed or 0, row.first_seen, row.last_seen
+                )
+        except Exception as e:
+            print(f"✗ Failed to load creator index: {e}")
+        finally:
+            self._loaded = True
+            close_db(db)
+
+    def ensure_loaded(self):
+        """Load once; snipers call this off the event loop before subscribing"""
+        if not self._loaded:
+            self.load()
+
+    def get(self, creator: Optional[str]) -> Optional[CreatorRecord]:
+        self.ensure_loaded()
+        return self._creators.get(creator) if creator else None
+
+    def record_launch(self, pool_data: Dict[str, Any]) -> Optional[CreatorRecord]:
+        """
+        Count a new pool against its creator
+
+        Args:
+            pool_data: Pool event with "creator" and "token_address"
+
+        Returns:
+            The creator's updated record, or None if the event has no creator
+        """
+        creator = pool_data.get("creator")
+        token_address = pool_data.get("token_address")
+        if not creator or not token_address:
+            return None
+        self.ensure_loaded()
+        if token_address in self._tokens:
+            return self._creators.get(creator)
+
+        record = self._creators.get(creator)
+        if record is None:
+            record = self._creators[creator] = CreatorRecord(creator)
+        record.tokens_launched += 1
+        record.last_seen = datetime.utcnow()
+
+        self._remember(token_address, creator, False)
+        self._pending_tokens.append((token_address, creator))
+        self._mark_dirty(creator)
+        return record
+
+    def report_rug(self, token_address: str, creator: Optional[str] = None) -> Optional[CreatorRecord]:
+        """
+        Record that a token was rugged and charge it to its creator
+
+        Args:
+            token_address: Rugged token
+            creator: Its creator when the token was never indexed
+
+        Returns:
+            The creator's updated record, or None if the creator is unknown
+        """
+        self.ensure_loaded()
+        entry = self._tokens.get(token_address)
+        if entry is None:
+            entry = self._lookup_token(token_address)
+        if entry is None:
+            if not creator:
+                return None
+            entry = [creator, False]
+            self._pending_tokens.append((token_address, creator))
+        if entry[1]:
+            # Already counted
+            return self._creators.get(entry[0])
+
+        record = self._creators.get(entry[0])
+        if record is None:
+            record = self._creators[entry[0]] = CreatorRecord(entry[0])
+        record.rugs_observed += 1
+        self._remember(token_address, entry[0], True)
+        self._pending_rugs.add(token_address)
+        self._mark_dirty(entry[0])
+        # Rugs are rare and matter for every later event: persist right away
+        self._schedule_flush()
+        return record
+
+    def _remember(self, token_address: str, creator: str, rugged: bool):
+        self._tokens[token_address] = [creator, rugged]
+        self._tokens.move_to_end(token_address)
+        while len(self._tokens) > self.recent_tokens:
+            self._tokens.popitem(last=False)
+
+    def _lookup_token(self, token_address: str) -> Optional[List[Any]]:
+        db = get_db()
+        try:
+            row = db.query(CreatorToken).filter(CreatorToken.token_address == token_address).first()
+            return [row.creator, bool(row.rugged)] if row else None
+        except Exception as e:
+            print(f"✗ Creator lookup failed: {e}")
+            return None
+        finally:
+            close_db(db)
+
+    def _mark_dirty(self, creator: str):
+        self._dirty.add(creator)
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        if (len(self._dirty) + len(self._pending_tokens) >= self.flush_every
+                or time.monotonic() - self._pending_since >= self.flush_interval):
+            self._schedule_flush()
+
+    def _take_pending(self) -> Optional[Tuple[List[Tuple[Any, ...]], List[Tuple[str, str]], set]]:
+        """Snapshot and clear pending changes (on the caller's thread)"""
+        if not self._dirty and not self._pending_tokens and not self._pending_rugs:
+            return None
+        dirty, self._dirty = self._dirty, set()
+        pending, self._pending_tokens = self._pending_tokens, []
+        rugs, self._pending_rugs = self._pending_rugs, set()
+        self._pending_since = None
+        records = []
+        for address in dirty:
+            record = self._creators[address]
+            records.append((address, record.tokens_launched, record.rugs_observed, record.first_seen, record.last_seen))
+        return records, pending, rugs
+
+    def _schedule_flush(self):
+        """Hand pending changes to the writer thread without waiting"""
+        batch = self._take_pending()
+        if batch is not None:
+            self._writer.submit(self._write, batch)
+
+    def flush(self) -> bool:
+        """
+        Write pending counters and tokens, blocking until they (and any
+        batch already queued) are in the database
+
+        Returns:
+            True if the last batch was written
+        """
+        return self._writer.submit(self._write, self._take_pending()).result()
+
+    async def flush_async(self) -> bool:
+        """flush() for the event loop: waits for the writer thread without blocking"""
+        return await asyncio.wrap_future(self._writer.submit(self._write, self._take_pending()))
+
+    def _write(self, batch) -> bool:
+        """Write one snapshot from _take_pending (writer thread)"""
+        if batch is None:
+            return True
+        records, pending, rugs = batch
+
+        db = get_db()
+        try:
+            dirty = [address for address, *_ in records]
+            rows = {row.address: row for row in db.query(Creator).filter(Creator.address.in_(dirty))}
+            for address, tokens_launched, rugs_observed, first_seen, last_seen in records:
+                row = rows.get(address)
+                if row is None:
+                    row = Creator(address=address, first_seen=first_seen)
+                    db.add(row)
+                row.tokens_launched = tokens_launched
+                row.rugs_observed = rugs_observed
+                row.last_seen = last_seen
+
+            tokens = dict(pending)
+            known = {row[0] for row in
+                     db.query(CreatorToken.token_address).filter(CreatorToken.token_address.in_(list(tokens)))}
+            for token_address, creator in tokens.items():
+                if token_address not in known:
+                    db.add(CreatorToken(token_address=token_address, creator=creator))
+            db.flush()
+            if rugs:
+                db.query(CreatorToken).filter(CreatorToken.token_address.in_(list(rugs))).update(
+                    {"rugged": True}, synchronize_session=False
+                )
+
+            db.commit()
+            self.flushes += 1
+            return True
+        except Exception as e:
+            db.rollback()
+            print(f"✗ Failed to persist creator index: {e}")
+            return False
+        finally:
+            close_db(db)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "creators": len(self._creators),
+            "ruggers": sum(1 for record in self._creators.values() if record.rugs_observed > 0),
+            "pending": len(self._dirty) + len(self._pending_tokens),
+            "flushes": self.flushes
+        }
+
+
+# Singleton
+_creator_index: Optional[CreatorIndex] = None
+
+def get_creator_index():
+    global _creator_index
+    if _creator_index is None:
+        _creator_index = CreatorIndex()
+    return _creator_index
@@ -0,0 +1,426 @@
+"""
+Pool Creation Decoders
+Decode Raydium AMM v4 initialize2 and pump.fun create events from
+logsSubscribe notifications and raw transaction bytes, and a wallet's swaps
+(for copy trading) from pump.fun trade logs or a parsed transaction
+"""
+
+import base64
+import struct
+from datetime import datetime
+from typing import Any, Collection, Dict, List, Optional, Sequence
+
+from solders.pubkey import Pubkey
+from solders.transaction import VersionedTransaction
+
+RAYDIUM_AMM_V4 = "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"
+PUMPFUN_PROGRAM = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+SOL_MINT = "So11111111111111111111111111111111111111112"
+
+# Programs whose invocation makes a wallet's transaction a possible swap
+SWAP_PROGRAMS = frozenset({
+    RAYDIUM_AMM_V4,
+    PUMPFUN_PROGRAM,
+    "CPMMoo8L3F4NbTegBCKVNunggL7H1ZpdTHKxQB5qKP1C",  # Raydium CPMM
+    "whirLbMiicVdio4qvUfM5KAg6Ct8VwpYzGff3uctyCc",  # Orca Whirlpools
+    "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4",  # Jupiter v6
+})
+# Token program names in jsonParsed transactions
+PARSED_TOKEN_PROGRAMS = ("spl-token", "spl-token-2022")
+
+# Raydium ray_log InitLog: log_type u8, time u64, pc_decimals u8, coin_decimals u8,
+# pc_lot_size u64, coin_lot_size u64, pc_amount u64, coin_amount u64, market [32]
+RAY_LOG_INIT = struct.Struct("<BQBBQQQQ")
+RAY_LOG_INIT_SIZE = RAY_LOG_INIT.size + 32
+RAY_LOG_TYPE_INIT = 0
+
+# initialize2 data: tag u8 (1), nonce u8, open_time u64, init_pc_amount u64, init_coin_amount u64
+INITIALIZE2 = struct.Struct("<BBQQQ")
+INITIALIZE2_TAG = 1
+
+# initialize2 account positions
+INIT2_AMM = 4
+INIT2_LP_MINT = 7
+INIT2_COIN_MINT = 8
+INIT2_PC_MINT = 9
+INIT2_MARKET = 16
+INIT2_USER = 17
+
+# Anchor event discriminators (first 8 bytes of sha256("event:<Name>"))
+PUMPFUN_CREATE_EVENT = bytes([27, 114, 169, 77, 222, 235, 99, 118])
+PUMPFUN_TRADE_EVENT = bytes([189, 219, 127, 211, 78, 230, 97, 238])
+
+# TradeEvent after the mint: sol_amount u64, token_amount u64, is_buy bool, then user [32]
+PUMPFUN_TRADE = struct.Struct("<QQ?")
+PUMPFUN_TRADE_USER = 8 + 32 + PUMPFUN_TRADE.size
+
+_U32 = struct.Struct("<I")
+_PROGRAM_DATA = "Program data: "
+_RAY_LOG = "ray_log: "
+
+class PoolEvent:
+    """A decoded pool creation; ``as_dict`` gives the monitor's pool_data shape"""
+
+    __slots__ = ("platform", "signature", "token_address", "pool_address", "quote_mint",
+                 "creator", "liquidity", "token_name", "token_symbol", "uri", "slot")
+
+    def __init__(self, platform: str, signature: Optional[str], token_address: str, pool_address: str,
+                 quote_mint: str = SOL_MINT, creator: Optional[str] = None, liquidity: float = 0.0,
+                 token_name: Optional[str] = None, token_symbol: Optional[str] = None,
+                 uri: Optional[str] = None, slot: Optional[int] = None):
+        self.platform = platform
+        self.signature = signature
+        self.token_address = token_address
+        self.pool_address = pool_address
+        self.quote_mint = quote_mint
+        self.creator = creator
+        self.liquidity = liquidity
+        self.token_name = token_name
+        self.token_symbol = token_symbol
+        self.uri = uri
+        self.slot = slot
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "platform": self.platform,
+            "signature": self.signature,
+            "token_address": self.token_address,
+            "pool_address": self.pool_address,
+            "quote_mint": self.quote_mint,
+            "liquidity": self.liquidity,
+            "token_symbol": self.token_symbol,
+            "token_name": self.token_name,
+            "uri": self.uri,
+            "creator": self.creator,
+            "slot": self.slot,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+class SwapEvent:
+    """A wallet's swap between SOL and a token, as mirrored by the copy trader"""
+
+    __slots__ = ("wallet", "token_address", "is_buy", "sol_amount", "token_amount",
+                 "signature", "slot", "sold_fraction", "source")
+
+    def __init__(self, wallet: str, token_address: str, is_buy: bool, sol_amount: int, token_amount: int,
+                 signature: Optional[str] = None, slot: Optional[int] = None,
+                 sold_fraction: Optional[float] = None, source: str = "logs"):
+        self.wallet = wallet
+        self.token_address = token_address
+        self.is_buy = is_buy
+        # Lamports spent (buy) or received (sell)
+        self.sol_amount = sol_amount
+        self.token_amount = token_amount
+        self.signature = signature
+        self.slot = slot
+        # Share of the wallet's prior balance a sell disposed of, when known
+        self.sold_fraction = sold_fraction
+        # "logs" (decoded from the notification) or "transaction" (fetched)
+        self.source = source
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "wallet": self.wallet,
+            "token_address": self.token_address,
+            "side": "buy" if self.is_buy else "sell",
+            "sol_amount": self.sol_amount / 1e9,
+            "token_amount": self.token_amount,
+            "signature": self.signature,
+            "slot": self.slot,
+            "sold_fraction": self.sold_fraction,
+            "source": self.source
+        }
+
+class RaydiumInitLog:
+    """Amounts and market from the ray_log emitted by initialize2"""
+
+    __slots__ = ("open_time", "pc_decimals", "coin_decimals", "pc_amount", "coin_amount", "market")
+
+    def __init__(self, open_time, pc_decimals, coin_decimals, pc_amount, coin_amount, market):
+        self.open_time = open_time
+        self.pc_decimals = pc_decimals
+        self.coin_decimals = coin_decimals
+        self.pc_amount = pc_amount
+        self.coin_amount = coin_amount
+        self.market = market
+
+def _pubkey(view: memoryview, offset: int) -> str:
+    return str(Pubkey.from_bytes(view[offset:offset + 32].tobytes()))
+
+def _string(view: memoryview, offset: int) -> tuple:
+    """Borsh string: u32 length + utf-8 bytes. Returns (value, next offset)"""
+    (length,) = _U32.unpack_from(view, offset)
+    start = offset + 4
+    end = start + length
+    if end > len(view):
+        raise ValueError("String runs past end of data")
+    return str(view[start:end], "utf-8", "replace"), end
+
+def decode_ray_log(data: bytes) -> Optional[RaydiumInitLog]:
+    """Decode a ray_log payload; only the Init log type is returned"""
+    if len(data) < RAY_LOG_INIT_SIZE or data[0] != RAY_LOG_TYPE_INIT:
+        return None
+    view = memoryview(data)
+    _, open_time, pc_decimals, coin_decimals, _, _, pc_amount, coin_amount = RAY_LOG_INIT.unpack_from(view, 0)
+    return RaydiumInitLog(open_time, pc_decimals, coin_decimals, pc_amount, coin_amount,
+                          _pubkey(view, RAY_LOG_INIT.size))
+
+def raydium_init_from_logs(logs: Sequence[str]) -> Optional[RaydiumInitLog]:
+    """Find the initialize2 ray_log in a transaction's logs"""
+    seen_initialize2 = False
+    for line in logs:
+        if not seen_initialize2:
+            seen_initialize2 = "initialize2" in line
+            continue
+        index = line.find(_RAY_LOG)
+        if index != -1:
+            try:
+                return decode_ray_log(base64.b64decode(line[index + len(_RAY_LOG):]))
+            except (ValueError, struct.error):
+                return None
+    return None
+
+def decode_initialize2(data: bytes, accounts: Sequence[str], signature: Optional[str] = None,
+                       init_log: Optional[RaydiumInitLog] = None) -> Optional[PoolEvent]:
+    """
+    Decode a Raydium AMM v4 initialize2 instruction
+
+    Args:
+        data: Instruction data
+        accounts: Instruction account addresses in instruction order
+        signature: Transaction signature
+        init_log: Matching ray_log, used for the initial amounts when present
+
+    Returns:
+        PoolEvent or None if this is not initialize2
+    """
+    if len(data) < INITIALIZE2.size or data[0] != INITIALIZE2_TAG or len(accounts) <= INIT2_USER:
+        return None
+
+    _, _, _, pc_amount, coin_amount = INITIALIZE2.unpack_from(data, 0)
+    if init_log is not None:
+        pc_amount, coin_amount = init_log.pc_amount, init_log.coin_amount
+
+    coin_mint, pc_mint = accounts[INIT2_COIN_MINT], accounts[INIT2_PC_MINT]
+    if pc_mint == SOL_MINT:
+        token_address, quote_mint, liquidity = coin_mint, pc_mint, pc_amount / 1e9
+    elif coin_mint == SOL_MINT:
+        token_address, quote_mint, liquidity = pc_mint, coin_mint, coin_amount / 1e9
+    else:
+        token_address, quote_mint, liquidity = coin_mint, pc_mint, 0.0
+
+    return PoolEvent(
+        platform="raydium",
+        signature=signature,
+        token_address=token_address,
+        pool_address=accounts[INIT2_AMM],
+        quote_mint=quote_mint,
+        creator=accounts[INIT2_USER],
+        liquidity=liquidity
+    )
+
+def decode_raydium_transaction(raw: bytes, loaded_addresses: Optional[Dict[str, List[str]]] = None,
+                               init_log: Optional[RaydiumInitLog] = None) -> Optional[PoolEvent]:
+    """
+    Find and decode initialize2 in a raw (base64-decoded) transaction
+
+    Args:
+        raw: Serialized transaction from getTransaction with base64 encoding
+        loaded_addresses: meta.loadedAddresses for v0 transactions
+        init_log: ray_log decoded from the same transaction's logs
+    """
+    tx = VersionedTransaction.from_bytes(raw)
+    message = tx.message
+    keys = [str(key) for key in message.account_keys]
+    if loaded_addresses:
+        keys += loaded_addresses.get("writable", []) + loaded_addresses.get("readonly", [])
+
+    for ix in message.instructions:
+        if keys[ix.program_id_index] != RAYDIUM_AMM_V4:
+            continue
+        data = bytes(ix.data)
+        if data[:1] != bytes([INITIALIZE2_TAG]):
+            continue
+        return decode_initialize2(data, [keys[i] for i in bytes(ix.accounts)], str(tx.signatures[0]), init_log)
+    return None
+
+def decode_pumpfun_create(data: bytes, signature: Optional[str] = None) -> Optional[PoolEvent]:
+    """Decode a pump.fun CreateEvent (name, symbol, uri, mint, bonding curve, user)"""
+    view = memoryview(data)
+    if len(view) < 8 or view[:8] != PUMPFUN_CREATE_EVENT:
+        return None
+    try:
+        name, offset = _string(view, 8)
+        symbol, offset = _string(view, offset)
+        uri, offset = _string(view, offset)
+        if offset + 96 > len(view):
+            return None
+        return PoolEvent(
+            platform="pumpfun",
+            signature=signature,
+            token_address=_pubkey(view, offset),
+            pool_address=_pubkey(view, offset + 32),
+            creator=_pubkey(view, offset + 64),
+            token_name=name,
+            token_symbol=symbol,
+            uri=uri
+        )
+    except (ValueError, struct.error):
+        return None
+
+def decode_pumpfun_trade(data: bytes) -> Optional[tuple]:
+    """Decode (mint, sol_amount, token_amount, is_buy) from a pump.fun TradeEvent"""
+    view = memoryview(data)
+    if len(view) < 8 + 32 + PUMPFUN_TRADE.size or view[:8] != PUMPFUN_TRADE_EVENT:
+        return None
+    sol_amount, token_amount, is_buy = PUMPFUN_TRADE.unpack_from(view, 40)
+    return _pubkey(view, 8), sol_amount, token_amount, is_buy
+
+def decode_pumpfun_logs(value: Dict[str, Any]) -> Optional[PoolEvent]:
+    """
+    Decode a pump.fun create from a logsNotification value
+
+    The creator's buy in the same transaction, if any, is used as the
+    initial liquidity.
+    """
+    if value.get("err") is not None:
+        return None
+
+    event = None
+    buys = []
+    for line in value.get("logs") or ():
+        if not line.startswith(_PROGRAM_DATA):
+            continue
+        try:
+            data = base64.b64decode(line[len(_PROGRAM_DATA):])
+        except ValueError:
+            continue
+        prefix = data[:8]
+        if prefix == PUMPFUN_CREATE_EVENT and event is None:
+            event = decode_pumpfun_create(data, value.get("signature"))
+        elif prefix == PUMPFUN_TRADE_EVENT:
+            trade = decode_pumpfun_trade(data)
+            if trade and trade[3]:
+                buys.append(trade)
+
+    if event is not None:
+        event.liquidity = sum(sol for mint, sol, _, _ in buys if mint == event.token_address) / 1e9
+    return event
+
+def decode_pumpfun_swaps(value: Dict[str, Any], wallets: Collection[str]) -> List[SwapEvent]:
+    """
+    pump.fun buys and sells by any of ``wallets`` in a logsNotification value
+
+    The TradeEvent names the trading user, so no transaction fetch is needed.
+    """
+    if value.get("err") is not None:
+        return []
+
+    swaps = []
+    for line in value.get("logs") or ():
+        if not line.startswith(_PROGRAM_DATA):
+            continue
+        try:
+            data = base64.b64decode(line[len(_PROGRAM_DATA):])
+        except ValueError:
+            continue
+        if data[:8] != PUMPFUN_TRADE_EVENT or len(data) < PUMPFUN_TRADE_USER + 32:
+            continue
+        mint, sol_amount, token_amount, is_buy = decode_pumpfun_trade(data)
+        user = _pubkey(memoryview(data), PUMPFUN_TRADE_USER)
+        if user in wallets:
+            swaps.append(SwapEvent(user, mint, is_buy, sol_amount, token_amount, value.get("signature")))
+    return swaps
+
+def invokes_swap_program(logs: Sequence[str]) -> bool:
+    """True if the logs show a top-level or inner call into a known swap program"""
+    for line in logs:
+        if line.startswith("Program ") and " invoke [" in line:
+            if line[8:line.index(" ", 8)] in SWAP_PROGRAMS:
+                return True
+    return False
+
+def _token_amount(info: Dict[str, Any]) -> int:
+    return int(info["tokenAmount"]["amount"] if "tokenAmount" in info else info["amount"])
+
+def decode_swap_transaction(tx: Dict[str, Any], wallets: Collection[str]) -> Optional[SwapEvent]:
+    """
+    Decode a wallet's swap from a jsonParsed getTransaction result
+
+    Token transfers are read from the top-level and inner instructions; the
+    token accounts' mints and owners come from the pre/post token balances.
+    The token whose balance changed most for the signing wallet is the one
+    swapped, and the direction follows the sign of that change. SOL spent or
+    received is the wallet's WSOL transfers when it routed through WSOL,
+    otherwise its lamport change net of the fee.
+
+    Args:
+        tx: getTransaction result (jsonParsed, maxSupportedTransactionVersion 0)
+        wallets: Wallets to look for among the signers
+
+    Returns:
+        SwapEvent, or None if no listed wallet swapped a token
+    """
+    meta = tx.get("meta") or {}
+    if meta.get("err") is not None:
+        return None
+    message = tx["transaction"]["message"]
+    keys = [key["pubkey"] if isinstance(key, dict) else key for key in message["accountKeys"]]
+    signers = [key["pubkey"] for key in message["accountKeys"] if isinstance(key, dict) and key.get("signer")]
+    wallet = next((key for key in signers or keys[:1] if key in wallets), None)
+    if wallet is None:
+        return None
+
+    # token account -> (mint, owner), and the wallet's holdings before the swap
+    accounts: Dict[str, tuple] = {}
+    held: Dict[str, int] = {}
+    for balance in meta.get("preTokenBalances") or ():
+        accounts[keys[balance["accountIndex"]]] = (balance["mint"], balance.get("owner"))
+        if balance.get("owner") == wallet:
+            held[balance["mint"]] = int(balance["uiTokenAmount"]["amount"])
+    for balance in meta.get("postTokenBalances") or ():
+        accounts.setdefault(keys[balance["accountIndex"]], (balance["mint"], balance.get("owner")))
+
+    instructions = list(message.get("instructions") or ())
+    for inner in meta.get("innerInstructions") or ():
+        instructions.extend(inner.get("instructions") or ())
+
+    deltas: Dict[str, int] = {}
+    for ix in instructions:
+        parsed = ix.get("parsed")
+        if ix.get("program") not in PARSED_TOKEN_PROGRAMS or not isinstance(parsed, dict):
+            continue
+        if parsed.get("type") not in ("transfer", "transferChecked"):
+            continue
+        info = parsed["info"]
+        source, destination = accounts.get(info.get("source")), accounts.get(info.get("destination"))
+        mint = info.get("mint") or (source or destination or (None,))[0]
+        if mint is None:
+            continue
+        amount = _token_amount(info)
+        if destination is not None and destination[1] == wallet:
+            deltas[mint] = deltas.get(mint, 0) + amount
+        sent = source[1] == wallet if source is not None else info.get("authority") == wallet
+        if sent:
+            deltas[mint] = deltas.get(mint, 0) - amount
+
+    wsol = deltas.pop(SOL_MINT, 0)
+    changed = [(mint, delta) for mint, delta in deltas.items() if delta]
+    if not changed:
+        return None
+    mint, delta = max(changed, key=lambda item: abs(item[1]))
+
+    if wsol:
+        sol_amount = abs(wsol)
+    else:
+        index = keys.index(wallet)
+        fee = meta.get("fee", 0) if index == 0 else 0
+        sol_amount = abs(meta["postBalances"][index] - meta["preBalances"][index] + fee)
+
+    is_buy = delta > 0
+    sold_fraction = None
+    if not is_buy and held.get(mint):
+        sold_fraction = min(1.0, -delta / held[mint])
+    signatures = tx["transaction"].get("signatures") or [None]
+    return SwapEvent(wallet, mint, is_buy, sol_amount, abs(delta), signatures[0], tx.get("slot"),
+                     sold_fraction, source="transaction")
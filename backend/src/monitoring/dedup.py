@@ -0,0 +1,68 @@
+"""
+Event Deduplication
+Time-bounded LRU set used to drop pool events that arrive more than once
+(several platforms, commitments, reconnect backfill or endpoints)
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+class TTLSet:
+    """LRU set whose entries expire after ``ttl`` seconds; never holds more than ``maxsize``"""
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, float]" = OrderedDict()
+
+    def _expire(self, now: float):
+        entries = self._entries
+        while entries:
+            key, added = next(iter(entries.items()))
+            if now - added < self.ttl:
+                break
+            entries.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        now = time.monotonic()
+        self._expire(now)
+        return key in self._entries
+
+    def add(self, key: Hashable):
+        now = time.monotonic()
+        self._expire(now)
+        self._entries[key] = now
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class EventDeduplicator:
+    """Drop events whose signature, pool address or mint was seen recently"""
+
+    KEYS = ("signature", "pool_address", "token_address")
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 600.0):
+        self.seen = TTLSet(maxsize, ttl)
+        self.duplicates = 0
+
+    def is_duplicate(self, event: Dict[str, Any]) -> bool:
+        """
+        Check an event and remember its keys
+
+        Returns:
+            True if any of signature, pool address or mint was already seen
+        """
+        keys = [(name, event[name]) for name in self.KEYS if event.get(name)]
+        duplicate = any(key in self.seen for key in keys)
+        for key in keys:
+            self.seen.add(key)
+        if duplicate:
+            self.duplicates += 1
+        return duplicate
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"tracked_keys": len(self.seen), "duplicates_dropped": self.duplicates}
@@ -0,0 +1,153 @@
+"""
+Pool Event Bus
+One shared set of pool monitors fanning new-pool events out to every
+subscribed sniper instance
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from monitoring.pool_monitor import PoolMonitor
+from monitoring.event_queue import BoundedEventQueue, DROP_OLDEST
+from monitoring.dedup import EventDeduplicator
+from monitoring.reconciler import CommitmentReconciler
+from monitoring.creator_index import CreatorIndex, get_creator_index
+
+class PoolEventBus:
+    """Run at most one monitor per platform and deliver each event to all subscribers"""
+
+    def __init__(
+        self,
+        monitor_factory: Callable[[str], Any] = PoolMonitor,
+        dedup: Optional[EventDeduplicator] = None,
+        reconciler: Optional[CommitmentReconciler] = None,
+        creators: Optional[CreatorIndex] = None
+    ):
+        self.monitor_factory = monitor_factory
+        # Same pool seen via several platforms, reconnect backfill or endpoints
+        self.dedup = dedup or EventDeduplicator()
+        # Follows live events to finalized; snipers listen for dropped ones
+        self.reconciler = reconciler or CommitmentReconciler()
+        # Every pool is counted against its creator once, before fan-out
+        self.creators = creators or get_creator_index()
+        self.monitors: Dict[str, Any] = {}
+        self._monitor_tasks: Dict[str, asyncio.Task] = {}
+        self._queues: Dict[str, BoundedEventQueue] = {}
+        self._platforms: Dict[str, Set[str]] = {}
+        self.events_published = 0
+
+    def subscribe(
+        self,
+        subscriber_id: str,
+        platforms: Iterable[str],
+        maxsize: int = 256,
+        policy: str = DROP_OLDEST,
+        min_liquidity: float = 0.0
+    ) -> BoundedEventQueue:
+        """
+        Register a subscriber and make sure its platforms are being monitored
+
+        Args:
+            subscriber_id: Unique subscriber key (e.g. the sniper id)
+            platforms: Platforms whose events the subscriber wants
+            maxsize: Queue bound; publishing never waits on a slow subscriber
+            policy: Overflow policy of the subscriber's queue
+            min_liquidity: Threshold for the "drop_below_liquidity" policy
+
+        Returns:
+            Bounded queue receiving the subscriber's pool events
+        """
+        if subscriber_id in self._queues:
+            raise Exception(f"Subscriber {subscriber_id} already registered")
+
+        queue = BoundedEventQueue(maxsize, policy, min_liquidity)
+        self._queues[subscriber_id] = queue
+        self._platforms[subscriber_id] = set(platforms)
+
+        for platform in self._platforms[subscriber_id]:
+            self._ensure_monitor(platform)
+
+        return queue
+
+    async def unsubscribe(self, subscriber_id: str):
+        """Remove a subscriber and stop monitors nobody needs anymore"""
+        self._queues.pop(subscriber_id, None)
+        self._platforms.pop(subscriber_id, None)
+
+        wanted = set().union(*self._platforms.values()) if self._platforms else set()
+        for platform in list(self.monitors):
+            if platform not in wanted:
+                await self._stop_monitor(platform)
+
+    async def publish(self, pool_data: Dict[str, Any]):
+        """Deliver one event to every subscriber of its platform, once"""
+        if self.dedup.is_duplicate(pool_data):
+            return
+        self.events_published += 1
+        self.creators.record_launch(pool_data)
+        if pool_data.get("commitment") and not pool_data.get("backfilled"):
+            self.reconciler.track(pool_data)
+        platform = pool_data.get("platform")
+        for subscriber_id, queue in list(self._queues.items()):
+            if platform in self._platforms.get(subscriber_id, ()):
+                # Each subscriber gets its own copy: handlers annotate events
+                event = dict(pool_data)
+                if "trace" in event:
+                    event["trace"] = dict(event["trace"])
+                queue.put_nowait(event)
+
+    def _ensure_monitor(self, platform: str):
+        task = self._monitor_tasks.get(platform)
+        if task is not None and not task.done():
+            return
+
+        monitor = self.monitor_factory(platform)
+        self.monitors[platform] = monitor
+        self._monitor_tasks[platform] = asyncio.create_task(monitor.start(self.publish))
+
+    async def _stop_monitor(self, platform: str):
+        monitor = self.monitors.pop(platform, None)
+        task = self._monitor_tasks.pop(platform, None)
+
+        if monitor:
+            await monitor.disconnect()
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def stop(self):
+        """Stop every monitor and drop all subscribers"""
+        self._queues.clear()
+        self._platforms.clear()
+        for platform in list(self.monitors):
+            await self._stop_monitor(platform)
+        await self.reconciler.stop()
+        await self.creators.flush_async()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "platforms": sorted(self.monitors),
+            "subscribers": len(self._queues),
+            "events_published": self.events_published,
+            "dedup": self.dedup.get_stats(),
+            "reconciler": self.reconciler.get_stats(),
+            "creators": self.creators.get_stats(),
+            "queues": {subscriber_id: queue.get_stats() for subscriber_id, queue in self._queues.items()}
+        }
+
+
+# Singleton
+_pool_event_bus: Optional[PoolEventBus] = None
+
+def get_pool_event_bus():
+    global _pool_event_bus
+    if _pool_event_bus is None:
+        _pool_event_bus = PoolEventBus()
+    return _pool_event_bus
@@ -0,0 +1,117 @@
+"""
+Bounded Event Queue
+Decouples reading pool events from handling them, with overflow policies
+and depth / queueing-delay metrics
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.timing import percentile
+
+DROP_OLDEST = "drop_oldest"
+DROP_BELOW_LIQUIDITY = "drop_below_liquidity"
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_BELOW_LIQUIDITY)
+
+# Queueing delays kept for percentile metrics
+DELAY_WINDOW = 1000
+
+class BoundedEventQueue:
+    """Bounded FIFO of pool events; ``put`` never blocks the reader"""
+
+    def __init__(self, maxsize: int = 256, policy: str = DROP_OLDEST, min_liquidity: float = 0.0):
+        """
+        Args:
+            maxsize: Maximum queued events
+            policy: What to evict when full: "drop_oldest", or
+                "drop_below_liquidity" which first evicts events under
+                ``min_liquidity`` and falls back to the oldest
+            min_liquidity: Threshold (SOL) for "drop_below_liquidity"
+        """
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+        self.min_liquidity = min_liquidity
+        self._items: Deque[Tuple[float, Dict[str, Any]]] = deque()
+        self._ready = asyncio.Event()
+
+        self.enqueued = 0
+        self.dequeued = 0
+        self.dropped: Dict[str, int] = {"oldest": 0, "below_liquidity": 0}
+        self.max_depth = 0
+        self._delays: Deque[float] = deque(maxlen=DELAY_WINDOW)
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def put_nowait(self, event: Dict[str, Any]) -> bool:
+        """
+        Enqueue an event, evicting per the overflow policy when full
+
+        Returns:
+            False if the new event itself was dropped
+        """
+        if len(self._items) >= self.maxsize and not self._make_room(event):
+            return False
+
+        self._items.append((time.perf_counter(), event))
+        self.enqueued += 1
+        self.max_depth = max(self.max_depth, len(self._items))
+        self._ready.set()
+        return True
+
+    def _make_room(self, event: Dict[str, Any]) -> bool:
+        if self.policy == DROP_BELOW_LIQUIDITY:
+            for index, (_, queued) in enumerate(self._items):
+                if queued.get("liquidity", 0) < self.min_liquidity:
+                    del self._items[index]
+                    self.dropped["below_liquidity"] += 1
+                    return True
+            if event.get("liquidity", 0) < self.min_liquidity:
+                self.dropped["below_liquidity"] += 1
+                return False
+
+        self._items.popleft()
+        self.dropped["oldest"] += 1
+        return True
+
+    async def get(self) -> Dict[str, Any]:
+        """Wait for the next event; its queueing delay is recorded and attached"""
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+
+        enqueued_at, event = self._items.popleft()
+        dequeued_at = time.perf_counter()
+        delay_ms = (dequeued_at - enqueued_at) * 1000
+        if "trace" in event:
+            event["trace"]["dequeued"] = dequeued_at
+        self._delays.append(delay_ms)
+        self.dequeued += 1
+        event["queue_delay_ms"] = round(delay_ms, 3)
+        return event
+
+    def get_stats(self) -> Dict[str, Any]:
+        delays: List[float] = list(self._delays)
+        return {
+            "depth": len(self._items),
+            "max_depth": self.max_depth,
+            "maxsize": self.maxsize,
+            "policy": self.policy,
+            "enqueued": self.enqueued,
+            "dequeued": self.dequeued,
+            "dropped": dict(self.dropped),
+            "queue_delay_ms": {
+                "p50": round(percentile(delays, 50), 3),
+                "p95": round(percentile(delays, 95), 3),
+                "p99": round(percentile(delays, 99), 3),
+                "max": round(max(delays), 3)
+            } if delays else {}
+        }
@@ -1,151 +1,275 @@
 import asyncio
-import websockets
-import json
+import base64
+import time
 from typing import Callable, Optional, Dict, Any
-from datetime import datetime
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import WS_ENDPOINT
+from config import POOL_COMMITMENT
+from core.rpc import AsyncRpc, get_async_rpc
+from monitoring.ws_mux import WebSocketMux, get_ws_mux
+from monitoring.slot_clock import get_slot_clock
+from monitoring.decoders import (
+    PoolEvent,
+    RAYDIUM_AMM_V4,
+    PUMPFUN_PROGRAM,
+    decode_pumpfun_logs,
+    decode_raydium_transaction,
+    raydium_init_from_logs,
+)
+
+# Program each platform's new pools are created by
+PROGRAM_IDS = {
+    "raydium": RAYDIUM_AMM_V4,  # Raydium V4 AMM
+    "pumpfun": PUMPFUN_PROGRAM,  # pump.fun bonding curve
+    "orca": "whirLbMiicVdio4qvUfM5KAg6Ct8VwpYzGff3uctyCc",  # Orca Whirlpools
+}
+
+# Polling for a processed Raydium creation's transaction (~one slot apart)
+RAYDIUM_TX_ATTEMPTS = 10
+RAYDIUM_TX_RETRY_DELAY = 0.4
+
+# getSignaturesForAddress page size (the RPC maximum)
+SIGNATURE_PAGE_SIZE = 1000
 
 class PoolMonitor:
     """Monitor new liquidity pools on Solana DEXs"""
     
-    def __init__(self, platform: str = "raydium"):
+    def __init__(
+        self,
+        platform: str = "raydium",
+        mux: Optional[WebSocketMux] = None,
+        rpc: Optional[AsyncRpc] = None,
+        commitment: Optional[str] = None
+    ):
         self.platform = platform
-        self.ws_url = WS_ENDPOINT
+        self.mux = mux or get_ws_mux()
+        self.rpc = rpc or get_async_rpc()
+        # "processed" acts on pools before they are confirmed (fast mode);
+        # the event bus reconciles them afterwards
+        self.commitment = commitment or POOL_COMMITMENT
         self.is_running = False
         self.on_new_pool: Optional[Callable] = None
-        self.websocket = None
+        self.subscription = None
+        self._stopped = asyncio.Event()
+        # Newest signature seen on the program; backfill resumes from here
+        self.last_signature: Optional[str] = None
+        self.backfilled_pools = 0
+        # Backfills that hit max_signatures; their oldest missed pools were not replayed
+        self.backfill_truncations = 0
+        self._backfilling = asyncio.Lock()
+        # Decodes that need an RPC round trip run off the socket reader
+        self._decoding = set()
     
-    async def connect(self):
-        """Connect to WebSocket"""
+    async def subscribe_to_pools(self) -> bool:
+        """Subscribe to the platform program's logs on the shared multiplexed connection"""
+        params = [
+            {"mentions": [PROGRAM_IDS.get(self.platform, PROGRAM_IDS["raydium"])]},
+            {"commitment": self.commitment}
+        ]
+        
         try:
-            self.websocket = await websockets.connect(self.ws_url)
+            self.subscription = await self.mux.subscribe(
+                "logsSubscribe", params, self._on_notification, on_reconnect=self.backfill
+            )
             self.is_running = True
-            print(f"✓ Connected to {self.platform} pool monitor")
+            print(f"✓ Subscribed to {self.platform} pools ({self.commitment})")
             return True
         except Exception as e:
-            print(f"✗ Failed to connect: {e}")
+            print(f"✗ Subscription failed: {e}")
             return False
     
-    async def subscribe_to_pools(self):
-        """Subscribe to new pool events"""
-        if not self.websocket:
-            print("Not connected to WebSocket")
+    async def _on_notification(self, result: Dict[str, Any]):
+        """Handle one notification routed to this monitor by the multiplexer"""
+        if not self.is_running:
             return
         
-        # Subscribe to account updates for Raydium/Orca/etc
-        # This is a simplified version - in production you'd subscribe to specific program IDs
-        subscription = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "programSubscribe",
-            "params": [
-                "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8",  # Raydium V4 program
-                {
-                    "encoding": "jsonParsed",
-                    "commitment": "finalized"
-                }
-            ]
-        }
+        signature = (result.get("value") or {}).get("signature")
+        if signature:
+            self.last_signature = signature
+        # Every program notification carries the current slot
+        get_slot_clock().observe((result.get("context") or {}).get("slot"))
         
+        if self.platform == "raydium":
+            # Raydium decoding fetches the transaction; keep reading meanwhile
+            task = asyncio.create_task(self._handle(result))
+            self._decoding.add(task)
+            task.add_done_callback(self._decoding.discard)
+        else:
+            await self._handle(result)
+    
+    async def _handle(self, result: Dict[str, Any]):
+        detected_at = time.time()
+        decode_started = time.perf_counter()
         try:
-            await self.websocket.send(json.dumps(subscription))
-            print(f"✓ Subscribed to {self.platform} pools")
+            pool_data = await self._parse_pool_data(result)
         except Exception as e:
-            print(f"✗ Subscription failed: {e}")
-    
-    async def listen(self):
-        """Listen for new pool events"""
-        if not self.websocket:
-            print("Not connected")
+            print(f"Error decoding {self.platform} notification: {e}")
             return
         
-        print(f"👂 Listening for new {self.platform} pools...")
+        if pool_data and self.on_new_pool:
+            pool_data["backfilled"] = False
+            pool_data["commitment"] = self.commitment
+            pool_data["detected_at"] = detected_at
+            # perf_counter() stamps of the latency trace
+            pool_data["trace"] = {
+                "received": result.get("received_at") or decode_started,
+                "decoded": time.perf_counter()
+            }
+            await self.on_new_pool(pool_data)
+    
+    async def backfill(self, max_signatures: int = 5000):
+        """
+        Replay pool creations missed while the socket was down
         
-        try:
-            async for message in self.websocket:
-                if not self.is_running:
+        Walks getSignaturesForAddress on the program back to the last
+        signature seen live, fetches those transactions in batches and emits
+        any pool creations oldest first with ``backfilled`` set, so the
+        sniper can apply its staleness policy. A gap longer than
+        ``max_signatures`` keeps only its newest part; the truncation is
+        logged and counted in ``backfill_truncations``.
+        """
+        if self.last_signature is None or not self.is_running:
+            return
+        
+        async with self._backfilling:
+            program = PROGRAM_IDS.get(self.platform, PROGRAM_IDS["raydium"])
+            until = self.last_signature
+            signatures = []
+            before = None
+            while True:
+                config = {"until": until, "limit": SIGNATURE_PAGE_SIZE, "commitment": "confirmed"}
+                if before:
+                    config["before"] = before
+                page = await self.rpc.call("getSignaturesForAddress", [program, config])
+                if not page:
                     break
-                
-                try:
-                    data = json.loads(message)
-                    
-                    # Parse pool data
-                    # In production, you'd properly parse the account data
-                    # For now, create mock pool data
-                    if "result" in data or "params" in data:
-                        pool_data = self._parse_pool_data(data)
-                        
-                        if pool_data and self.on_new_pool:
-                            await self.on_new_pool(pool_data)
-                
-                except json.JSONDecodeError:
+                signatures.extend(item["signature"] for item in page if item.get("err") is None)
+                before = page[-1]["signature"]
+                if len(page) < SIGNATURE_PAGE_SIZE:
+                    break
+                if len(signatures) >= max_signatures:
+                    self.backfill_truncations += 1
+                    print(f"⚠ {self.platform} backfill stopped at {len(signatures)} signatures; "
+                          f"older missed pools were not replayed")
+                    break
+            
+            if not signatures:
+                return
+            print(f"↻ Backfilling {len(signatures)} {self.platform} transactions")
+            
+            # Newest first from the RPC; replay oldest first
+            signatures.reverse()
+            # Live notifications may have moved past the backfill meanwhile
+            if self.last_signature == until:
+                self.last_signature = signatures[-1]
+            config = {"encoding": "base64", "commitment": "confirmed", "maxSupportedTransactionVersion": 0}
+            transactions = await self.rpc.batch([("getTransaction", [sig, config]) for sig in signatures])
+            
+            for signature, tx in zip(signatures, transactions):
+                if not isinstance(tx, dict):
                     continue
+                meta = tx.get("meta") or {}
+                result = {
+                    "context": {"slot": tx.get("slot")},
+                    "value": {"signature": signature, "err": meta.get("err"), "logs": meta.get("logMessages") or []}
+                }
+                try:
+                    pool_data = await self._parse_pool_data(result, transaction=tx)
                 except Exception as e:
-                    print(f"Error processing message: {e}")
-        
-        except websockets.exceptions.ConnectionClosed:
-            print("WebSocket connection closed")
-            self.is_running = False
-        except Exception as e:
-            print(f"Error listening: {e}")
-            self.is_running = False
+                    print(f"Error decoding backfilled {self.platform} transaction: {e}")
+                    continue
+                
+                if pool_data and self.on_new_pool:
+                    pool_data["backfilled"] = True
+                    pool_data["commitment"] = "confirmed"
+                    pool_data["block_time"] = tx.get("blockTime")
+                    self.backfilled_pools += 1
+                    await self.on_new_pool(pool_data)
     
-    def _parse_pool_data(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Parse pool data from WebSocket message"""
-        # This is a mock parser - in production you'd parse actual Raydium/Orca data
-        # For demo purposes, return mock data occasionally
+    async def _parse_pool_data(self, result: Dict[str, Any],
+                               transaction: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Decode a logsNotification into pool data, or None if it is not a pool creation
         
-        import random
-        if random.random() < 0.1:  # 10% chance to simulate new pool
-            return {
-                "platform": self.platform,
-                "token_address": f"Mock{random.randint(1000, 9999)}Token",
-                "pool_address": f"Pool{random.randint(1000, 9999)}",
-                "liquidity": random.uniform(1, 100),
-                "token_symbol": f"TKN{random.randint(1, 999)}",
-                "token_name": f"Test Token {random.randint(1, 999)}",
-                "creator": f"Creator{random.randint(1, 100)}",
-                "timestamp": datetime.utcnow().isoformat()
-            }
+        pump.fun creates decode from the logs alone. Raydium logs only carry
+        the initial amounts, so the mints are read from the transaction itself
+        (``transaction`` when it was already fetched, e.g. during backfill).
+        """
+        value = result.get("value") or {}
+        if value.get("err") is not None:
+            return None
+        slot = (result.get("context") or {}).get("slot")
+        
+        if self.platform == "pumpfun":
+            event = decode_pumpfun_logs(value)
+        elif self.platform == "raydium":
+            init_log = raydium_init_from_logs(value.get("logs") or ())
+            if init_log is None:
+                return None
+            event = await self._fetch_raydium_pool(value["signature"], init_log, transaction)
+        else:
+            # No pool-creation decoder for this platform yet
+            return None
         
-        return None
+        if event is None:
+            return None
+        event.slot = slot
+        return event.as_dict()
+    
+    async def _fetch_raydium_pool(self, signature: str, init_log,
+                                  tx: Optional[Dict[str, Any]] = None) -> Optional[PoolEvent]:
+        config = {"encoding": "base64", "commitment": "confirmed", "maxSupportedTransactionVersion": 0}
+        # getTransaction serves confirmed transactions at the earliest, so a
+        # processed notification waits briefly for its transaction
+        attempts = RAYDIUM_TX_ATTEMPTS if self.commitment == "processed" else 1
+        for attempt in range(attempts):
+            if tx is not None:
+                break
+            if attempt:
+                await asyncio.sleep(RAYDIUM_TX_RETRY_DELAY)
+            tx = await self.rpc.call("getTransaction", [signature, config])
+        if not tx:
+            return None
+        loaded = (tx.get("meta") or {}).get("loadedAddresses")
+        return decode_raydium_transaction(base64.b64decode(tx["transaction"][0]), loaded, init_log)
     
     async def disconnect(self):
-        """Disconnect from WebSocket"""
+        """Drop this monitor's subscription; the shared connection stays open"""
         self.is_running = False
-        if self.websocket:
-            await self.websocket.close()
+        self._stopped.set()
+        if self.subscription is not None:
+            await self.mux.unsubscribe(self.subscription)
+            self.subscription = None
             print(f"✓ Disconnected from {self.platform} monitor")
     
     async def start(self, on_new_pool: Callable):
-        """Start monitoring pools"""
+        """Start monitoring pools and run until disconnected"""
         self.on_new_pool = on_new_pool
         
-        if await self.connect():
-            await self.subscribe_to_pools()
-            await self.listen()
+        if await self.subscribe_to_pools():
+            print(f"👂 Listening for new {self.platform} pools...")
+            await self._stopped.wait()
 
 # Convenience class for multi-platform monitoring
 class MultiPlatformMonitor:
     """Monitor multiple DEX platforms simultaneously"""
     
-    def __init__(self, platforms: list = None):
+    def __init__(self, platforms: list = None, mux: Optional[WebSocketMux] = None):
         self.platforms = platforms or ["raydium", "orca", "pumpfun"]
+        self.mux = mux or get_ws_mux()
         self.monitors = {}
         self.is_running = False
     
     async def start(self, on_new_pool: Callable):
-        """Start monitoring all platforms"""
+        """Start monitoring all platforms over one multiplexed connection"""
         self.is_running = True
         
         tasks = []
         for platform in self.platforms:
-            monitor = PoolMonitor(platform)
+            monitor = PoolMonitor(platform, self.mux)
             self.monitors[platform] = monitor
             tasks.append(asyncio.create_task(monitor.start(on_new_pool)))
         
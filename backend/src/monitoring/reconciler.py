@@ -0,0 +1,161 @@
+"""
+Commitment Reconciler
+Follows pool events detected at ``processed`` commitment until they are
+finalized, reports events that were dropped, and measures how long each
+commitment level takes to see a pool
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.rpc import AsyncRpc, RpcError, get_async_rpc
+from utils.timing import summarize
+
+LEVELS = ("processed", "confirmed", "finalized")
+
+# getSignatureStatuses accepts at most 256 signatures per call
+STATUS_BATCH = 256
+
+# Latency samples kept for the stats
+SAMPLE_WINDOW = 1000
+
+class TrackedEvent:
+    """One live pool event waiting to be finalized"""
+
+    __slots__ = ("signature", "event", "slot", "seen", "tracked_at")
+
+    def __init__(self, event: Dict[str, Any]):
+        self.signature = event["signature"]
+        self.event = event
+        self.slot = event.get("slot")
+        # Wall-clock time each commitment level was observed
+        level = event.get("commitment") or "processed"
+        self.seen: Dict[str, float] = {level: event.get("detected_at") or time.time()}
+        self.tracked_at = time.monotonic()
+
+class CommitmentReconciler:
+    """Poll signature statuses of live events and notify listeners about drops"""
+
+    def __init__(self, rpc: Optional[AsyncRpc] = None, interval: float = 0.4, drop_after: float = 60.0):
+        """
+        Args:
+            rpc: Async RPC client used for status polling
+            interval: Seconds between status polls
+            drop_after: Seconds without reaching ``confirmed`` before an event
+                counts as dropped (its fork was abandoned)
+        """
+        self.rpc = rpc or get_async_rpc()
+        self.interval = interval
+        self.drop_after = drop_after
+        self._pending: Dict[str, TrackedEvent] = {}
+        self._listeners: List[Callable] = []
+        self._task: Optional[asyncio.Task] = None
+
+        self.tracked = 0
+        self.finalized = 0
+        self.dropped = 0
+        self._samples: Deque[Dict[str, float]] = deque(maxlen=SAMPLE_WINDOW)
+
+    def add_listener(self, callback: Callable):
+        """Register ``async callback(event)`` called for every dropped event"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def track(self, event: Dict[str, Any]):
+        """Start following a live event by its signature"""
+        if not event.get("signature") or event["signature"] in self._pending:
+            return
+        self._pending[event["signature"]] = TrackedEvent(event)
+        self.tracked += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while self._pending:
+            await asyncio.sleep(self.interval)
+            try:
+                await self._tick()
+            except Exception as e:
+                print(f"Reconciler poll failed: {e}")
+
+    async def _tick(self):
+        signatures = list(self._pending)
+        batches = [signatures[i:i + STATUS_BATCH] for i in range(0, len(signatures), STATUS_BATCH)]
+        responses = await self.rpc.batch([("getSignatureStatuses", [batch]) for batch in batches])
+
+        now = time.time()
+        for batch, response in zip(batches, responses):
+            statuses = [None] * len(batch) if isinstance(response, RpcError) else response["value"]
+            for signature, status in zip(batch, statuses):
+                tracked = self._pending.get(signature)
+                if tracked is None:
+                    continue
+                if status and status.get("err") is not None:
+                    await self._drop(tracked, "failed")
+                elif status:
+                    self._advance(tracked, status.get("confirmationStatus"), now)
+                elif "confirmed" not in tracked.seen and time.monotonic() - tracked.tracked_at > self.drop_after:
+                    await self._drop(tracked, "not_confirmed")
+
+        for tracked in [t for t in self._pending.values() if "finalized" in t.seen]:
+            # Record the sample before the event stops counting as pending
+            await self._finish(tracked)
+            self._pending.pop(tracked.signature, None)
+
+    def _advance(self, tracked: TrackedEvent, level: Optional[str], now: float):
+        if level not in LEVELS:
+            return
+        for reached in LEVELS[:LEVELS.index(level) + 1]:
+            tracked.seen.setdefault(reached, now)
+
+    async def _finish(self, tracked: TrackedEvent):
+        self.finalized += 1
+        block_time = tracked.event.get("block_time")
+        if block_time is None and tracked.slot is not None:
+            try:
+                block_time = await self.rpc.call("getBlockTime", [tracked.slot])
+            except Exception:
+                block_time = None
+        if block_time:
+            # Block times have one-second resolution
+            self._samples.append({level: (seen - block_time) * 1000 for level, seen in tracked.seen.items()})
+
+    async def _drop(self, tracked: TrackedEvent, reason: str):
+        self._pending.pop(tracked.signature, None)
+        self.dropped += 1
+        event = dict(tracked.event, dropped_reason=reason)
+        print(f"⚠️ Dropped pool event {tracked.signature[:16]}... ({reason})")
+        for listener in list(self._listeners):
+            try:
+                await listener(event)
+            except Exception as e:
+                print(f"Reconciler listener failed: {e}")
+
+    async def stop(self):
+        self._pending.clear()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counts plus detection latency (ms after block time) per commitment level"""
+        return {
+            "tracked": self.tracked,
+            "pending": len(self._pending),
+            "finalized": self.finalized,
+            "dropped": self.dropped,
+            "detection_latency_ms": summarize(list(self._samples))
+        }
@@ -0,0 +1,76 @@
+"""
+WebSocket Message Recorder
+Append raw WebSocket messages with their receive timestamps to a compact
+gzip file, so live traffic can be replayed later through the monitor and
+sniper (see benchmarks/replay.py)
+
+Each record is a little-endian (float64 wall-clock receive time, uint32
+length) header followed by the raw message bytes. Every session appends a
+new gzip member, so one file accumulates several sessions.
+"""
+
+import gzip
+import struct
+import time
+import zlib
+from typing import Iterator, Optional, Tuple, Union
+
+RECORD_HEADER = struct.Struct("<dI")
+
+class MessageRecorder:
+    """Append-only recorder of raw WebSocket messages"""
+
+    def __init__(self, path: str, flush_every: int = 100):
+        """
+        Args:
+            path: Recording file; appended to if it exists
+            flush_every: Sync-flush the compressor every N records so a
+                crash loses at most that many messages
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self.records = 0
+        self._file: Optional[gzip.GzipFile] = None
+
+    def record(self, message: Union[str, bytes], received_at: Optional[float] = None):
+        """
+        Append one message
+
+        Args:
+            message: Raw message as read from the socket
+            received_at: time.time() the message was received (now if omitted)
+        """
+        if self._file is None:
+            self._file = gzip.open(self.path, "ab")
+        payload = message.encode() if isinstance(message, str) else message
+        self._file.write(RECORD_HEADER.pack(received_at or time.time(), len(payload)))
+        self._file.write(payload)
+        self.records += 1
+        if self.records % self.flush_every == 0:
+            self._file.flush(zlib.Z_SYNC_FLUSH)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+def read_recording(path: str) -> Iterator[Tuple[float, str]]:
+    """
+    Yield (received_at, message) from a recording, oldest first
+
+    A recording cut off mid-record (e.g. the process was killed) ends at the
+    last complete record.
+    """
+    with gzip.open(path, "rb") as f:
+        while True:
+            try:
+                header = f.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    return
+                received_at, length = RECORD_HEADER.unpack(header)
+                payload = f.read(length)
+            except (EOFError, zlib.error):
+                return
+            if len(payload) < length:
+                return
+            yield received_at, payload.decode()
@@ -0,0 +1,30 @@
+"""
+Slot Clock
+Latest slot seen on the monitors' notifications, so the sniper can note the
+current slot without an RPC call
+"""
+
+import time
+from typing import Optional
+
+class SlotClock:
+    """Track the highest slot observed and when it was observed"""
+
+    def __init__(self):
+        self.slot: Optional[int] = None
+        self.observed_at: Optional[float] = None
+
+    def observe(self, slot: Optional[int]):
+        if slot is not None and (self.slot is None or slot > self.slot):
+            self.slot = slot
+            self.observed_at = time.perf_counter()
+
+
+# Singleton
+_slot_clock: Optional[SlotClock] = None
+
+def get_slot_clock():
+    global _slot_clock
+    if _slot_clock is None:
+        _slot_clock = SlotClock()
+    return _slot_clock
@@ -1,59 +1,332 @@
-from typing import Dict, Any, Optional
-from solana.rpc.api import Client
-from solders.pubkey import Pubkey
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import RPC_ENDPOINT
+from solders.pubkey import Pubkey
+
+from core.rpc import AsyncRpc, get_async_rpc
+from monitoring.decoders import PUMPFUN_PROGRAM
+from utils.token_layout import MintInfo, decode_mint
+
+# getMultipleAccounts accepts at most 100 addresses
+MAX_MINT_BATCH = 100
+
+# Owners whose balances are not holders: pool vault authorities and burn addresses
+EXCLUDED_OWNERS = frozenset({
+    "5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1",  # Raydium AMM v4 authority
+    "GpMZbSM2GgvTKHJirzeGfMFoaZ8UR2X7F4v8vHTvxFbL",  # Raydium CPMM authority
+    "1nc1nerator11111111111111111111111111111111",  # Incinerator
+    "11111111111111111111111111111111",  # System program (unspendable)
+})
+
+def pumpfun_bonding_curve(token_address: str) -> str:
+    """pump.fun bonding curve PDA, which holds the unsold supply of a mint"""
+    pda, _ = Pubkey.find_program_address(
+        [b"bonding-curve", bytes(Pubkey.from_string(token_address))],
+        Pubkey.from_string(PUMPFUN_PROGRAM)
+    )
+    return str(pda)
+
+def holder_distribution(
+    accounts: List[Tuple[str, int]],
+    supply: int,
+    excluded_owners: frozenset = EXCLUDED_OWNERS,
+    limit: int = 10
+) -> Dict[str, Any]:
+    """
+    Concentration of the largest holders
+
+    Args:
+        accounts: (owner, raw amount) of the largest token accounts
+        supply: Raw mint supply
+        excluded_owners: Pool vaults and burn addresses left out of the figures
+        limit: Holders listed in the result
+
+    Returns:
+        {"holders": [{"address", "percentage"}], "top_1_pct", "top_5_pct",
+        "top_10_pct", "hhi"} with percentages of the circulating supply
+        (supply minus excluded balances). ``hhi`` is the Herfindahl-Hirschman
+        index (0-10000) over the listed accounts, a lower bound of the full index.
+    """
+    by_owner: Dict[str, int] = {}
+    excluded = 0
+    for owner, amount in accounts:
+        if owner in excluded_owners:
+            excluded += amount
+        else:
+            by_owner[owner] = by_owner.get(owner, 0) + amount
+
+    circulating = supply - excluded
+    if circulating <= 0:
+        return {"holders": [], "top_1_pct": 0.0, "top_5_pct": 0.0, "top_10_pct": 0.0, "hhi": 0.0}
+
+    scale = 100.0 / circulating
+    ranked = sorted(((amount * scale, owner) for owner, amount in by_owner.items()), reverse=True)
+    shares = [pct for pct, _ in ranked]
+    return {
+        "holders": [{"address": owner, "percentage": round(pct, 4)} for pct, owner in ranked[:limit]],
+        "top_1_pct": round(sum(shares[:1]), 4),
+        "top_5_pct": round(sum(shares[:5]), 4),
+        "top_10_pct": round(sum(shares[:10]), 4),
+        "hhi": round(sum(pct * pct for pct in shares), 2)
+    }
+
+class MintLoader:
+    """Coalesce concurrent mint lookups into batched getMultipleAccounts calls"""
+    
+    def __init__(self, rpc: Optional[AsyncRpc] = None, window: float = 0.002, max_batch: int = MAX_MINT_BATCH):
+        """
+        Args:
+            rpc: Async RPC client
+            window: Seconds to wait for more lookups before sending a batch
+            max_batch: Lookups that trigger an immediate batch
+        """
+        self.rpc = rpc or get_async_rpc()
+        self.window = window
+        self.max_batch = max_batch
+        self._waiting: Dict[Tuple[str, str], List[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.mints_loaded = 0
+    
+    async def load(self, mint: str, commitment: str = "confirmed") -> Optional[MintInfo]:
+        """Decoded mint, or None if the account is missing (at ``commitment``) or not a mint"""
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.setdefault((mint, commitment), []).append(future)
+        
+        if len(self._waiting) >= self.max_batch:
+            asyncio.create_task(self._flush())
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+        return await future
+    
+    async def load_many(self, mints: List[str], commitment: str = "confirmed") -> List[Optional[MintInfo]]:
+        return list(await asyncio.gather(*[self.load(mint, commitment) for mint in mints]))
+    
+    async def _flush_later(self):
+        await asyncio.sleep(self.window)
+        self._timer = None
+        await self._flush()
+    
+    async def _flush(self):
+        waiting, self._waiting = self._waiting, {}
+        if not waiting:
+            return
+        
+        # One batch per commitment level among the waiting lookups
+        batches: Dict[str, List[str]] = {}
+        for mint, commitment in waiting:
+            batches.setdefault(commitment, []).append(mint)
+        await asyncio.gather(*[self._load_batch(mints, commitment, waiting) for commitment, mints in batches.items()])
+    
+    async def _load_batch(self, mints: List[str], commitment: str,
+                          waiting: Dict[Tuple[str, str], List[asyncio.Future]]):
+        self.batches += 1
+        self.mints_loaded += len(mints)
+        try:
+            accounts = await self.rpc.get_multiple_accounts(mints, commitment=commitment)
+        except Exception as e:
+            for mint in mints:
+                for future in waiting[(mint, commitment)]:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        
+        for mint, account in zip(mints, accounts):
+            info = decode_mint(account["data"], account["owner"]) if account else None
+            for future in waiting[(mint, commitment)]:
+                if not future.done():
+                    future.set_result(info)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "mints_loaded": self.mints_loaded,
+            "avg_batch_size": round(self.mints_loaded / self.batches, 2) if self.batches else 0
+        }
+
+class AnalysisCache:
+    """LRU cache of analysis inputs, each entry with its own expiry"""
+    
+    def __init__(
+        self,
+        maxsize: int = 5000,
+        renounced_ttl: float = 3600.0,
+        authority_ttl: float = 30.0,
+        holders_ttl: float = 5.0,
+        negative_ttl: float = 10.0
+    ):
+        """
+        Args:
+            maxsize: Entries kept before the least recently used is evicted
+            renounced_ttl: Mints with both authorities renounced (they cannot come back)
+            authority_ttl: Mints that still have an authority (may be renounced soon)
+            holders_ttl: Holder distribution, which moves with every trade
+            negative_ttl: Failed lookups, so they are not retried in a loop
+        """
+        self.maxsize = maxsize
+        self.renounced_ttl = renounced_ttl
+        self.authority_ttl = authority_ttl
+        self.holders_ttl = holders_ttl
+        self.negative_ttl = negative_ttl
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        self.evictions = 0
+    
+    def get(self, field: str, token_address: str) -> Tuple[bool, Any]:
+        """Returns (hit, value)"""
+        key = (field, token_address)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses[field] = self.misses.get(field, 0) + 1
+            return False, None
+        
+        self._entries.move_to_end(key)
+        self.hits[field] = self.hits.get(field, 0) + 1
+        return True, entry[1]
+    
+    def put(self, field: str, token_address: str, value: Any, ttl: float):
+        key = (field, token_address)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def mint_ttl(self, mint: MintInfo) -> float:
+        if mint.mint_authority is None and mint.freeze_authority is None:
+            return self.renounced_ttl
+        return self.authority_ttl
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        fields = {}
+        for field in set(self.hits) | set(self.misses):
+            hits, misses = self.hits.get(field, 0), self.misses.get(field, 0)
+            fields[field] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses) * 100, 2) if hits + misses else 0
+            }
+        return {"size": len(self._entries), "maxsize": self.maxsize, "evictions": self.evictions, "fields": fields}
 
 class TokenAnalyzer:
     """Analyze token safety and characteristics"""
     
-    def __init__(self):
-        self.client = Client(RPC_ENDPOINT)
+    def __init__(self, rpc: Optional[AsyncRpc] = None, cache: Optional[AnalysisCache] = None):
+        self.rpc = rpc or get_async_rpc()
+        # Mints of simultaneously analyzed tokens share one request
+        self.mints = MintLoader(self.rpc)
+        # Shared by /trade/analyze, the snipers and bulk flows via get_token_analyzer()
+        self.cache = cache or AnalysisCache()
     
-    def check_mint_authority(self, token_address: str) -> bool:
+    async def fetch_mint(self, token_address: str, commitment: str = "confirmed") -> Optional[MintInfo]:
+        """
+        Fetch and decode the mint account (None if missing or not a mint)
+        
+        Args:
+            token_address: Token mint
+            commitment: Level the mint is read at; pass the pool event's so a
+                mint seen at ``processed`` is not missing at ``confirmed``
+        """
+        hit, cached = self.cache.get("mint", token_address)
+        if hit:
+            if isinstance(cached, Exception):
+                raise cached
+            return cached
+        
+        try:
+            mint = await self.mints.load(token_address, commitment)
+        except Exception as e:
+            self.cache.put("mint", token_address, e, self.cache.negative_ttl)
+            raise
+        # A missing mint may just not have reached this commitment yet; not cached
+        if mint is not None:
+            self.cache.put("mint", token_address, mint, self.cache.mint_ttl(mint))
+        return mint
+    
+    async def fetch_holders(self, token_address: str) -> List[Tuple[str, int]]:
+        """Largest accounts, cached briefly (failed lookups are cached as empty)"""
+        hit, cached = self.cache.get("holders", token_address)
+        if hit:
+            return cached
+        
+        try:
+            accounts = await self.fetch_largest_accounts(token_address)
+        except Exception as e:
+            print(f"Error getting top holders: {e}")
+            accounts = []
+        self.cache.put("holders", token_address, accounts,
+                       self.cache.holders_ttl if accounts else self.cache.negative_ttl)
+        return accounts
+    
+    def check_mint_authority(self, mint: Optional[MintInfo]) -> bool:
         """
         Check if mint authority is renounced
         
+        Args:
+            mint: Mint decoded by fetch_mint
+        
         Returns:
             True if renounced (safe), False otherwise
         """
-        try:
-            pubkey = Pubkey.from_string(token_address)
-            account_info = self.client.get_account_info(pubkey)
-            
-            if not account_info.value:
-                return False
-            
-            # Parse mint account data
-            # In production, you'd properly parse the account data
-            # For now, return True as placeholder
-            return True
-            
-        except Exception as e:
-            print(f"Error checking mint authority: {e}")
-            return False
+        return mint is not None and mint.mint_authority is None
     
-    def check_freeze_authority(self, token_address: str) -> bool:
+    def check_freeze_authority(self, mint: Optional[MintInfo]) -> bool:
         """
         Check if freeze authority is renounced
         
         Returns:
             True if renounced (safe), False otherwise
         """
-        try:
-            # Similar to mint authority check
-            # In production, parse account data properly
-            return True
-            
-        except Exception as e:
-            print(f"Error checking freeze authority: {e}")
-            return False
+        return mint is not None and mint.freeze_authority is None
+    
+    async def fetch_largest_accounts(self, token_address: str) -> List[Tuple[str, int]]:
+        """
+        (owner, raw amount) of the mint's largest token accounts
+        
+        getTokenLargestAccounts gives the accounts; their owners are resolved
+        with one getMultipleAccounts call reading only the owner field.
+        """
+        largest = await self.rpc.call("getTokenLargestAccounts", [token_address, {"commitment": "confirmed"}])
+        values = [v for v in largest["value"] if int(v["amount"]) > 0]
+        if not values:
+            return []
+        
+        owners = await self.rpc.get_multiple_accounts(
+            [v["address"] for v in values],
+            data_slice={"offset": 32, "length": 32}
+        )
+        return [
+            (str(Pubkey.from_bytes(account["data"])), int(value["amount"]))
+            for value, account in zip(values, owners)
+            if account and len(account["data"]) == 32
+        ]
+    
+    async def get_holder_distribution(self, token_address: str, limit: int = 10) -> Dict[str, Any]:
+        """Top-N percentages and HHI of the mint's holders (see holder_distribution)"""
+        mint, accounts = await asyncio.gather(
+            self.fetch_mint(token_address),
+            self.fetch_holders(token_address)
+        )
+        return self._distribution(token_address, mint, accounts, limit)
+    
+    def _distribution(self, token_address: str, mint: Optional[MintInfo],
+                      accounts: List[Tuple[str, int]], limit: int = 10) -> Dict[str, Any]:
+        excluded = EXCLUDED_OWNERS | {pumpfun_bonding_curve(token_address)}
+        return holder_distribution(accounts, mint.supply if mint else 0, excluded, limit)
     
-    def get_top_holders(
+    async def get_top_holders(
         self,
         token_address: str,
         limit: int = 10
@@ -65,80 +338,106 @@ class TokenAnalyzer:
             List of top holders with addresses and percentages
         """
         try:
-            # In production, you'd query token accounts
-            # and calculate holder percentages
-            # For now, return placeholder data
-            return [
-                {"address": "Holder1...", "percentage": 5.5},
-                {"address": "Holder2...", "percentage": 3.2},
-                {"address": "Holder3...", "percentage": 2.8},
-            ]
-            
+            return (await self.get_holder_distribution(token_address, limit))["holders"]
+        
         except Exception as e:
             print(f"Error getting top holders: {e}")
             return []
     
-    def calculate_safety_score(self, token_address: str) -> int:
+    def score(self, mint_renounced: bool, freeze_renounced: bool, holders: list) -> int:
         """
-        Calculate overall safety score (0-100)
+        Calculate overall safety score (0-100) from already computed checks
         
         Higher is safer
         """
         score = 0
         
-        try:
-            # Check mint authority (25 points)
-            if self.check_mint_authority(token_address):
-                score += 25
-            
-            # Check freeze authority (25 points)
-            if self.check_freeze_authority(token_address):
+        # Check mint authority (25 points)
+        if mint_renounced:
+            score += 25
+        
+        # Check freeze authority (25 points)
+        if freeze_renounced:
+            score += 25
+        
+        # Check holder concentration (25 points)
+        if holders:
+            top_holder_pct = holders[0]["percentage"]
+            if top_holder_pct < 5:
                 score += 25
-            
-            # Check holder concentration (25 points)
-            holders = self.get_top_holders(token_address, limit=10)
-            if holders:
-                top_holder_pct = holders[0]["percentage"] if holders else 100
-                if top_holder_pct < 5:
-                    score += 25
-                elif top_holder_pct < 10:
-                    score += 15
-                elif top_holder_pct < 20:
-                    score += 10
-            
-            # Liquidity check (25 points) - placeholder
-            score += 15  # Partial credit for now
-            
-            return min(score, 100)
-            
+            elif top_holder_pct < 10:
+                score += 15
+            elif top_holder_pct < 20:
+                score += 10
+        
+        # Liquidity check (25 points) - placeholder
+        score += 15  # Partial credit for now
+        
+        return min(score, 100)
+    
+    async def calculate_safety_score(self, token_address: str) -> int:
+        """Calculate overall safety score (0-100); higher is safer"""
+        try:
+            return (await self.analyze_token(token_address))["safety_score"]
         except Exception as e:
             print(f"Error calculating safety score: {e}")
             return 0
     
-    def analyze_token(self, token_address: str) -> Dict[str, Any]:
+    async def analyze_token(self, token_address: str, commitment: str = "confirmed") -> Dict[str, Any]:
         """
         Complete token analysis
         
+        Fetches the mint account and holder data concurrently (one parallel
+        round-trip, skipped for fields still cached) and evaluates every
+        check exactly once.
+        
+        Args:
+            token_address: Token mint
+            commitment: Level the mint account is read at
+        
         Returns:
             Dictionary with all token safety metrics
         """
+        mint, accounts = await asyncio.gather(
+            self.fetch_mint(token_address, commitment),
+            self.fetch_holders(token_address)
+        )
+        
+        mint_renounced = self.check_mint_authority(mint)
+        freeze_renounced = self.check_freeze_authority(mint)
+        distribution = self._distribution(token_address, mint, accounts)
+        holders = distribution.pop("holders")
+        safety_score = self.score(mint_renounced, freeze_renounced, holders)
+        
         return {
             "address": token_address,
-            "mint_renounced": self.check_mint_authority(token_address),
-            "freeze_renounced": self.check_freeze_authority(token_address),
-            "top_holders": self.get_top_holders(token_address),
-            "safety_score": self.calculate_safety_score(token_address),
-            "is_safe": self.calculate_safety_score(token_address) >= 70
+            "mint_renounced": mint_renounced,
+            "freeze_renounced": freeze_renounced,
+            "top_holders": holders,
+            "holder_concentration": distribution,
+            "safety_score": safety_score,
+            "is_safe": safety_score >= 70
         }
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {"cache": self.cache.get_stats(), "mint_loader": self.mints.get_stats()}
+
+
+# Singleton
+_token_analyzer: Optional[TokenAnalyzer] = None
+
+def get_token_analyzer():
+    global _token_analyzer
+    if _token_analyzer is None:
+        _token_analyzer = TokenAnalyzer()
+    return _token_analyzer
 
 # Convenience functions
-def quick_analyze(token_address: str) -> Dict[str, Any]:
+async def quick_analyze(token_address: str) -> Dict[str, Any]:
     """Quick token analysis"""
-    analyzer = TokenAnalyzer()
-    return analyzer.analyze_token(token_address)
+    return await get_token_analyzer().analyze_token(token_address)
 
-def is_token_safe(token_address: str, min_score: int = 70) -> bool:
+async def is_token_safe(token_address: str, min_score: int = 70) -> bool:
     """Check if token meets minimum safety score"""
-    analyzer = TokenAnalyzer()
-    score = analyzer.calculate_safety_score(token_address)
+    score = await get_token_analyzer().calculate_safety_score(token_address)
     return score >= min_score
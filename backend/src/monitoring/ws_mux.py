@@ -0,0 +1,308 @@
+"""
+WebSocket Multiplexer
+Carry many programSubscribe/logsSubscribe subscriptions over one WebSocket
+connection (or a small pool) and route notifications by subscription id
+"""
+
+import asyncio
+import itertools
+import json
+import random
+import time
+import websockets
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WS_ENDPOINT, WS_RECORD_PATH
+from monitoring.recorder import MessageRecorder
+
+# Handler receives the notification "result" payload
+NotificationHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Called after the subscription was re-established on a new connection
+ReconnectHandler = Callable[[], Awaitable[None]]
+
+def backoff_delay(attempt: int, base: float = 0.5, maximum: float = 30.0) -> float:
+    """Exponential backoff with jitter: a random delay in [50%, 100%] of base * 2^attempt, capped"""
+    return min(maximum, base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+
+class Subscription:
+    """One server-side subscription shared by every handler with identical params"""
+
+    __slots__ = ("method", "params", "handlers", "reconnect_handlers", "server_id", "connection")
+
+    def __init__(self, method: str, params: list, connection: "MuxConnection"):
+        self.method = method
+        self.params = params
+        self.handlers: Dict[int, NotificationHandler] = {}
+        self.reconnect_handlers: Dict[int, ReconnectHandler] = {}
+        self.server_id: Optional[int] = None
+        self.connection = connection
+
+class MuxConnection:
+    """A single WebSocket carrying many subscriptions, reconnected when it drops"""
+
+    def __init__(self, url: str, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 recorder: Optional[MessageRecorder] = None):
+        self.url = url
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.recorder = recorder
+        self.websocket = None
+        self.subscriptions: Dict[int, Subscription] = {}
+        self.messages_received = 0
+        self.reconnects = 0
+        self._closing = False
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._pending_subscriptions: Dict[int, Subscription] = {}
+        self._ids = itertools.count(1)
+        self._reader: Optional[asyncio.Task] = None
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._reader is not None and not self._reader.done()
+
+    async def connect(self):
+        async with self._connect_lock:
+            if self.is_connected:
+                return
+            self.websocket = await websockets.connect(self.url, max_size=None)
+            self._closing = False
+            self._reader = asyncio.create_task(self._supervise())
+            print(f"✓ Connected WebSocket multiplexer to {self.url}")
+
+    async def request(self, method: str, params: list, subscription: Optional[Subscription] = None) -> Any:
+        """
+        Send one JSON-RPC request and wait for its response
+
+        When ``subscription`` is given it is registered under the returned id
+        by the reader itself, so notifications sent right after the response
+        are not lost.
+        """
+        await self.connect()
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        if subscription is not None:
+            self._pending_subscriptions[request_id] = subscription
+        await self.websocket.send(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}))
+        return await future
+
+    async def _supervise(self):
+        """Read until the socket drops, then reconnect with backoff and resubscribe"""
+        while True:
+            await self._read()
+            if self._closing:
+                return
+
+            attempt = 0
+            while not self._closing:
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+                print(f"WebSocket multiplexer reconnecting in {delay:.2f}s (attempt {attempt + 1})")
+                await asyncio.sleep(delay)
+                try:
+                    self.websocket = await websockets.connect(self.url, max_size=None)
+                    break
+                except Exception as e:
+                    print(f"✗ Reconnect failed: {e}")
+                    attempt += 1
+            if self._closing:
+                return
+
+            self.reconnects += 1
+            print(f"✓ Reconnected WebSocket multiplexer to {self.url}")
+            # Responses are read by _read, so resubscribe concurrently with it
+            asyncio.create_task(self._resubscribe())
+
+    async def _resubscribe(self):
+        """Register every subscription again and tell handlers about the gap"""
+        subscriptions = list(self.subscriptions.values())
+        self.subscriptions.clear()
+
+        for subscription in subscriptions:
+            if not subscription.handlers:
+                continue
+            try:
+                await self.request(subscription.method, subscription.params, subscription)
+            except Exception as e:
+                print(f"✗ Resubscribe {subscription.method} failed: {e}")
+                continue
+
+            for handler in list(subscription.reconnect_handlers.values()):
+                asyncio.create_task(handler())
+
+    async def _read(self):
+        try:
+            async for message in self.websocket:
+                received_at = time.perf_counter()
+                self.messages_received += 1
+                if self.recorder is not None:
+                    self.recorder.record(message)
+                try:
+                    data = json.loads(message)
+                except json.JSONDecodeError:
+                    continue
+                await self._dispatch(data, received_at)
+        except websockets.exceptions.ConnectionClosed:
+            print("WebSocket multiplexer connection closed")
+        except Exception as e:
+            print(f"WebSocket multiplexer read failed: {e}")
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("WebSocket closed"))
+            self._pending.clear()
+            self._pending_subscriptions.clear()
+
+    async def _dispatch(self, data: Dict[str, Any], received_at: Optional[float] = None):
+        # Response to a subscribe/unsubscribe request
+        if "id" in data and data["id"] in self._pending:
+            future = self._pending.pop(data["id"])
+            subscription = self._pending_subscriptions.pop(data["id"], None)
+            if "error" in data:
+                future.set_exception(Exception(data["error"].get("message", str(data["error"]))))
+                return
+            if subscription is not None:
+                subscription.server_id = data.get("result")
+                self.subscriptions[subscription.server_id] = subscription
+            future.set_result(data.get("result"))
+            return
+
+        # Notification: route by subscription id
+        params = data.get("params")
+        if not params or "subscription" not in params:
+            return
+        subscription = self.subscriptions.get(params["subscription"])
+        if subscription is None:
+            return
+
+        result = params["result"]
+        if isinstance(result, dict):
+            # Socket receive time, the first stamp of the sniper's latency trace
+            result["received_at"] = received_at or time.perf_counter()
+        for handler in list(subscription.handlers.values()):
+            try:
+                await handler(result)
+            except Exception as e:
+                print(f"Error in {subscription.method} handler: {e}")
+
+    async def close(self):
+        self._closing = True
+        if self.websocket is not None:
+            await self.websocket.close()
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+        self.websocket = None
+        self._reader = None
+        self.subscriptions.clear()
+
+class WebSocketMux:
+    """Share WebSocket connections across all platform subscriptions"""
+
+    def __init__(self, url: str = None, pool_size: int = 1, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 recorder: Optional[MessageRecorder] = None):
+        self.url = url or WS_ENDPOINT
+        # Raw messages of every connection are appended here for replay
+        self.recorder = recorder
+        self.connections: List[MuxConnection] = [
+            MuxConnection(self.url, backoff_base, backoff_max, recorder) for _ in range(max(1, pool_size))
+        ]
+        self._subscriptions: Dict[Tuple[str, str], Subscription] = {}
+        self._handles: Dict[int, Tuple[str, str]] = {}
+        self._handle_ids = itertools.count(1)
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, method: str, params: list, handler: NotificationHandler,
+                        on_reconnect: Optional[ReconnectHandler] = None) -> int:
+        """
+        Register a handler for a subscription
+
+        Identical (method, params) pairs share one server-side subscription.
+
+        Args:
+            method: Subscribe method, e.g. "programSubscribe" or "logsSubscribe"
+            params: Subscribe params
+            handler: Coroutine called with each notification result
+            on_reconnect: Coroutine called after the subscription was restored
+                on a new connection, e.g. to backfill the gap
+
+        Returns:
+            Handle used to unsubscribe
+        """
+        key = (method, json.dumps(params, sort_keys=True))
+        handle = next(self._handle_ids)
+
+        async with self._lock:
+            subscription = self._subscriptions.get(key)
+            if subscription is None:
+                connection = min(self.connections, key=lambda c: len(c.subscriptions))
+                subscription = Subscription(method, params, connection)
+                subscription.handlers[handle] = handler
+                await connection.request(method, params, subscription)
+                self._subscriptions[key] = subscription
+
+            subscription.handlers[handle] = handler
+            if on_reconnect is not None:
+                subscription.reconnect_handlers[handle] = on_reconnect
+            self._handles[handle] = key
+
+        return handle
+
+    async def unsubscribe(self, handle: int):
+        """Remove a handler; the server subscription ends with its last handler"""
+        async with self._lock:
+            key = self._handles.pop(handle, None)
+            subscription = self._subscriptions.get(key) if key else None
+            if subscription is None:
+                return
+
+            subscription.handlers.pop(handle, None)
+            subscription.reconnect_handlers.pop(handle, None)
+            if subscription.handlers:
+                return
+
+            del self._subscriptions[key]
+            connection = subscription.connection
+            connection.subscriptions.pop(subscription.server_id, None)
+            if connection.is_connected:
+                try:
+                    await connection.request(subscription.method.replace("Subscribe", "Unsubscribe"), [subscription.server_id])
+                except Exception as e:
+                    print(f"Unsubscribe failed: {e}")
+
+    async def close(self):
+        """Close every connection and forget all subscriptions"""
+        for connection in self.connections:
+            await connection.close()
+        self._subscriptions.clear()
+        self._handles.clear()
+        if self.recorder is not None:
+            self.recorder.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "connections": sum(1 for c in self.connections if c.is_connected),
+            "subscriptions": len(self._subscriptions),
+            "handlers": len(self._handles),
+            "messages_received": sum(c.messages_received for c in self.connections),
+            "reconnects": sum(c.reconnects for c in self.connections),
+            "recorded": self.recorder.records if self.recorder else 0
+        }
+
+
+# Singleton
+_ws_mux = None
+
+def get_ws_mux():
+    global _ws_mux
+    if _ws_mux is None:
+        _ws_mux = WebSocketMux(recorder=MessageRecorder(WS_RECORD_PATH) if WS_RECORD_PATH else None)
+    return _ws_mux
@@ -0,0 +1,367 @@
+"""
+Copy Trader
+Mirror the swaps of leader wallets from one or more of our wallets.
+Each leader gets a logsSubscribe (mentions) subscription on the shared
+WebSocket multiplexer. pump.fun trades are decoded from the notification's
+logs; other swaps are decoded from the transaction's inner instructions.
+Every mirrored trade reports its leader-to-follower lag.
+"""
+
+import asyncio
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import POOL_COMMITMENT
+from core.database import close_db
+from core.rpc import AsyncRpc, get_async_rpc
+from monitoring.decoders import SwapEvent, decode_pumpfun_swaps, decode_swap_transaction, invokes_swap_program
+from monitoring.dedup import TTLSet
+from monitoring.slot_clock import get_slot_clock
+from monitoring.ws_mux import WebSocketMux, get_ws_mux
+from trading.executor import TradeExecutor
+from trading.jupiter import JupiterClient
+from trading.sender import get_transaction_sender
+from utils.timing import RollingStages
+from solders.keypair import Keypair
+
+# Polling for a processed notification's transaction (~one slot apart)
+TX_ATTEMPTS = 10
+TX_RETRY_DELAY = 0.4
+
+class CopyTrader:
+    """Mirror leader wallets' swaps from a set of follower wallets"""
+
+    def __init__(
+        self,
+        leaders: Sequence[str],
+        followers: List[Tuple[int, Keypair]],
+        config: Optional[Dict[str, Any]] = None,
+        copier_id: Optional[str] = None,
+        mux: Optional[WebSocketMux] = None,
+        rpc: Optional[AsyncRpc] = None,
+        jupiter: Optional[JupiterClient] = None
+    ):
+        """
+        Args:
+            leaders: Wallet addresses to copy
+            followers: Pre-unlocked (wallet_id, keypair) pairs that mirror them
+            config: buy_amount, size_mode ("fixed" or "ratio"), size_ratio,
+                max_buy_amount, min_leader_sol, copy_sells, repeat_buys,
+                slippage, commitment
+            copier_id: Instance key
+        """
+        if not leaders:
+            raise Exception("No leader wallets to copy")
+        if not followers:
+            raise Exception("No follower wallets")
+
+        self.leaders = set(leaders)
+        self.followers = followers
+        self.config = config or {}
+        self.copier_id = copier_id or f"copy-{followers[0][0]}"
+        self.mux = mux or get_ws_mux()
+        self.rpc = rpc or get_async_rpc()
+        self.jupiter = jupiter or JupiterClient(sender=get_transaction_sender())
+        self.executors = {
+            wallet_id: TradeExecutor(wallet_id, keypair, jupiter=self.jupiter, rpc=self.rpc)
+            for wallet_id, keypair in followers
+        }
+        self.is_running = False
+
+        # Sizing: a fixed SOL amount per trade, or the leader's SOL times size_ratio
+        self.buy_amount = self.config.get("buy_amount", 0.1)
+        self.size_mode = self.config.get("size_mode", "fixed")
+        self.size_ratio = self.config.get("size_ratio", 1.0)
+        self.max_buy_amount = self.config.get("max_buy_amount")
+        # Leader trades below this many SOL are not copied
+        self.min_leader_sol = self.config.get("min_leader_sol", 0.0)
+        self.copy_sells = self.config.get("copy_sells", True)
+        # Mirror a leader adding to a position the follower already holds
+        self.repeat_buys = self.config.get("repeat_buys", False)
+        self.slippage = self.config.get("slippage", 5.0)
+        self.commitment = self.config.get("commitment", POOL_COMMITMENT)
+
+        self.subscriptions: Dict[str, int] = {}
+        # One notification per leader mentioned; a shared transaction is handled once
+        self.seen = TTLSet(maxsize=10000, ttl=120.0)
+        self.positions: Dict[int, set] = {wallet_id: set() for wallet_id, _ in followers}
+        self._handling = set()
+
+        # Lag from the leader's notification to each follower's trade
+        self.slot_clock = get_slot_clock()
+        self.latency = RollingStages()
+        self.slot_lag = RollingStages()
+        self.recent_trades = deque(maxlen=100)
+
+        self.notifications = 0
+        self.swaps_detected = 0
+        self.trades_copied = 0
+        self.trades_skipped = 0
+        self.follower_trades = 0
+        self.follower_failures = 0
+
+    async def start(self):
+        """Subscribe to every leader's logs on the shared connection"""
+        self.is_running = True
+        for leader in self.leaders:
+            params = [{"mentions": [leader]}, {"commitment": self.commitment}]
+            self.subscriptions[leader] = await self.mux.subscribe("logsSubscribe", params, self._on_notification)
+        print(f"✓ Copy trader {self.copier_id}: {len(self.leaders)} leaders, {len(self.followers)} followers "
+              f"({self.commitment})")
+
+    async def stop(self):
+        """Drop the subscriptions and wait for trades in flight"""
+        self.is_running = False
+        for handle in self.subscriptions.values():
+            await self.mux.unsubscribe(handle)
+        self.subscriptions.clear()
+        if self._handling:
+            await asyncio.gather(*self._handling, return_exceptions=True)
+        await self.jupiter.close()
+        for executor in self.executors.values():
+            close_db(executor.db)
+
+    async def _on_notification(self, result: Dict[str, Any]):
+        """Hand the notification to a task so trades never hold up the socket reader"""
+        if not self.is_running:
+            return
+        task = asyncio.create_task(self.handle(result))
+        self._handling.add(task)
+        task.add_done_callback(self._handling.discard)
+
+    async def handle(self, result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Decode a leader notification and mirror its swaps
+
+        Args:
+            result: logsNotification result (``received_at`` stamped by the mux)
+
+        Returns:
+            One trade report per mirrored swap
+        """
+        received = result.get("received_at") or time.perf_counter()
+        value = result.get("value") or {}
+        signature = value.get("signature")
+        if value.get("err") is not None or (signature and signature in self.seen):
+            return []
+        if signature:
+            self.seen.add(signature)
+        self.notifications += 1
+        slot = (result.get("context") or {}).get("slot")
+        self.slot_clock.observe(slot)
+
+        swaps = decode_pumpfun_swaps(value, self.leaders)
+        if not swaps and signature and invokes_swap_program(value.get("logs") or ()):
+            tx = await self._fetch_transaction(signature)
+            swap = decode_swap_transaction(tx, self.leaders) if tx else None
+            swaps = [swap] if swap else []
+
+        reports = []
+        for swap in swaps:
+            swap.slot = swap.slot or slot
+            self.swaps_detected += 1
+            report = await self.mirror(swap, received)
+            if report is not None:
+                reports.append(report)
+        return reports
+
+    async def _fetch_transaction(self, signature: str) -> Optional[Dict[str, Any]]:
+        config = {"encoding": "jsonParsed", "commitment": "confirmed", "maxSupportedTransactionVersion": 0}
+        # getTransaction serves confirmed transactions at the earliest, so a
+        # processed notification waits briefly for its transaction
+        attempts = TX_ATTEMPTS if self.commitment == "processed" else 1
+        for attempt in range(attempts):
+            if attempt:
+                await asyncio.sleep(TX_RETRY_DELAY)
+            try:
+                tx = await self.rpc.call("getTransaction", [signature, config])
+            except Exception as e:
+                print(f"Error fetching leader transaction {signature}: {e}")
+                return None
+            if tx:
+                return tx
+        return None
+
+    def size(self, swap: SwapEvent) -> float:
+        """SOL each follower spends mirroring a leader buy"""
+        amount = self.buy_amount if self.size_mode == "fixed" else swap.sol_amount / 1e9 * self.size_ratio
+        if self.max_buy_amount is not None:
+            amount = min(amount, self.max_buy_amount)
+        return round(amount, 9)
+
+    async def mirror(self, swap: SwapEvent, received: float) -> Optional[Dict[str, Any]]:
+        """
+        Place the follower side of one leader swap from every eligible wallet
+
+        Buys go to followers not yet holding the token (unless repeat_buys);
+        sells go to followers holding it, for the share the leader sold.
+
+        Returns:
+            Trade report, or None if the swap was not copied
+        """
+        token_address = swap.token_address
+        decided = time.perf_counter()
+        if swap.is_buy:
+            amount = self.size(swap)
+            wallets = [wallet_id for wallet_id in self.executors
+                       if self.repeat_buys or token_address not in self.positions[wallet_id]]
+            if swap.sol_amount / 1e9 < self.min_leader_sol or amount <= 0 or not wallets:
+                self.trades_skipped += 1
+                return None
+        else:
+            percentage = round(swap.sold_fraction * 100, 2) if swap.sold_fraction else 100.0
+            wallets = [wallet_id for wallet_id in self.executors if token_address in self.positions[wallet_id]]
+            if not self.copy_sells or not wallets:
+                self.trades_skipped += 1
+                return None
+
+        print(f"👥 Copying {swap.wallet[:8]}… {'buy' if swap.is_buy else 'sell'} of {token_address} "
+              f"from {len(wallets)} wallet(s)")
+        send_slot = self.slot_clock.slot
+
+        async def follow(wallet_id: int) -> Dict[str, Any]:
+            executor = self.executors[wallet_id]
+            if swap.is_buy:
+                result = await executor.execute_buy(token_address, amount, self.slippage, strategy="copy")
+            else:
+                result = await executor.execute_sell(token_address, percentage, self.slippage, strategy="copy")
+            return {
+                "wallet_id": wallet_id,
+                "success": result["success"],
+                "signature": result.get("signature"),
+                "error": result.get("error"),
+                "lag_ms": round((time.perf_counter() - received) * 1000, 3)
+            }
+
+        results = await asyncio.gather(*[follow(wallet_id) for wallet_id in wallets])
+        for r in results:
+            if not r["success"]:
+                self.follower_failures += 1
+                print(f"   ✗ Wallet {r['wallet_id']}: {r['error']}")
+                continue
+            self.follower_trades += 1
+            if swap.is_buy:
+                self.positions[r["wallet_id"]].add(token_address)
+            elif percentage >= 100:
+                self.positions[r["wallet_id"]].discard(token_address)
+        self.trades_copied += 1
+
+        lags = [r["lag_ms"] for r in results]
+        self.latency.add({
+            "decode": (decided - received) * 1000,
+            "leader_to_follower": max(lags)
+        })
+        slot_lag = None
+        if swap.slot is not None and send_slot is not None:
+            slot_lag = send_slot - swap.slot
+            self.slot_lag.add({"send_minus_leader": slot_lag})
+
+        report = {
+            "leader": swap.as_dict(),
+            "side": "buy" if swap.is_buy else "sell",
+            "sol_amount": amount if swap.is_buy else None,
+            "percentage": None if swap.is_buy else percentage,
+            "followers": results,
+            "decode_ms": round((decided - received) * 1000, 3),
+            "max_lag_ms": max(lags),
+            "send_slot": send_slot,
+            "slot_lag": slot_lag,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        self.recent_trades.append(report)
+        bought = sum(1 for r in results if r["success"])
+        print(f"   ✅ {bought}/{len(results)} followers, leader → follower {max(lags):.1f} ms"
+              + (f", {slot_lag} slot(s) behind" if slot_lag is not None else ""))
+        return report
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "copier_id": self.copier_id,
+            "is_running": self.is_running,
+            "leaders": sorted(self.leaders),
+            "followers": [wallet_id for wallet_id, _ in self.followers],
+            "sizing": {"mode": self.size_mode, "buy_amount": self.buy_amount, "ratio": self.size_ratio,
+                       "max_buy_amount": self.max_buy_amount},
+            "notifications": self.notifications,
+            "swaps_detected": self.swaps_detected,
+            "trades_copied": self.trades_copied,
+            "trades_skipped": self.trades_skipped,
+            "follower_trades": self.follower_trades,
+            "follower_failures": self.follower_failures,
+            "open_positions": {wallet_id: len(tokens) for wallet_id, tokens in self.positions.items()},
+            "latency_ms": self.latency.summary(),
+            "slot_lag": self.slot_lag.summary(),
+            "recent": list(self.recent_trades)[-10:]
+        }
+
+class CopyTradeManager:
+    """Running copy traders by id"""
+
+    def __init__(self, mux: Optional[WebSocketMux] = None):
+        self.mux = mux
+        self._traders: Dict[str, CopyTrader] = {}
+
+    async def start(
+        self,
+        leaders: Sequence[str],
+        followers: List[Tuple[int, Keypair]],
+        config: Dict[str, Any],
+        copier_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Start a copy trader
+
+        Args:
+            leaders: Wallet addresses to copy
+            followers: Pre-unlocked (wallet_id, keypair) pairs
+            config: Copy settings (see CopyTrader)
+            copier_id: Instance key (default "copy-<first wallet id>")
+        """
+        trader = CopyTrader(leaders, followers, config, copier_id, mux=self.mux)
+        if trader.copier_id in self._traders:
+            raise Exception(f"Copy trader {trader.copier_id} already running")
+        await trader.start()
+        self._traders[trader.copier_id] = trader
+        return {
+            "status": "started",
+            "copier_id": trader.copier_id,
+            "leaders": len(trader.leaders),
+            "followers": len(followers),
+            "message": "Copy trader started successfully"
+        }
+
+    async def stop(self, copier_id: Optional[str] = None) -> Dict[str, Any]:
+        """Stop one copy trader, or all of them when no id is given"""
+        if copier_id is not None and copier_id not in self._traders:
+            raise Exception(f"Copy trader {copier_id} not running")
+        if not self._traders:
+            raise Exception("Copy trader not running")
+
+        stopped = {}
+        for key in [copier_id] if copier_id else list(self._traders):
+            trader = self._traders.pop(key)
+            await trader.stop()
+            stopped[key] = trader.get_stats()
+        return {"status": "stopped", "stats": stopped}
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "running": bool(self._traders),
+            "traders": {key: trader.get_stats() for key, trader in self._traders.items()}
+        }
+
+
+# Singleton
+_copy_trade_manager = None
+
+def get_copy_trade_manager():
+    global _copy_trade_manager
+    if _copy_trade_manager is None:
+        _copy_trade_manager = CopyTradeManager()
+    return _copy_trade_manager
@@ -1,29 +1,69 @@
 from typing import Optional, Dict, Any
 from solders.keypair import Keypair
 from datetime import datetime
+import time
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from trading.jupiter import buy_token, sell_token
+from trading.jupiter import JupiterClient, SOL_MINT, buy_token, sell_token
+from trading.traded_mints import get_traded_mints
 from core.database import Trade, get_db, close_db
-from core.wallet import get_balance
+from core.rpc import AsyncRpc, get_async_rpc
+from utils.timing import StageTimer
+from utils.token_layout import associated_token_address
 
 class TradeExecutor:
     """Execute buy and sell trades"""
     
-    def __init__(self, wallet_id: int, keypair: Keypair):
+    def __init__(
+        self,
+        wallet_id: int,
+        keypair: Keypair,
+        jupiter: Optional[JupiterClient] = None,
+        rpc: Optional[AsyncRpc] = None,
+        balance_ttl: float = 30.0
+    ):
+        """
+        Args:
+            wallet_id: Wallet ID trades are recorded under
+            keypair: Unlocked wallet keypair
+            jupiter: Long-lived Jupiter client; one is created per trade otherwise
+            rpc: Async RPC client for balance reads
+            balance_ttl: Seconds the in-memory SOL balance is trusted
+        """
         self.wallet_id = wallet_id
         self.keypair = keypair
         self.db = get_db()
+        self.jupiter = jupiter
+        self.rpc = rpc or get_async_rpc()
+        self.balance_ttl = balance_ttl
+        self.balance: Optional[float] = None
+        self._balance_at = 0.0
+        # Account Jupiter wraps SOL into for buys; derived once, no RPC
+        self.wsol_ata = associated_token_address(str(keypair.pubkey()), SOL_MINT)
+    
+    async def refresh_balance(self) -> float:
+        """Read the SOL balance into memory"""
+        result = await self.rpc.call("getBalance", [str(self.keypair.pubkey()), {"commitment": "confirmed"}])
+        self.balance = result["value"] / 1e9
+        self._balance_at = time.monotonic()
+        return self.balance
+    
+    async def get_balance(self) -> float:
+        """In-memory SOL balance, read again once older than ``balance_ttl``"""
+        if self.balance is None or time.monotonic() - self._balance_at > self.balance_ttl:
+            return await self.refresh_balance()
+        return self.balance
     
     async def execute_buy(
         self,
         token_address: str,
         sol_amount: float,
         slippage: float = 1.0,
-        strategy: str = "manual"
+        strategy: str = "manual",
+        quote: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Execute buy trade
@@ -33,17 +73,21 @@ class TradeExecutor:
             sol_amount: SOL amount to spend
             slippage: Slippage tolerance (%)
             strategy: Trade strategy (manual, snipe, copy)
+            quote: Jupiter quote already fetched for this buy
         
         Returns:
-            Trade result with signature and details
+            Trade result with signature, details and per-stage timings (ms)
         """
+        timer = StageTimer()
         try:
             # Check balance
-            balance = get_balance(str(self.keypair.pubkey()))
+            with timer.stage("balance"):
+                balance = await self.get_balance()
             if balance < sol_amount:
                 return {
                     "success": False,
-                    "error": f"Insufficient balance. Have {balance} SOL, need {sol_amount} SOL"
+                    "error": f"Insufficient balance. Have {balance} SOL, need {sol_amount} SOL",
+                    "timings": timer.as_dict()
                 }
             
             # Execute buy
@@ -51,31 +95,38 @@ class TradeExecutor:
                 keypair=self.keypair,
                 token_address=token_address,
                 sol_amount=sol_amount,
-                slippage_percent=slippage
+                slippage_percent=slippage,
+                timer=timer,
+                jupiter=self.jupiter,
+                quote=quote
             )
             
             if not signature:
                 return {
                     "success": False,
-                    "error": "Failed to execute buy transaction"
+                    "error": "Failed to execute buy transaction",
+                    "timings": timer.as_dict()
                 }
+            self.balance = balance - sol_amount
             
             # Save to database
-            trade = Trade(
-                wallet_id=self.wallet_id,
-                token_address=token_address,
-                trade_type="buy",
-                amount=0,  # Will be updated when we parse transaction
-                price=0,   # Will be calculated
-                cost=sol_amount,
-                signature=signature,
-                timestamp=datetime.utcnow(),
-                strategy=strategy
-            )
-            
-            self.db.add(trade)
-            self.db.commit()
-            self.db.refresh(trade)
+            with timer.stage("record"):
+                trade = Trade(
+                    wallet_id=self.wallet_id,
+                    token_address=token_address,
+                    trade_type="buy",
+                    amount=0,  # Will be updated when we parse transaction
+                    price=0,   # Will be calculated
+                    cost=sol_amount,
+                    signature=signature,
+                    timestamp=datetime.utcnow(),
+                    strategy=strategy
+                )
+                
+                self.db.add(trade)
+                self.db.commit()
+                self.db.refresh(trade)
+                get_traded_mints().record(self.wallet_id, token_address)
             
             return {
                 "success": True,
@@ -83,13 +134,15 @@ class TradeExecutor:
                 "trade_id": trade.id,
                 "token_address": token_address,
                 "sol_amount": sol_amount,
-                "explorer_url": f"https://solscan.io/tx/{signature}"
+                "explorer_url": f"https://solscan.io/tx/{signature}",
+                "timings": timer.as_dict()
             }
             
         except Exception as e:
             return {
                 "success": False,
-                "error": str(e)
+                "error": str(e),
+                "timings": timer.as_dict()
             }
     
     async def execute_sell(
@@ -109,8 +162,9 @@ class TradeExecutor:
             strategy: Trade strategy
         
         Returns:
-            Trade result
+            Trade result with per-stage timings (ms)
         """
+        timer = StageTimer()
         try:
             # For now, we'll use a placeholder for token amount
             # In production, you'd query token accounts to get actual balance
@@ -122,7 +176,8 @@ class TradeExecutor:
             if sell_amount <= 0:
                 return {
                     "success": False,
-                    "error": "No tokens to sell"
+                    "error": "No tokens to sell",
+                    "timings": timer.as_dict()
                 }
             
             # Execute sell
@@ -130,31 +185,35 @@ class TradeExecutor:
                 keypair=self.keypair,
                 token_address=token_address,
                 token_amount=sell_amount,
-                slippage_percent=slippage
+                slippage_percent=slippage,
+                timer=timer,
+                jupiter=self.jupiter
             )
             
             if not signature:
                 return {
                     "success": False,
-                    "error": "Failed to execute sell transaction"
+                    "error": "Failed to execute sell transaction",
+                    "timings": timer.as_dict()
                 }
             
             # Save to database
-            trade = Trade(
-                wallet_id=self.wallet_id,
-                token_address=token_address,
-                trade_type="sell",
-                amount=sell_amount,
-                price=0,
-                revenue=0,  # Will be updated
-                signature=signature,
-                timestamp=datetime.utcnow(),
-                strategy=strategy
-            )
-            
-            self.db.add(trade)
-            self.db.commit()
-            self.db.refresh(trade)
+            with timer.stage("record"):
+                trade = Trade(
+                    wallet_id=self.wallet_id,
+                    token_address=token_address,
+                    trade_type="sell",
+                    amount=sell_amount,
+                    price=0,
+                    revenue=0,  # Will be updated
+                    signature=signature,
+                    timestamp=datetime.utcnow(),
+                    strategy=strategy
+                )
+                
+                self.db.add(trade)
+                self.db.commit()
+                self.db.refresh(trade)
             
             return {
                 "success": True,
@@ -162,13 +221,15 @@ class TradeExecutor:
                 "trade_id": trade.id,
                 "token_address": token_address,
                 "percentage": percentage,
-                "explorer_url": f"https://solscan.io/tx/{signature}"
+                "explorer_url": f"https://solscan.io/tx/{signature}",
+                "timings": timer.as_dict()
             }
             
         except Exception as e:
             return {
                 "success": False,
-                "error": str(e)
+                "error": str(e),
+                "timings": timer.as_dict()
             }
     
     def __del__(self):
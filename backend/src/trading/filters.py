@@ -0,0 +1,237 @@
+"""
+Sniper Filter Pipeline
+Declarative, cost-ordered checks built from the sniper config. Cheap stages
+run first and evaluation stops at the first rejection, so most events are
+rejected without an RPC call.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+# Stage costs, cheapest first
+COST_LOCAL = 0       # Fields of the event itself
+COST_CACHED = 1      # In-memory lookups
+COST_RPC = 2         # One (batched, cached) RPC
+COST_MULTI_RPC = 3   # Several dependent RPCs
+
+class FilterContext:
+    """Dependencies and intermediate results shared by the stages of one evaluation"""
+
+    def __init__(self, analyzer: Any, traded: Any = None, wallet_ids: Sequence[int] = (), creators: Any = None,
+                 honeypot: Any = None, quoter: Optional[Callable[[str], Awaitable[Any]]] = None,
+                 commitment: str = "confirmed"):
+        self.analyzer = analyzer
+        self.traded = traded
+        self.wallet_ids = list(wallet_ids)
+        self.creators = creators
+        # HoneypotChecker, and the buy quote fetched alongside its simulation
+        self.honeypot = honeypot
+        self.quoter = quoter
+        # Commitment the pool event was seen at; the mint is read at the same level
+        self.commitment = commitment
+        self.mint = None
+        self.analysis: Optional[Dict[str, Any]] = None
+        self.sell_check: Optional[Dict[str, Any]] = None
+        self.quote = None
+
+    async def get_mint(self, token_address: str):
+        if self.mint is None:
+            self.mint = await self.analyzer.fetch_mint(token_address, self.commitment)
+        return self.mint
+
+    async def get_analysis(self, token_address: str) -> Dict[str, Any]:
+        if self.analysis is None:
+            self.analysis = await self.analyzer.analyze_token(token_address, self.commitment)
+        return self.analysis
+
+    async def get_sell_check(self, token_address: str) -> Dict[str, Any]:
+        """Sell simulation, run concurrently with the buy quote when a quoter is set"""
+        if self.sell_check is None:
+            if self.quoter is not None and self.quote is None:
+                self.quote, self.sell_check = await asyncio.gather(
+                    self.quoter(token_address), self.honeypot.check(token_address))
+            else:
+                self.sell_check = await self.honeypot.check(token_address)
+        return self.sell_check
+
+# check(event, context) returns a rejection reason, or None to pass
+Check = Callable[[Dict[str, Any], FilterContext], Awaitable[Optional[str]]]
+
+class FilterStage:
+    """One named check with its declared cost"""
+
+    def __init__(self, name: str, cost: int, check: Check):
+        self.name = name
+        self.cost = cost
+        self.check = check
+        self.evaluated = 0
+        self.rejected = 0
+
+class FilterResult:
+    """Outcome of running the pipeline on one event"""
+
+    def __init__(self, passed: bool, stage: Optional[str] = None, reason: Optional[str] = None,
+                 context: Optional[FilterContext] = None, timings: Optional[Dict[str, float]] = None):
+        self.passed = passed
+        self.stage = stage
+        self.reason = reason
+        self.context = context
+        # Milliseconds spent in each evaluated stage
+        self.timings = timings or {}
+
+class FilterPipeline:
+    """Run stages in cost order and stop at the first rejection"""
+
+    def __init__(self, stages: List[FilterStage]):
+        # sorted() is stable: equal-cost stages keep their declared order
+        self.stages = sorted(stages, key=lambda stage: stage.cost)
+        self.evaluated = 0
+        self.passed = 0
+
+    async def evaluate(self, event: Dict[str, Any], context: FilterContext,
+                       min_cost: Optional[int] = None, max_cost: Optional[int] = None) -> FilterResult:
+        """
+        Run the stages in cost order until one rejects
+
+        Args:
+            event: Pool event
+            context: Shared per-event context
+            min_cost: Skip stages cheaper than this (the rest of an
+                evaluation that already ran the cheap stages)
+            max_cost: Skip stages costlier than this
+
+        Returns:
+            Result naming the rejecting stage, if any
+        """
+        # Split evaluations count as one: entered at the first stage, passed at the last
+        if min_cost is None:
+            self.evaluated += 1
+        timings: Dict[str, float] = {}
+        for stage in self.stages:
+            if (min_cost is not None and stage.cost < min_cost) or (max_cost is not None and stage.cost > max_cost):
+                continue
+            stage.evaluated += 1
+            started = time.perf_counter()
+            try:
+                reason = await stage.check(event, context)
+            except Exception as e:
+                reason = f"{stage.name} check failed: {e}"
+            timings[stage.name] = (time.perf_counter() - started) * 1000
+            if reason is not None:
+                stage.rejected += 1
+                return FilterResult(False, stage.name, reason, context, timings)
+
+        if max_cost is None:
+            self.passed += 1
+        return FilterResult(True, context=context, timings=timings)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "evaluated": self.evaluated,
+            "passed": self.passed,
+            "stages": [
+                {"name": stage.name, "cost": stage.cost, "evaluated": stage.evaluated, "rejected": stage.rejected}
+                for stage in self.stages
+            ]
+        }
+
+def build_filter_pipeline(config: Dict[str, Any]) -> FilterPipeline:
+    """
+    Build the sniper's filter pipeline from its config
+
+    Args:
+        config: Sniper config (min_liquidity, max_backfill_age,
+            max_creator_rugs, max_creator_launches, require_mint_renounced,
+            require_freeze_renounced, min_safety_score, max_sell_tax)
+
+    Returns:
+        Pipeline with only the stages the config enables
+    """
+    stages: List[FilterStage] = []
+
+    max_backfill_age = config.get("max_backfill_age", 20.0)
+
+    async def backfill_age(event, context):
+        if event.get("backfilled"):
+            age = time.time() - (event.get("block_time") or 0)
+            if age > max_backfill_age:
+                return f"Backfilled pool is {age:.0f}s old (max {max_backfill_age}s)"
+        return None
+    stages.append(FilterStage("backfill_age", COST_LOCAL, backfill_age))
+
+    min_liquidity = config.get("min_liquidity", 5.0)
+    if min_liquidity > 0:
+        async def liquidity(event, context):
+            value = event.get("liquidity", 0)
+            if value < min_liquidity:
+                return f"Liquidity too low ({value} < {min_liquidity})"
+            return None
+        stages.append(FilterStage("liquidity", COST_LOCAL, liquidity))
+
+    async def already_traded(event, context):
+        if context.traded is None or not context.wallet_ids:
+            return None
+        token_address = event.get("token_address")
+        if all(context.traded.has_traded(wallet_id, token_address) for wallet_id in context.wallet_ids):
+            return "Already traded this token"
+        return None
+    stages.append(FilterStage("already_traded", COST_CACHED, already_traded))
+
+    # Rugs tolerated per creator (None disables) and launches allowed before
+    # a creator counts as a serial launcher (None: no limit)
+    max_creator_rugs = config.get("max_creator_rugs", 0)
+    max_creator_launches = config.get("max_creator_launches")
+    if max_creator_rugs is not None or max_creator_launches is not None:
+        async def creator_reputation(event, context):
+            if context.creators is None:
+                return None
+            record = context.creators.get(event.get("creator"))
+            if record is None:
+                return None
+            if max_creator_rugs is not None and record.rugs_observed > max_creator_rugs:
+                return f"Creator rugged {record.rugs_observed} token(s)"
+            if max_creator_launches is not None and record.tokens_launched > max_creator_launches:
+                return f"Creator launched {record.tokens_launched} tokens (max {max_creator_launches})"
+            return None
+        stages.append(FilterStage("creator_reputation", COST_CACHED, creator_reputation))
+
+    if config.get("require_mint_renounced", True):
+        async def mint_authority(event, context):
+            if not context.analyzer.check_mint_authority(await context.get_mint(event["token_address"])):
+                return "Mint authority not renounced"
+            return None
+        stages.append(FilterStage("mint_authority", COST_RPC, mint_authority))
+
+    if config.get("require_freeze_renounced", True):
+        async def freeze_authority(event, context):
+            if not context.analyzer.check_freeze_authority(await context.get_mint(event["token_address"])):
+                return "Freeze authority not renounced"
+            return None
+        stages.append(FilterStage("freeze_authority", COST_RPC, freeze_authority))
+
+    min_safety_score = config.get("min_safety_score", 70)
+    if min_safety_score > 0:
+        async def safety_score(event, context):
+            score = (await context.get_analysis(event["token_address"]))["safety_score"]
+            if score < min_safety_score:
+                return f"Safety score too low ({score} < {min_safety_score})"
+            return None
+        stages.append(FilterStage("safety_score", COST_MULTI_RPC, safety_score))
+
+    # Effective sell tax (%) from a simulated sell; None disables. An
+    # inconclusive simulation (no holder or route yet) does not reject.
+    max_sell_tax = config.get("max_sell_tax")
+    if max_sell_tax is not None:
+        async def sell_tax(event, context):
+            if context.honeypot is None:
+                return None
+            check = await context.get_sell_check(event["token_address"])
+            if check["honeypot"]:
+                return f"Sell simulation failed (honeypot): {check.get('simulation_error')}"
+            if check["sell_tax"] is not None and check["sell_tax"] > max_sell_tax:
+                return f"Sell tax too high ({check['sell_tax']}% > {max_sell_tax}%)"
+            return None
+        stages.append(FilterStage("sell_tax", COST_MULTI_RPC, sell_tax))
+
+    return FilterPipeline(stages)
@@ -0,0 +1,124 @@
+"""
+Honeypot Check
+Simulates a small sell of the candidate token from an existing holder and
+compares the SOL the simulation actually delivers with what Jupiter quoted.
+The shortfall is the token's effective sell tax; a sell that fails to
+simulate at all is a honeypot.
+"""
+
+import asyncio
+import base64
+from typing import Any, Dict, Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.rpc import AsyncRpc, get_async_rpc
+from monitoring.token_analyzer import EXCLUDED_OWNERS, pumpfun_bonding_curve
+from trading.jupiter import JupiterClient, SOL_MINT
+from utils.token_layout import associated_token_address, decode_token_account
+
+class HoneypotChecker:
+    """Effective sell tax of a token from a simulated holder sell"""
+
+    def __init__(self, jupiter: JupiterClient, analyzer: Any, rpc: AsyncRpc = None,
+                 sell_fraction: float = 0.01, slippage_bps: int = 5000):
+        """
+        Args:
+            jupiter: Client used for the sell quote and transaction
+            analyzer: TokenAnalyzer whose (cached) largest holders are sold from
+            rpc: Async RPC client for the simulation
+            sell_fraction: Share of the holder's balance to sell
+            slippage_bps: Slippage allowed in the simulated swap; a tax above
+                it makes the simulation fail, which counts as a honeypot
+        """
+        self.jupiter = jupiter
+        self.analyzer = analyzer
+        self.rpc = rpc or get_async_rpc()
+        self.sell_fraction = sell_fraction
+        self.slippage_bps = slippage_bps
+        self.checks = 0
+        self.honeypots = 0
+        self.inconclusive = 0
+
+    async def _holder(self, token_address: str) -> Optional[tuple]:
+        """Largest holder that is an ordinary wallet (not a pool or curve)"""
+        excluded = EXCLUDED_OWNERS | {pumpfun_bonding_curve(token_address)}
+        for owner, amount in await self.analyzer.fetch_holders(token_address):
+            if owner not in excluded:
+                return owner, amount
+        return None
+
+    async def _wsol_balance(self, wsol_account: str) -> int:
+        (account,) = await self.rpc.get_multiple_accounts([wsol_account], commitment="processed")
+        return decode_token_account(account["data"]).amount if account else 0
+
+    async def check(self, token_address: str) -> Dict[str, Any]:
+        """
+        Simulate selling a slice of the largest holder's tokens
+
+        The swap leaves SOL wrapped so the proceeds can be read from the
+        holder's WSOL account, unaffected by transaction fees.
+
+        Args:
+            token_address: Token mint to check
+
+        Returns:
+            dict with "success", "sell_tax" (percent, None if inconclusive),
+            "honeypot" and, when the check could not run, "error"
+        """
+        self.checks += 1
+        result: Dict[str, Any] = {"success": False, "sell_tax": None, "honeypot": False}
+        try:
+            holder = await self._holder(token_address)
+            if holder is None:
+                result["error"] = "No holder to simulate a sell from"
+                self.inconclusive += 1
+                return result
+            owner, balance = holder
+            result["holder"] = owner
+            wsol_account = associated_token_address(owner, SOL_MINT)
+
+            amount = max(int(balance * self.sell_fraction), 1)
+            quote, before = await asyncio.gather(
+                self.jupiter.get_quote(token_address, SOL_MINT, amount, self.slippage_bps),
+                self._wsol_balance(wsol_account)
+            )
+            swap = await self.jupiter.get_swap_transaction(quote, owner, wrap_unwrap_sol=False) if quote else None
+            if not swap:
+                result["error"] = "No sell route"
+                self.inconclusive += 1
+                return result
+
+            simulation = await self.rpc.call("simulateTransaction", [swap[0], {
+                "encoding": "base64",
+                "sigVerify": False,
+                "replaceRecentBlockhash": True,
+                "commitment": "processed",
+                "accounts": {"encoding": "base64", "addresses": [wsol_account]}
+            }])
+            value = simulation["value"]
+            result["success"] = True
+            if value.get("err") is not None:
+                result.update({"sell_tax": 100.0, "honeypot": True, "simulation_error": value["err"]})
+                self.honeypots += 1
+                return result
+
+            account = (value.get("accounts") or [None])[0]
+            after = decode_token_account(base64.b64decode(account["data"][0])).amount if account else 0
+            quoted = int(quote["outAmount"])
+            received = after - before
+            result.update({
+                "quoted_out": quoted,
+                "received": received,
+                "sell_tax": round(max(0.0, (quoted - received) / quoted * 100), 2) if quoted else 0.0
+            })
+            return result
+        except Exception as e:
+            result["error"] = str(e)
+            self.inconclusive += 1
+            return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"checks": self.checks, "honeypots": self.honeypots, "inconclusive": self.inconclusive}
@@ -1,26 +1,80 @@
 import httpx
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
-from solders.transaction import Transaction
+from solders.instruction import Instruction, AccountMeta
+from solders.transaction import VersionedTransaction
 from solana.rpc.api import Client
 from solana.rpc.commitment import Confirmed
+from solana.rpc.types import TxOpts
+from contextlib import nullcontext
 import base64
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import RPC_ENDPOINT
+from config import RPC_ENDPOINT, JUPITER_API_URL
+from utils.timing import StageTimer
+from trading.sender import get_transaction_sender
 
-JUPITER_API = "https://quote-api.jup.ag/v6"
+JUPITER_API = JUPITER_API_URL
 USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
 SOL_MINT = "So11111111111111111111111111111111111111112"
 
+def _stage(timer: Optional[StageTimer], name: str):
+    """Time a block when a timer is supplied, otherwise do nothing"""
+    return timer.stage(name) if timer else nullcontext()
+
 class JupiterClient:
-    def __init__(self):
-        self.api_url = JUPITER_API
-        self.client = Client(RPC_ENDPOINT)
+    def __init__(self, api_url: str = None, rpc_endpoint: str = None, sender=None, priority_fees=None):
+        self.api_url = api_url or JUPITER_API
+        self.client = Client(rpc_endpoint or RPC_ENDPOINT)
+        # Optional TransactionSender; when set, swaps are rebroadcast until they land
+        self.sender = sender
+        # Optional PriorityFeeCache; when set, swaps pay its compute-unit price
+        self.priority_fees = priority_fees
+        self._http: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Pooled HTTP client reused across quote and swap requests"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=httpx.Timeout(10.0),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        return self._http
+    
+    async def close(self):
+        """Close pooled connections"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    async def warm_up(self, amount: int = 10**8) -> bool:
+        """
+        Open the pooled connection (DNS, TLS, keep-alive) with a throwaway quote
+        
+        Args:
+            amount: Lamports of SOL to quote into USDC
+        
+        Returns:
+            True if the quote came back
+        """
+        return await self.get_quote(SOL_MINT, USDC_MINT, amount) is not None
+    
+    async def _swap_payload(self, quote: Dict[str, Any], user_public_key: str, wrap_unwrap_sol: bool) -> Dict[str, Any]:
+        payload = {
+            "quoteResponse": quote,
+            "userPublicKey": user_public_key,
+            "wrapAndUnwrapSol": wrap_unwrap_sol,
+        }
+        if self.priority_fees is not None:
+            fee = await self.priority_fees.get()
+            if fee is not None:
+                payload["computeUnitPriceMicroLamports"] = fee
+        return payload
     
     async def get_quote(
         self,
@@ -42,18 +96,17 @@ class JupiterClient:
             Quote data or None if failed
         """
         try:
-            async with httpx.AsyncClient() as client:
-                params = {
-                    "inputMint": input_mint,
-                    "outputMint": output_mint,
-                    "amount": str(amount),
-                    "slippageBps": slippage_bps,
-                }
-                
-                response = await client.get(f"{self.api_url}/quote", params=params)
-                response.raise_for_status()
-                
-                return response.json()
+            params = {
+                "inputMint": input_mint,
+                "outputMint": output_mint,
+                "amount": str(amount),
+                "slippageBps": slippage_bps,
+            }
+            
+            response = await self.http.get(f"{self.api_url}/quote", params=params)
+            response.raise_for_status()
+            
+            return response.json()
         except Exception as e:
             print(f"Error getting quote: {e}")
             return None
@@ -63,7 +116,7 @@ class JupiterClient:
         quote: Dict[str, Any],
         user_public_key: str,
         wrap_unwrap_sol: bool = True
-    ) -> Optional[str]:
+    ) -> Optional[Tuple[str, Optional[int]]]:
         """
         Get swap transaction from Jupiter
         
@@ -73,33 +126,82 @@ class JupiterClient:
             wrap_unwrap_sol: Whether to wrap/unwrap SOL
         
         Returns:
-            Serialized transaction or None if failed
+            (serialized transaction, last valid block height of its
+            blockhash) or None if failed
         """
         try:
-            async with httpx.AsyncClient() as client:
-                payload = {
-                    "quoteResponse": quote,
-                    "userPublicKey": user_public_key,
-                    "wrapAndUnwrapSol": wrap_unwrap_sol,
-                }
-                
-                response = await client.post(
-                    f"{self.api_url}/swap",
-                    json=payload
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                return data.get("swapTransaction")
+            payload = await self._swap_payload(quote, user_public_key, wrap_unwrap_sol)
+            
+            response = await self.http.post(
+                f"{self.api_url}/swap",
+                json=payload
+            )
+            response.raise_for_status()
+            
+            data = response.json()
+            if not data.get("swapTransaction"):
+                return None
+            return data["swapTransaction"], data.get("lastValidBlockHeight")
         except Exception as e:
             print(f"Error getting swap transaction: {e}")
             return None
     
+    async def get_swap_instructions(
+        self,
+        quote: Dict[str, Any],
+        user_public_key: str,
+        wrap_unwrap_sol: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the individual swap instructions from Jupiter
+        
+        Used when the transaction has to be assembled locally, e.g. with a
+        durable nonce instead of a recent blockhash.
+        
+        Args:
+            quote: Quote data from get_quote
+            user_public_key: User's wallet public key
+            wrap_unwrap_sol: Whether to wrap/unwrap SOL
+        
+        Returns:
+            dict with "instructions" (List[Instruction], in execution order) and
+            "lookup_tables" (List[str] of lookup table addresses), or None if failed
+        """
+        try:
+            payload = await self._swap_payload(quote, user_public_key, wrap_unwrap_sol)
+            
+            response = await self.http.post(
+                f"{self.api_url}/swap-instructions",
+                json=payload
+            )
+            response.raise_for_status()
+            
+            data = response.json()
+            raw = (
+                data.get("computeBudgetInstructions", [])
+                + data.get("setupInstructions", [])
+                + [data["swapInstruction"]]
+                + ([data["cleanupInstruction"]] if data.get("cleanupInstruction") else [])
+            )
+            return {
+                "instructions": [instruction_from_jupiter(ix) for ix in raw],
+                "lookup_tables": data.get("addressLookupTableAddresses", [])
+            }
+        except Exception as e:
+            print(f"Error getting swap instructions: {e}")
+            return None
+    
+    def sign_swap(self, keypair: Keypair, swap_transaction: str) -> bytes:
+        """Decode a Jupiter swap transaction and return it signed, serialized"""
+        transaction = VersionedTransaction.from_bytes(base64.b64decode(swap_transaction))
+        return bytes(VersionedTransaction(transaction.message, [keypair]))
+    
     def execute_swap(
         self,
         keypair: Keypair,
         swap_transaction: str,
-        max_retries: int = 3
+        max_retries: int = 3,
+        timer: Optional[StageTimer] = None
     ) -> Optional[str]:
         """
         Execute swap transaction
@@ -108,34 +210,40 @@ class JupiterClient:
             keypair: User's keypair
             swap_transaction: Serialized transaction from Jupiter
             max_retries: Maximum number of retries
+            timer: Optional timer to record decode/sign/send/confirm stages
         
         Returns:
             Transaction signature or None if failed
         """
         try:
-            # Decode transaction
-            transaction_bytes = base64.b64decode(swap_transaction)
-            transaction = Transaction.from_bytes(transaction_bytes)
+            # Decode transaction (Jupiter v6 returns a versioned transaction)
+            with _stage(timer, "decode"):
+                transaction_bytes = base64.b64decode(swap_transaction)
+                transaction = VersionedTransaction.from_bytes(transaction_bytes)
             
             # Sign transaction
-            transaction.sign(keypair)
+            with _stage(timer, "sign"):
+                transaction = VersionedTransaction(transaction.message, [keypair])
+                raw_transaction = bytes(transaction)
             
             # Send transaction
-            opts = {"skip_preflight": False, "preflight_commitment": Confirmed}
+            opts = TxOpts(skip_preflight=False, preflight_commitment=Confirmed)
             
             for attempt in range(max_retries):
                 try:
-                    result = self.client.send_raw_transaction(
-                        bytes(transaction),
-                        opts=opts
-                    )
+                    with _stage(timer, "send"):
+                        result = self.client.send_raw_transaction(
+                            raw_transaction,
+                            opts=opts
+                        )
                     
                     if result.value:
                         signature = str(result.value)
                         print(f"Transaction sent: {signature}")
                         
                         # Wait for confirmation
-                        self.client.confirm_transaction(result.value, commitment=Confirmed)
+                        with _stage(timer, "confirm"):
+                            self.client.confirm_transaction(result.value, commitment=Confirmed)
                         return signature
                 except Exception as e:
                     print(f"Attempt {attempt + 1} failed: {e}")
@@ -147,13 +255,56 @@ class JupiterClient:
             print(f"Error executing swap: {e}")
             return None
     
+    async def send_swap(
+        self,
+        keypair: Keypair,
+        swap_transaction: str,
+        timer: Optional[StageTimer] = None,
+        last_valid_block_height: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Sign a swap and hand it to the transaction sender
+        
+        The same signed bytes are rebroadcast until the swap confirms or its
+        blockhash expires (``last_valid_block_height``, as returned by
+        Jupiter). Swaps are never re-signed: a stale quote is not safe to
+        replay with a fresh blockhash.
+        
+        Returns:
+            Transaction signature or None if it did not land
+        """
+        try:
+            with _stage(timer, "decode"):
+                transaction = VersionedTransaction.from_bytes(base64.b64decode(swap_transaction))
+            
+            with _stage(timer, "sign"):
+                raw_transaction = bytes(VersionedTransaction(transaction.message, [keypair]))
+            
+            with _stage(timer, "send"):
+                landed = await self.sender.submit(raw_transaction, "swap", last_valid_block_height)
+            
+            with _stage(timer, "confirm"):
+                outcome = await landed
+            
+            if not outcome["landed"]:
+                print(f"Swap {outcome['signature']} {outcome['state']}: {outcome['error']}")
+                return None
+            
+            print(f"Transaction landed: {outcome['signature']}")
+            return outcome["signature"]
+        except Exception as e:
+            print(f"Error executing swap: {e}")
+            return None
+    
     async def swap(
         self,
         keypair: Keypair,
         input_mint: str,
         output_mint: str,
         amount: int,
-        slippage_bps: int = 50
+        slippage_bps: int = 50,
+        timer: Optional[StageTimer] = None,
+        quote: Optional[Dict[str, Any]] = None
     ) -> Optional[str]:
         """
         Complete swap operation
@@ -164,36 +315,64 @@ class JupiterClient:
             output_mint: Output token mint
             amount: Amount to swap
             slippage_bps: Slippage tolerance
+            timer: Optional timer; receives quote, swap_transaction, decode,
+                sign, send and confirm stages
+            quote: Quote already fetched for this swap; skips the quote request
         
         Returns:
             Transaction signature or None
         """
         # Get quote
-        quote = await self.get_quote(input_mint, output_mint, amount, slippage_bps)
+        if quote is None:
+            with _stage(timer, "quote"):
+                quote = await self.get_quote(input_mint, output_mint, amount, slippage_bps)
         if not quote:
             print("Failed to get quote")
             return None
         
         # Get swap transaction
-        swap_tx = await self.get_swap_transaction(
-            quote,
-            str(keypair.pubkey()),
-            wrap_unwrap_sol=True
-        )
-        if not swap_tx:
+        with _stage(timer, "swap_transaction"):
+            swap = await self.get_swap_transaction(
+                quote,
+                str(keypair.pubkey()),
+                wrap_unwrap_sol=True
+            )
+        if not swap:
             print("Failed to get swap transaction")
             return None
+        swap_tx, last_valid_block_height = swap
         
         # Execute swap
-        signature = self.execute_swap(keypair, swap_tx)
+        if self.sender is not None:
+            return await self.send_swap(keypair, swap_tx, timer=timer,
+                                        last_valid_block_height=last_valid_block_height)
+        signature = self.execute_swap(keypair, swap_tx, timer=timer)
         return signature
 
 # Helper functions
+def instruction_from_jupiter(data: Dict[str, Any]) -> Instruction:
+    """Convert a Jupiter instruction JSON object into a solders Instruction"""
+    return Instruction(
+        program_id=Pubkey.from_string(data["programId"]),
+        data=base64.b64decode(data["data"]),
+        accounts=[
+            AccountMeta(
+                pubkey=Pubkey.from_string(account["pubkey"]),
+                is_signer=account["isSigner"],
+                is_writable=account["isWritable"]
+            )
+            for account in data["accounts"]
+        ]
+    )
+
 async def buy_token(
     keypair: Keypair,
     token_address: str,
     sol_amount: float,
-    slippage_percent: float = 1.0
+    slippage_percent: float = 1.0,
+    timer: Optional[StageTimer] = None,
+    jupiter: Optional[JupiterClient] = None,
+    quote: Optional[Dict[str, Any]] = None
 ) -> Optional[str]:
     """
     Buy token with SOL
@@ -203,11 +382,17 @@ async def buy_token(
         token_address: Token to buy
         sol_amount: Amount of SOL to spend
         slippage_percent: Slippage tolerance (1.0 = 1%)
+        timer: Optional per-stage latency timer
+        jupiter: Long-lived client to reuse; a temporary one is created
+            (and closed) otherwise
+        quote: Buy quote fetched ahead of time (e.g. during the filters)
     
     Returns:
         Transaction signature or None
     """
-    jupiter = JupiterClient()
+    owned = jupiter is None
+    if owned:
+        jupiter = JupiterClient(sender=get_transaction_sender())
     
     # Convert SOL to lamports
     amount_lamports = int(sol_amount * 1e9)
@@ -215,19 +400,27 @@ async def buy_token(
     # Convert slippage to basis points
     slippage_bps = int(slippage_percent * 100)
     
-    return await jupiter.swap(
-        keypair=keypair,
-        input_mint=SOL_MINT,
-        output_mint=token_address,
-        amount=amount_lamports,
-        slippage_bps=slippage_bps
-    )
+    try:
+        return await jupiter.swap(
+            keypair=keypair,
+            input_mint=SOL_MINT,
+            output_mint=token_address,
+            amount=amount_lamports,
+            slippage_bps=slippage_bps,
+            timer=timer,
+            quote=quote
+        )
+    finally:
+        if owned:
+            await jupiter.close()
 
 async def sell_token(
     keypair: Keypair,
     token_address: str,
     token_amount: int,
-    slippage_percent: float = 1.0
+    slippage_percent: float = 1.0,
+    timer: Optional[StageTimer] = None,
+    jupiter: Optional[JupiterClient] = None
 ) -> Optional[str]:
     """
     Sell token for SOL
@@ -237,18 +430,28 @@ async def sell_token(
         token_address: Token to sell
         token_amount: Amount of tokens (in smallest unit)
         slippage_percent: Slippage tolerance
+        timer: Optional per-stage latency timer
+        jupiter: Long-lived client to reuse; a temporary one is created
+            (and closed) otherwise
     
     Returns:
         Transaction signature or None
     """
-    jupiter = JupiterClient()
+    owned = jupiter is None
+    if owned:
+        jupiter = JupiterClient(sender=get_transaction_sender())
     
     slippage_bps = int(slippage_percent * 100)
     
-    return await jupiter.swap(
-        keypair=keypair,
-        input_mint=token_address,
-        output_mint=SOL_MINT,
-        amount=token_amount,
-        slippage_bps=slippage_bps
-    )
+    try:
+        return await jupiter.swap(
+            keypair=keypair,
+            input_mint=token_address,
+            output_mint=SOL_MINT,
+            amount=token_amount,
+            slippage_bps=slippage_bps,
+            timer=timer
+        )
+    finally:
+        if owned:
+            await jupiter.close()
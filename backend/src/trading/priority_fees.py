@@ -0,0 +1,61 @@
+"""
+Priority Fee Cache
+Compute-unit price (micro-lamports) from recent prioritization fees, kept
+for a few seconds so swaps do not wait on getRecentPrioritizationFees
+"""
+
+import time
+from typing import Optional, Sequence
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.rpc import AsyncRpc, get_async_rpc
+from utils.timing import percentile
+
+class PriorityFeeCache:
+    """Percentile of the last ~150 slots' non-zero prioritization fees"""
+
+    def __init__(self, rpc: AsyncRpc = None, pct: float = 75.0, ttl: float = 10.0,
+                 accounts: Sequence[str] = ()):
+        """
+        Args:
+            rpc: Async RPC client
+            pct: Percentile of recent fees to pay
+            ttl: Seconds a computed fee is reused
+            accounts: Writable accounts to scope the fee sample to
+        """
+        self.rpc = rpc or get_async_rpc()
+        self.pct = pct
+        self.ttl = ttl
+        self.accounts = list(accounts)
+        self.fee: Optional[int] = None
+        self._fetched_at = 0.0
+        self.refreshes = 0
+
+    async def refresh(self) -> int:
+        """Fetch recent fees and recompute the cached compute-unit price"""
+        params = [self.accounts] if self.accounts else []
+        result = await self.rpc.call("getRecentPrioritizationFees", params)
+        fees = [item["prioritizationFee"] for item in result or () if item.get("prioritizationFee")]
+        self.fee = int(percentile(fees, self.pct))
+        self._fetched_at = time.monotonic()
+        self.refreshes += 1
+        return self.fee
+
+    async def get(self) -> Optional[int]:
+        """
+        Cached compute-unit price, refreshed once older than ``ttl``
+
+        Returns:
+            Micro-lamports per compute unit, or the last known value (None
+            before the first successful fetch) when the RPC fails
+        """
+        if self.fee is not None and time.monotonic() - self._fetched_at < self.ttl:
+            return self.fee
+        try:
+            return await self.refresh()
+        except Exception as e:
+            print(f"✗ Priority fee refresh failed: {e}")
+            return self.fee
@@ -0,0 +1,267 @@
+"""
+Transaction Sender
+Track every submitted transaction, rebroadcast the same signed bytes until
+it lands or its blockhash expires, optionally re-sign, and report landing
+rates per operation type
+"""
+
+import asyncio
+import base64
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from solders.signature import Signature
+from core.rpc import AsyncRpc, RpcError, get_async_rpc
+
+# A blockhash stays valid for 150 blocks after the block it was taken from
+BLOCKHASH_VALIDITY_BLOCKS = 150
+
+# Seconds a cached block height is trusted for defaulting a transaction's expiry
+BLOCK_HEIGHT_MAX_AGE = 2.0
+
+# getSignatureStatuses accepts at most 256 signatures per call
+MAX_STATUS_BATCH = 256
+
+# Re-sign callback: returns fresh (signed bytes, last valid block height)
+Resigner = Callable[[], Awaitable[Tuple[bytes, int]]]
+
+def signature_of(raw: bytes) -> str:
+    """First signature of a serialized transaction"""
+    return str(Signature.from_bytes(raw[1:65]))
+
+class TrackedTransaction:
+    """One in-flight transaction and its rebroadcast state"""
+
+    __slots__ = ("raw", "signature", "op_type", "last_valid_block_height", "resign",
+                 "resigns", "broadcasts", "submitted_at", "future")
+
+    def __init__(self, raw: bytes, op_type: str, last_valid_block_height: Optional[int],
+                 resign: Optional[Resigner], future: asyncio.Future):
+        self.raw = raw
+        self.signature = signature_of(raw)
+        self.op_type = op_type
+        self.last_valid_block_height = last_valid_block_height
+        self.resign = resign
+        self.resigns = 0
+        self.broadcasts = 0
+        self.submitted_at = time.perf_counter()
+        self.future = future
+
+class TransactionSender:
+    """Rebroadcast-until-landed sender shared by trading and bulk operations"""
+
+    def __init__(
+        self,
+        rpc: AsyncRpc = None,
+        rebroadcast_interval: float = 0.3,
+        max_resigns: int = 2,
+        commitment: str = "confirmed"
+    ):
+        self.rpc = rpc or get_async_rpc()
+        self.rebroadcast_interval = rebroadcast_interval
+        self.max_resigns = max_resigns
+        self.commitment = commitment
+        self._pending: Dict[str, TrackedTransaction] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._block_height: Optional[int] = None
+        self._block_height_at = 0.0
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def _stat(self, op_type: str) -> Dict[str, float]:
+        return self._stats.setdefault(op_type, {
+            "submitted": 0, "landed": 0, "failed": 0, "expired": 0,
+            "resigned": 0, "broadcasts": 0, "landing_ms_total": 0.0
+        })
+
+    async def submit(
+        self,
+        raw: bytes,
+        op_type: str,
+        last_valid_block_height: Optional[int] = None,
+        resign: Optional[Resigner] = None
+    ) -> asyncio.Future:
+        """
+        Send a signed transaction and keep rebroadcasting it until it lands
+
+        Args:
+            raw: Signed, serialized transaction
+            op_type: Label used for landing-rate stats (e.g. "swap", "transfer")
+            last_valid_block_height: Expiry of the transaction's blockhash;
+                defaults to the current block height + 150 when unknown
+                (read again if the cached height is stale)
+            resign: Optional callback producing a re-signed copy with a fresh
+                blockhash. Only pass it for idempotent operations.
+
+        Returns:
+            Future resolving to the outcome dict (see ``_outcome``)
+        """
+        future = asyncio.get_running_loop().create_future()
+        tracked = TrackedTransaction(raw, op_type, last_valid_block_height, resign, future)
+
+        if tracked.last_valid_block_height is None:
+            tracked.last_valid_block_height = await self._current_block_height() + BLOCKHASH_VALIDITY_BLOCKS
+
+        self._stat(op_type)["submitted"] += 1
+        self._pending[tracked.signature] = tracked
+        await self._broadcast([tracked])
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    async def send(self, raw: bytes, op_type: str, last_valid_block_height: Optional[int] = None,
+                   resign: Optional[Resigner] = None) -> Dict[str, Any]:
+        """Submit and wait for the final outcome"""
+        return await (await self.submit(raw, op_type, last_valid_block_height, resign))
+
+    async def _current_block_height(self) -> int:
+        """
+        Block height for defaulting expiries
+
+        The cache is refreshed on every tick while transactions are pending;
+        after idle time it is older than ``BLOCK_HEIGHT_MAX_AGE`` and read again.
+        """
+        if self._block_height is None or time.monotonic() - self._block_height_at > BLOCK_HEIGHT_MAX_AGE:
+            await self.warm_up()
+        return self._block_height
+
+    async def warm_up(self) -> int:
+        """Open the RPC connection and cache the current block height"""
+        self._set_block_height(await self.rpc.call("getBlockHeight", [{"commitment": self.commitment}]))
+        return self._block_height
+
+    def _set_block_height(self, height: int):
+        self._block_height = height
+        self._block_height_at = time.monotonic()
+
+    async def _broadcast(self, transactions: List[TrackedTransaction]):
+        """Send the same signed bytes again; errors are left to the status check"""
+        config = {"encoding": "base64", "skipPreflight": True, "maxRetries": 0}
+        calls = [("sendTransaction", [base64.b64encode(t.raw).decode(), config]) for t in transactions]
+        try:
+            await self.rpc.batch(calls)
+        except Exception as e:
+            print(f"Rebroadcast failed: {e}")
+        for tracked in transactions:
+            tracked.broadcasts += 1
+            self._stat(tracked.op_type)["broadcasts"] += 1
+
+    async def _run(self):
+        while self._pending:
+            await asyncio.sleep(self.rebroadcast_interval)
+            try:
+                await self._tick()
+            except Exception as e:
+                print(f"Sender tick failed: {e}")
+
+    async def _tick(self):
+        pending = list(self._pending.values())
+
+        calls = [
+            ("getSignatureStatuses", [[t.signature for t in pending[i:i + MAX_STATUS_BATCH]]])
+            for i in range(0, len(pending), MAX_STATUS_BATCH)
+        ]
+        calls.append(("getBlockHeight", [{"commitment": self.commitment}]))
+        results = await self.rpc.batch(calls)
+
+        height = results[-1]
+        if not isinstance(height, RpcError):
+            self._set_block_height(height)
+
+        statuses: List[Optional[Dict[str, Any]]] = []
+        for result in results[:-1]:
+            if isinstance(result, RpcError):
+                statuses.extend([None] * MAX_STATUS_BATCH)
+            else:
+                statuses.extend(result["value"])
+
+        rebroadcast = []
+        for tracked, status in zip(pending, statuses):
+            if status and status.get("err") is not None:
+                self._finish(tracked, "failed", error=str(status["err"]))
+            elif status and status.get("confirmationStatus") in ("confirmed", "finalized"):
+                self._finish(tracked, "landed")
+            elif self._block_height is not None and self._block_height > tracked.last_valid_block_height:
+                await self._expire(tracked)
+            else:
+                rebroadcast.append(tracked)
+
+        if rebroadcast:
+            await self._broadcast(rebroadcast)
+
+    async def _expire(self, tracked: TrackedTransaction):
+        """Blockhash expired: re-sign when allowed, otherwise give up"""
+        if tracked.resign is None or tracked.resigns >= self.max_resigns:
+            self._finish(tracked, "expired", error="Blockhash expired before landing")
+            return
+
+        try:
+            raw, last_valid_block_height = await tracked.resign()
+        except Exception as e:
+            self._finish(tracked, "expired", error=f"Re-sign failed: {e}")
+            return
+
+        self._pending.pop(tracked.signature, None)
+        tracked.raw = raw
+        tracked.signature = signature_of(raw)
+        tracked.last_valid_block_height = last_valid_block_height
+        tracked.resigns += 1
+        self._stat(tracked.op_type)["resigned"] += 1
+        self._pending[tracked.signature] = tracked
+        await self._broadcast([tracked])
+
+    def _finish(self, tracked: TrackedTransaction, state: str, error: Optional[str] = None):
+        self._pending.pop(tracked.signature, None)
+        elapsed_ms = (time.perf_counter() - tracked.submitted_at) * 1000
+
+        stat = self._stat(tracked.op_type)
+        stat[state] += 1
+        if state == "landed":
+            stat["landing_ms_total"] += elapsed_ms
+
+        if not tracked.future.done():
+            tracked.future.set_result(self._outcome(tracked, state, elapsed_ms, error))
+
+    @staticmethod
+    def _outcome(tracked: TrackedTransaction, state: str, elapsed_ms: float, error: Optional[str]) -> Dict[str, Any]:
+        return {
+            "signature": tracked.signature,
+            "state": state,
+            "landed": state == "landed",
+            "broadcasts": tracked.broadcasts,
+            "resigns": tracked.resigns,
+            "elapsed_ms": round(elapsed_ms, 3),
+            "error": error
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Landing rate and counters per operation type"""
+        stats = {}
+        for op_type, stat in self._stats.items():
+            finished = stat["landed"] + stat["failed"] + stat["expired"]
+            stats[op_type] = {
+                "submitted": int(stat["submitted"]),
+                "landed": int(stat["landed"]),
+                "failed": int(stat["failed"]),
+                "expired": int(stat["expired"]),
+                "resigned": int(stat["resigned"]),
+                "pending": sum(1 for t in self._pending.values() if t.op_type == op_type),
+                "broadcasts": int(stat["broadcasts"]),
+                "landing_rate": round(stat["landed"] / finished * 100, 2) if finished else 0,
+                "avg_landing_ms": round(stat["landing_ms_total"] / stat["landed"], 3) if stat["landed"] else 0
+            }
+        return stats
+
+
+# Singleton
+_sender = None
+
+def get_transaction_sender():
+    global _sender
+    if _sender is None:
+        _sender = TransactionSender()
+    return _sender
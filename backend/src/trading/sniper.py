@@ -1,28 +1,57 @@
 import asyncio
-from typing import Dict, Any, Optional
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from monitoring.pool_monitor import MultiPlatformMonitor
-from monitoring.token_analyzer import TokenAnalyzer
+from monitoring.event_bus import PoolEventBus, get_pool_event_bus
+from monitoring.slot_clock import get_slot_clock
+from monitoring.token_analyzer import get_token_analyzer
 from trading.executor import TradeExecutor
+from trading.filters import COST_CACHED, COST_RPC, FilterContext, build_filter_pipeline
+from trading.honeypot import HoneypotChecker
+from trading.jupiter import JupiterClient, SOL_MINT
+from trading.priority_fees import PriorityFeeCache
+from trading.sender import TransactionSender, get_transaction_sender
+from trading.traded_mints import get_traded_mints
+from utils.timing import RollingStages, summarize
 from core.database import get_db, close_db, SniperConfig, Trade
 from solders.keypair import Keypair
 
 class SniperBot:
     """Automated token sniper bot"""
     
-    def __init__(self, wallet_id: int, keypair: Keypair, config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        wallet_id: int,
+        keypair: Keypair,
+        config: Optional[Dict[str, Any]] = None,
+        sniper_id: Optional[str] = None,
+        bus: Optional[PoolEventBus] = None
+    ):
         self.wallet_id = wallet_id
         self.keypair = keypair
         self.config = config or {}
+        self.sniper_id = sniper_id or f"wallet-{wallet_id}"
         self.is_running = False
-        self.monitor = None
-        self.analyzer = TokenAnalyzer()
-        self.executor = TradeExecutor(wallet_id, keypair)
+        self.bus = bus or get_pool_event_bus()
+        self.platforms = []
+        self.analyzer = get_token_analyzer()
+        # Long-lived clients reused by every buy, warmed up in start()
+        priority_fee_percentile = self.config.get("priority_fee_percentile")
+        self.priority_fees = PriorityFeeCache(pct=priority_fee_percentile) if priority_fee_percentile else None
+        self.sender = get_transaction_sender()
+        self.jupiter = JupiterClient(sender=self.sender, priority_fees=self.priority_fees)
+        self.executor = TradeExecutor(wallet_id, keypair, jupiter=self.jupiter)
+        # Sell simulation behind the sell_tax filter stage (max_sell_tax set)
+        self.honeypot = HoneypotChecker(self.jupiter, self.analyzer) if self.config.get("max_sell_tax") is not None else None
+        self.traded = get_traded_mints()
+        # Fed by the bus as pools are published
+        self.creators = self.bus.creators
         self.db = get_db()
         
         # Default config
@@ -33,6 +62,38 @@ class SniperBot:
         self.require_mint_renounced = self.config.get("require_mint_renounced", True)
         self.require_freeze_renounced = self.config.get("require_freeze_renounced", True)
         self.max_buy_tax = self.config.get("max_buy_tax", 10.0)
+        # Backfilled pools (missed during a reconnect) older than this are skipped
+        self.max_backfill_age = self.config.get("max_backfill_age", 20.0)
+        # Event queue between the shared monitor feed and this sniper's workers
+        self.workers = self.config.get("workers", 4)
+        self.queue_size = self.config.get("queue_size", 256)
+        self.overflow_policy = self.config.get("overflow_policy", "drop_oldest")
+        self.queue = None
+        self.filters = build_filter_pipeline(self.config)
+        # Sell positions bought on events the reconciler reports as dropped
+        # (fast mode); otherwise they are only flagged
+        self.unwind_dropped = self.config.get("unwind_dropped", False)
+        self.bought_tokens = set()
+        self.flagged_positions: List[Dict[str, Any]] = []
+        # Speculative mode: buy once the local/cached stages pass and run the
+        # RPC stages meanwhile, selling if they fail. The cap bounds capital
+        # in positions that are bought but not verified yet.
+        self.speculative = self.config.get("speculative", False)
+        self.max_speculative_positions = self.config.get("max_speculative_positions", 2)
+        self.speculative_positions = set()
+        self.speculative_outcomes = deque(maxlen=100)
+        self.speculative_stats = {"entries": 0, "verified": 0, "rejected": 0, "exits": 0, "exit_failures": 0}
+        # Open connections and prime caches before handling the first event
+        self.warm_up_enabled = self.config.get("warm_up", True)
+        self.warm_up_timeout = self.config.get("warm_up_timeout", 5.0)
+        self.warmup_ms: Dict[str, float] = {}
+        
+        # Latency trace: per-stage ms from socket receive to confirm, and how
+        # many slots after the pool's creation slot our buy was sent
+        self.slot_clock = get_slot_clock()
+        self.latency = RollingStages()
+        self.send_slots = RollingStages()
+        self.last_slots: Dict[str, Optional[int]] = {}
         
         # Tracking
         self.pools_detected = 0
@@ -41,6 +102,14 @@ class SniperBot:
     
     async def on_new_pool(self, pool_data: Dict[str, Any]):
         """Handle new pool detection"""
+        trace = pool_data.get("trace") or {}
+        # Socket receive time when the event came off the monitor feed
+        received = trace.get("received") or time.perf_counter()
+        stages: Dict[str, float] = {}
+        if "decoded" in trace:
+            stages["decode"] = (trace["decoded"] - received) * 1000
+            if "dequeued" in trace:
+                stages["queue"] = (trace["dequeued"] - trace["decoded"]) * 1000
         self.pools_detected += 1
         
         token_address = pool_data.get("token_address")
@@ -51,65 +120,157 @@ class SniperBot:
         print(f"   Address: {token_address}")
         print(f"   Liquidity: {liquidity} SOL")
         
-        # Check liquidity requirement
-        if liquidity < self.min_liquidity:
-            print(f"   ✗ Skipped: Liquidity too low ({liquidity} < {self.min_liquidity})")
+        # Cost-ordered checks; most events are rejected before any RPC
+        speculate = self.speculative and len(self.speculative_positions) < self.max_speculative_positions
+        # Verify-first buys fetch their quote alongside the sell simulation
+        context = FilterContext(self.analyzer, self.traded, self.wallet_ids, self.creators,
+                                honeypot=self.honeypot, quoter=None if speculate else self._buy_quote,
+                                commitment=pool_data.get("commitment") or "confirmed")
+        result = await self.filters.evaluate(pool_data, context, max_cost=COST_CACHED if speculate else None)
+        if result.passed and speculate and len(self.speculative_positions) >= self.max_speculative_positions:
+            # The cap filled up meanwhile: verify before buying after all
+            speculate = False
+            local_timings = result.timings
+            result = await self.filters.evaluate(pool_data, context, min_cost=COST_RPC)
+            result.timings = {**local_timings, **result.timings}
+        stages.update({f"filter.{name}": ms for name, ms in result.timings.items()})
+        stages["receive_to_decision"] = (time.perf_counter() - received) * 1000
+        if not result.passed:
+            print(f"   ✗ Skipped: {result.reason}")
             self.tokens_skipped += 1
+            self.latency.add(stages)
             return
         
-        # Analyze token safety
-        print(f"   🔍 Analyzing token safety...")
+        buy_trace: Dict[str, Any] = {"stages": stages, "quote": context.quote}
         try:
-            analysis = self.analyzer.analyze_token(token_address)
-            safety_score = analysis["safety_score"]
-            
-            print(f"   Safety Score: {safety_score}/100")
-            
-            # Check safety requirements
-            if self.require_mint_renounced and not analysis["mint_renounced"]:
-                print(f"   ✗ Skipped: Mint authority not renounced")
-                self.tokens_skipped += 1
-                return
-            
-            if self.require_freeze_renounced and not analysis["freeze_renounced"]:
-                print(f"   ✗ Skipped: Freeze authority not renounced")
-                self.tokens_skipped += 1
-                return
-            
-            if safety_score < self.min_safety_score:
-                print(f"   ✗ Skipped: Safety score too low ({safety_score} < {self.min_safety_score})")
-                self.tokens_skipped += 1
-                return
-            
-            # All checks passed - execute buy
-            print(f"   ✓ All safety checks passed!")
-            print(f"   💰 Executing buy: {self.buy_amount} SOL")
-            
-            result = await self.executor.execute_buy(
-                token_address=token_address,
-                sol_amount=self.buy_amount,
-                slippage=self.slippage,
-                strategy="snipe"
-            )
-            
-            if result["success"]:
-                self.tokens_bought += 1
-                print(f"   ✅ Buy successful!")
-                print(f"   Signature: {result['signature']}")
-                print(f"   Explorer: {result['explorer_url']}")
+            if speculate:
+                print(f"   ⚡ Local checks passed, buying while the rest are verified")
+                await self._speculate(pool_data, context, received, buy_trace)
             else:
-                print(f"   ✗ Buy failed: {result.get('error')}")
-                self.tokens_skipped += 1
-        
+                if result.context.analysis:
+                    print(f"   Safety Score: {result.context.analysis['safety_score']}/100")
+                
+                # All checks passed - execute buy
+                print(f"   ✓ All safety checks passed!")
+                await self.buy(token_address, received, buy_trace)
         except Exception as e:
             print(f"   ✗ Error: {e}")
             self.tokens_skipped += 1
+        stages["receive_to_done"] = (time.perf_counter() - received) * 1000
+        self.latency.add(stages)
+        self._record_slots(pool_data.get("slot"), buy_trace.get("send_slot"))
+    
+    async def _speculate(self, pool_data: Dict[str, Any], context: FilterContext, received: float,
+                         trace: Dict[str, Any]):
+        """
+        Buy now and run the remaining (RPC) filter stages at the same time
+        
+        A position whose verification fails is sold straight away; every
+        entry's outcome is logged and kept in ``speculative_outcomes``.
+        
+        Args:
+            pool_data: Event that passed the local/cached stages
+            context: Its filter context (holds anything fetched so far)
+            received: perf_counter() timestamp of the pool event
+            trace: Per-event trace passed on to buy
+        """
+        token_address = pool_data.get("token_address")
+        self.speculative_positions.add(token_address)
+        self.speculative_stats["entries"] += 1
+        outcome = {
+            "token_address": token_address,
+            "bought": False,
+            "verified": False,
+            "reason": None,
+            "exited": None,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        try:
+            buy = asyncio.create_task(self.buy(token_address, received, trace))
+            # Let the buy issue its first request ahead of the analysis RPCs
+            await asyncio.sleep(0)
+            started = time.perf_counter()
+            verification = await self.filters.evaluate(pool_data, context, min_cost=COST_RPC)
+            trace["stages"]["speculative.verify"] = (time.perf_counter() - started) * 1000
+            trace["stages"].update({f"filter.{name}": ms for name, ms in verification.timings.items()})
+            outcome["verified"] = verification.passed
+            outcome["reason"] = verification.reason
+            self.speculative_stats["verified" if verification.passed else "rejected"] += 1
+            
+            await buy
+            outcome["bought"] = token_address in self.bought_tokens
+            if outcome["bought"] and not verification.passed:
+                print(f"   ✗ Verification failed after buy ({verification.reason}), exiting position")
+                outcome["exited"] = await self.unwind(token_address, strategy="speculative_exit")
+                self.speculative_stats["exits" if outcome["exited"] else "exit_failures"] += 1
+        finally:
+            self.speculative_positions.discard(token_address)
+            self.speculative_outcomes.append(outcome)
+            print(f"   ⚡ Speculative entry {token_address}: bought={outcome['bought']} "
+                  f"verified={outcome['verified']} exited={outcome['exited']}")
+    
+    async def _buy_quote(self, token_address: str) -> Optional[Dict[str, Any]]:
+        """Jupiter quote for this sniper's buy of ``token_address``"""
+        return await self.jupiter.get_quote(SOL_MINT, token_address, int(self.buy_amount * 1e9),
+                                            int(self.slippage * 100))
+    
+    def _record_slots(self, creation_slot: Optional[int], send_slot: Optional[int]):
+        """Keep the pool's on-chain creation slot against the slot we sent in"""
+        if send_slot is None:
+            return
+        self.last_slots = {"creation_slot": creation_slot, "send_slot": send_slot}
+        if creation_slot is not None:
+            self.send_slots.add({"send_minus_creation": send_slot - creation_slot})
+    
+    async def buy(self, token_address: str, received: float, trace: Optional[Dict[str, Any]] = None):
+        """
+        Buy a token that passed every check
+        
+        Args:
+            token_address: Token to buy
+            received: perf_counter() timestamp of the pool event
+            trace: Per-event trace; buy adds its stage timings (ms) under
+                "stages" and the slot it sent in as "send_slot", and reuses
+                a "quote" fetched during the filters
+        """
+        trace = trace if trace is not None else {}
+        if not self.traded.claim(self.wallet_id, token_address):
+            print(f"   ✗ Skipped: Already traded this token")
+            self.tokens_skipped += 1
+            return
+        
+        print(f"   💰 Executing buy: {self.buy_amount} SOL")
+        
+        # The executor runs quote → sign → send in one call; the slot is taken as it is issued
+        trace["send_slot"] = self.slot_clock.slot
+        result = await self.executor.execute_buy(
+            token_address=token_address,
+            sol_amount=self.buy_amount,
+            slippage=self.slippage,
+            strategy="snipe",
+            quote=trace.get("quote")
+        )
+        trace.setdefault("stages", {}).update(
+            {f"buy.{name}": ms for name, ms in (result.get("timings") or {}).items()}
+        )
+        
+        if result["success"]:
+            self.tokens_bought += 1
+            self.bought_tokens.add(token_address)
+            print(f"   ✅ Buy successful!")
+            print(f"   Signature: {result['signature']}")
+            print(f"   Explorer: {result['explorer_url']}")
+        else:
+            self.traded.release(self.wallet_id, token_address)
+            print(f"   ✗ Buy failed: {result.get('error')}")
+            self.tokens_skipped += 1
     
     async def start(self, platforms: list = None):
         """Start the sniper bot"""
         print("="*60)
         print("🎯 SNIPER BOT STARTING")
         print("="*60)
+        print(f"Sniper ID: {self.sniper_id}")
         print(f"Wallet ID: {self.wallet_id}")
         print(f"Buy Amount: {self.buy_amount} SOL")
         print(f"Min Liquidity: {self.min_liquidity} SOL")
@@ -119,15 +280,109 @@ class SniperBot:
         print("="*60)
         
         self.is_running = True
+        self.bus.reconciler.add_listener(self.on_dropped_event)
+        # Creator reputations are read from SQLite here, not inside the first publish
+        await asyncio.get_running_loop().run_in_executor(None, self.creators.ensure_loaded)
         
-        # Start monitoring
-        platforms = platforms or ["raydium", "pumpfun", "orca"]
-        self.monitor = MultiPlatformMonitor(platforms)
+        # Subscribe to the shared monitor feed instead of opening our own sockets
+        self.platforms = platforms or ["raydium", "pumpfun", "orca"]
+        self.queue = self.bus.subscribe(
+            self.sniper_id,
+            self.platforms,
+            maxsize=self.queue_size,
+            policy=self.overflow_policy,
+            min_liquidity=self.min_liquidity
+        )
         
+        # Events queue up meanwhile; the first one then meets warm paths
+        if self.warm_up_enabled:
+            self.warmup_ms = await self.warm_up()
+            print(f"🔥 Warm-up done in {self.warmup_ms['total']} ms")
+        
+        # Handle events on a worker pool so one slow analysis or buy does not
+        # hold back every later event
+        workers = [asyncio.create_task(self._worker()) for _ in range(max(1, self.workers))]
         try:
-            await self.monitor.start(self.on_new_pool)
+            await asyncio.gather(*workers)
         except KeyboardInterrupt:
             await self.stop()
+        finally:
+            for worker in workers:
+                worker.cancel()
+    
+    async def warm_up(self) -> Dict[str, float]:
+        """
+        Open pooled connections and fill caches so the first snipe is as fast as later ones
+        
+        Runs concurrently: a throwaway Jupiter quote (HTTP connection), the
+        sender's block height (RPC connection), the wallet's SOL balance and,
+        when configured, the priority fee. A stage that fails or times out is
+        reported and stays cold.
+        
+        Returns:
+            Milliseconds per stage and in total
+        """
+        stages = {
+            "jupiter": self.jupiter.warm_up(int(self.buy_amount * 1e9)),
+            "block_height": self.sender.warm_up(),
+            "balance": self.executor.refresh_balance()
+        }
+        if self.priority_fees is not None:
+            stages["priority_fee"] = self.priority_fees.refresh()
+        timings: Dict[str, float] = {}
+        
+        async def timed(name: str, stage) -> None:
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(stage, self.warm_up_timeout)
+            except Exception as e:
+                print(f"   ✗ Warm-up {name} failed: {e!r}")
+            timings[name] = round((time.perf_counter() - started) * 1000, 3)
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(timed(name, stage) for name, stage in stages.items()))
+        timings["total"] = round((time.perf_counter() - started) * 1000, 3)
+        return timings
+    
+    @property
+    def wallet_ids(self) -> List[int]:
+        """Wallets this sniper buys with"""
+        return [self.wallet_id]
+    
+    async def on_dropped_event(self, event: Dict[str, Any]):
+        """Flag (or unwind) a position taken on a pool event that never confirmed"""
+        token_address = event.get("token_address")
+        if token_address not in self.bought_tokens:
+            return
+        
+        flagged = {
+            "token_address": token_address,
+            "signature": event.get("signature"),
+            "reason": event.get("dropped_reason"),
+            "unwound": False
+        }
+        self.flagged_positions.append(flagged)
+        print(f"   ⚠️ Position in {token_address} was bought on a dropped event")
+        
+        if self.unwind_dropped:
+            flagged["unwound"] = await self.unwind(token_address)
+    
+    async def unwind(self, token_address: str, strategy: str = "unwind") -> bool:
+        """Sell the whole position; returns True if the sell succeeded"""
+        result = await self.executor.execute_sell(
+            token_address=token_address,
+            percentage=100.0,
+            slippage=self.slippage,
+            strategy=strategy
+        )
+        if not result["success"]:
+            print(f"   ✗ Unwind failed: {result.get('error')}")
+        return result["success"]
+    
+    async def _worker(self):
+        while self.is_running:
+            pool_data = await self.queue.get()
+            await self.on_new_pool(pool_data)
     
     async def stop(self):
         """Stop the sniper bot"""
@@ -141,28 +396,240 @@ class SniperBot:
         
         self.is_running = False
         
-        if self.monitor:
-            await self.monitor.stop()
+        self.bus.reconciler.remove_listener(self.on_dropped_event)
+        await self.bus.unsubscribe(self.sniper_id)
+        await self.jupiter.close()
         
         close_db(self.db)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get sniper statistics"""
         return {
+            "sniper_id": self.sniper_id,
+            "wallet_id": self.wallet_id,
+            "platforms": self.platforms,
             "is_running": self.is_running,
+            "queue": self.queue.get_stats() if self.queue else None,
+            "warmup_ms": self.warmup_ms,
+            "filters": self.filters.get_stats(),
+            "honeypot": self.honeypot.get_stats() if self.honeypot else None,
+            "latency_ms": self.latency.summary(),
+            "slots": {"last": self.last_slots, "send_minus_creation": self.send_slots.summary()},
             "pools_detected": self.pools_detected,
             "tokens_bought": self.tokens_bought,
             "tokens_skipped": self.tokens_skipped,
+            "flagged_positions": self.flagged_positions,
+            "speculative": {
+                "enabled": self.speculative,
+                "open": len(self.speculative_positions),
+                "max_open": self.max_speculative_positions,
+                **self.speculative_stats,
+                "recent": list(self.speculative_outcomes)[-10:]
+            },
             "success_rate": (self.tokens_bought / self.pools_detected * 100) if self.pools_detected > 0 else 0
         }
 
+class GroupSniper(SniperBot):
+    """Sniper that buys from every wallet of a group when one pool passes analysis"""
+    
+    def __init__(
+        self,
+        group_id: int,
+        wallets: List[Tuple[int, Keypair]],
+        config: Optional[Dict[str, Any]] = None,
+        sniper_id: Optional[str] = None,
+        bus: Optional[PoolEventBus] = None,
+        jupiter: Optional[JupiterClient] = None,
+        sender: Optional[TransactionSender] = None
+    ):
+        """
+        Args:
+            group_id: Wallet group ID
+            wallets: Pre-unlocked (wallet_id, keypair) pairs, decrypted once at start
+            config: Sniper settings shared by every wallet
+        """
+        if not wallets:
+            raise Exception("No wallets found in group")
+        
+        wallet_id, keypair = wallets[0]
+        super().__init__(wallet_id, keypair, config, sniper_id or f"group-{group_id}", bus)
+        self.group_id = group_id
+        self.wallets = wallets
+        self.jupiter = jupiter or JupiterClient(priority_fees=self.priority_fees)
+        if self.honeypot is not None:
+            self.honeypot.jupiter = self.jupiter
+        self.sender = sender or get_transaction_sender()
+        # Per-wallet executors for sells, created on first use and sharing self.jupiter
+        self.executors: Dict[int, TradeExecutor] = {}
+        # Wallets holding each bought token, so an unwind sells only from those
+        self.positions: Dict[str, Set[int]] = {}
+        self.wallet_buys = 0
+        self.wallet_failures = 0
+    
+    async def buy(self, token_address: str, received: float, trace: Optional[Dict[str, Any]] = None):
+        """Fire buys from all group wallets concurrently off one shared quote"""
+        trace = trace if trace is not None else {}
+        claimed = set(self.traded.claim_many([wallet_id for wallet_id, _ in self.wallets], token_address))
+        wallets = [(wallet_id, keypair) for wallet_id, keypair in self.wallets if wallet_id in claimed]
+        if not wallets:
+            print(f"   ✗ Skipped: Already traded this token")
+            self.tokens_skipped += 1
+            return
+        
+        print(f"   💰 Group buy: {len(wallets)} wallets x {self.buy_amount} SOL")
+        
+        amount = int(self.buy_amount * 1e9)
+        quote = trace.get("quote") or await self.jupiter.get_quote(SOL_MINT, token_address, amount, int(self.slippage * 100))
+        if not quote:
+            for wallet_id in claimed:
+                self.traded.release(wallet_id, token_address)
+            print(f"   ✗ Buy failed: No quote")
+            self.tokens_skipped += 1
+            return
+        quoted = time.perf_counter()
+        
+        async def buy_one(wallet_id: int, keypair: Keypair) -> Dict[str, Any]:
+            result = {"wallet_id": wallet_id, "success": False}
+            try:
+                swap = await self.jupiter.get_swap_transaction(quote, str(keypair.pubkey()))
+                if not swap:
+                    result["error"] = "No swap transaction"
+                    return result
+                
+                swap_tx, last_valid_block_height = swap
+                landed = await self.sender.submit(self.jupiter.sign_swap(keypair, swap_tx), "group_snipe",
+                                                  last_valid_block_height)
+                result["sent_at"] = time.perf_counter()
+                result["send_slot"] = self.slot_clock.slot
+                
+                outcome = await landed
+                result["signature"] = outcome["signature"]
+                result["success"] = outcome["landed"]
+                if not outcome["landed"]:
+                    result["error"] = outcome["error"] or outcome["state"]
+            except Exception as e:
+                result["error"] = str(e)
+            return result
+        
+        results = await asyncio.gather(*[buy_one(wallet_id, keypair) for wallet_id, keypair in wallets])
+        for r in results:
+            if not r["success"]:
+                self.traded.release(r["wallet_id"], token_address)
+        
+        sent = [r.pop("sent_at") for r in results if "sent_at" in r]
+        send_slots = [r.pop("send_slot") for r in results if r.get("send_slot") is not None]
+        latency = {
+            "buy.quote": (quoted - received) * 1000,
+            "receive_to_last_send": (max(sent) - received) * 1000 if sent else 0.0
+        }
+        trace.setdefault("stages", {}).update(latency)
+        if send_slots:
+            trace["send_slot"] = max(send_slots)
+        
+        self._record(token_address, quote, results)
+        
+        holders = {r["wallet_id"] for r in results if r["success"]}
+        if holders:
+            self.positions.setdefault(token_address, set()).update(holders)
+        bought = len(holders)
+        self.wallet_buys += bought
+        self.wallet_failures += len(results) - bought
+        if bought:
+            self.tokens_bought += 1
+            self.bought_tokens.add(token_address)
+        else:
+            self.tokens_skipped += 1
+        
+        print(f"   ✅ {bought}/{len(results)} wallets bought")
+        print(f"   Event → last send: {latency['receive_to_last_send']:.1f} ms")
+    
+    @property
+    def wallet_ids(self) -> List[int]:
+        return [wallet_id for wallet_id, _ in self.wallets]
+    
+    def _executor(self, wallet_id: int) -> TradeExecutor:
+        if wallet_id not in self.executors:
+            keypair = dict(self.wallets)[wallet_id]
+            self.executors[wallet_id] = TradeExecutor(wallet_id, keypair, jupiter=self.jupiter)
+        return self.executors[wallet_id]
+    
+    async def unwind(self, token_address: str, strategy: str = "unwind") -> bool:
+        """Sell the position from every group wallet that bought it"""
+        holders = sorted(self.positions.get(token_address, ()))
+        if not holders:
+            return False
+        results = await asyncio.gather(*[
+            self._executor(wallet_id).execute_sell(
+                token_address=token_address,
+                percentage=100.0,
+                slippage=self.slippage,
+                strategy=strategy
+            )
+            for wallet_id in holders
+        ], return_exceptions=True)
+        failed = 0
+        for wallet_id, r in zip(holders, results):
+            if isinstance(r, Exception) or not r["success"]:
+                failed += 1
+            else:
+                self.positions[token_address].discard(wallet_id)
+        if failed:
+            print(f"   ✗ Unwind failed for {failed}/{len(results)} wallets")
+        return not failed
+    
+    def _record(self, token_address: str, quote: Dict[str, Any], results: List[Dict[str, Any]]):
+        """Record every successful wallet buy with one commit"""
+        now = datetime.utcnow()
+        trades = [
+            Trade(
+                wallet_id=r["wallet_id"],
+                token_address=token_address,
+                trade_type="buy",
+                amount=int(quote.get("outAmount", 0)),
+                price=0,
+                cost=self.buy_amount,
+                signature=r["signature"],
+                timestamp=now,
+                strategy="group_snipe"
+            )
+            for r in results if r["success"]
+        ]
+        if not trades:
+            return
+        
+        db = get_db()
+        try:
+            db.add_all(trades)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"   ✗ Failed to record group buys: {e}")
+        finally:
+            close_db(db)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats.update({
+            "group_id": self.group_id,
+            "wallets": len(self.wallets),
+            "wallet_buys": self.wallet_buys,
+            "wallet_failures": self.wallet_failures
+        })
+        last = self.latency.last()
+        if "receive_to_last_send" in last:
+            stats["last_receive_to_last_send_ms"] = round(last["receive_to_last_send"], 3)
+        return stats
+
 # Sniper manager for API
 class SniperManager:
-    """Manage sniper bot instances"""
+    """Manage concurrent sniper bot instances keyed by id"""
     
     _instance = None
-    _sniper = None
-    _task = None
+    
+    def __init__(self, bus: Optional[PoolEventBus] = None):
+        self.bus = bus or get_pool_event_bus()
+        self._snipers: Dict[str, SniperBot] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
     
     @classmethod
     def get_instance(cls):
@@ -170,46 +637,151 @@ class SniperManager:
             cls._instance = cls()
         return cls._instance
     
-    def is_running(self) -> bool:
-        """Check if sniper is running"""
-        return self._sniper is not None and self._sniper.is_running
+    def is_running(self, sniper_id: Optional[str] = None) -> bool:
+        """Check if a sniper (or any sniper when no id is given) is running"""
+        if sniper_id is not None:
+            sniper = self._snipers.get(sniper_id)
+            return sniper is not None and sniper.is_running
+        return any(sniper.is_running for sniper in self._snipers.values())
     
-    async def start(self, wallet_id: int, keypair: Keypair, config: Dict[str, Any]):
-        """Start sniper bot"""
-        if self.is_running():
-            raise Exception("Sniper already running")
+    async def start(
+        self,
+        wallet_id: int,
+        keypair: Keypair,
+        config: Dict[str, Any],
+        sniper_id: Optional[str] = None,
+        platforms: Optional[list] = None
+    ):
+        """
+        Start a sniper bot instance
         
-        self._sniper = SniperBot(wallet_id, keypair, config)
-        self._task = asyncio.create_task(self._sniper.start())
+        Args:
+            wallet_id: Wallet the sniper buys with
+            keypair: Unlocked wallet keypair
+            config: Sniper settings
+            sniper_id: Instance key (default "wallet-<wallet_id>")
+            platforms: Platforms to snipe on
+        """
+        sniper_id = sniper_id or f"wallet-{wallet_id}"
+        if self.is_running(sniper_id):
+            raise Exception(f"Sniper {sniper_id} already running")
+        
+        sniper = SniperBot(wallet_id, keypair, config, sniper_id=sniper_id, bus=self.bus)
+        self._snipers[sniper_id] = sniper
+        self._tasks[sniper_id] = asyncio.create_task(sniper.start(platforms))
         
         # Give it a moment to start
         await asyncio.sleep(0.5)
         
-        return {"status": "started", "message": "Sniper bot started successfully"}
+        return {"status": "started", "sniper_id": sniper_id, "message": "Sniper bot started successfully"}
     
-    async def stop(self):
-        """Stop sniper bot"""
-        if not self.is_running():
-            raise Exception("Sniper not running")
+    async def start_group(
+        self,
+        group_id: int,
+        wallets: List[Tuple[int, Keypair]],
+        config: Dict[str, Any],
+        sniper_id: Optional[str] = None,
+        platforms: Optional[list] = None
+    ):
+        """
+        Start a group sniper instance
+        
+        Args:
+            group_id: Wallet group ID
+            wallets: Pre-unlocked (wallet_id, keypair) pairs
+            config: Sniper settings shared by every wallet
+            sniper_id: Instance key (default "group-<group_id>")
+            platforms: Platforms to snipe on
+        """
+        sniper_id = sniper_id or f"group-{group_id}"
+        if self.is_running(sniper_id):
+            raise Exception(f"Sniper {sniper_id} already running")
         
-        await self._sniper.stop()
+        sniper = GroupSniper(group_id, wallets, config, sniper_id=sniper_id, bus=self.bus)
+        self._snipers[sniper_id] = sniper
+        self._tasks[sniper_id] = asyncio.create_task(sniper.start(platforms))
+        
+        await asyncio.sleep(0.5)
+        
+        return {
+            "status": "started",
+            "sniper_id": sniper_id,
+            "wallets": len(wallets),
+            "message": "Group sniper started successfully"
+        }
+    
+    async def stop(self, sniper_id: Optional[str] = None):
+        """Stop one sniper, or every sniper when no id is given"""
+        if sniper_id is None:
+            if not self._snipers:
+                raise Exception("Sniper not running")
+            stopped = {}
+            for key in list(self._snipers):
+                stopped[key] = (await self._stop_one(key))["stats"]
+            return {"status": "stopped", "stats": stopped}
         
-        if self._task:
-            self._task.cancel()
+        if sniper_id not in self._snipers:
+            raise Exception(f"Sniper {sniper_id} not running")
+        return await self._stop_one(sniper_id)
+    
+    async def _stop_one(self, sniper_id: str):
+        sniper = self._snipers.pop(sniper_id)
+        task = self._tasks.pop(sniper_id, None)
+        
+        await sniper.stop()
+        
+        if task:
+            task.cancel()
             try:
-                await self._task
+                await task
             except asyncio.CancelledError:
                 pass
         
-        stats = self._sniper.get_stats()
-        self._sniper = None
-        self._task = None
-        
-        return {"status": "stopped", "stats": stats}
+        return {"status": "stopped", "sniper_id": sniper_id, "stats": sniper.get_stats()}
+    
+    def get_wallet_id(self, sniper_id: str) -> Optional[int]:
+        sniper = self._snipers.get(sniper_id)
+        return sniper.wallet_id if sniper else None
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get sniper status"""
-        if not self._sniper:
-            return {"is_running": False}
+    def get_status(self, sniper_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get status of one sniper or of all snipers"""
+        if sniper_id is not None:
+            sniper = self._snipers.get(sniper_id)
+            if not sniper:
+                return {"sniper_id": sniper_id, "is_running": False}
+            return sniper.get_stats()
+        
+        snipers = {key: sniper.get_stats() for key, sniper in self._snipers.items()}
+        pools_detected = sum(stats["pools_detected"] for stats in snipers.values())
+        tokens_bought = sum(stats["tokens_bought"] for stats in snipers.values())
         
-        return self._sniper.get_stats()
+        # Totals keep the single-sniper response shape used by the dashboard
+        return {
+            "is_running": self.is_running(),
+            "pools_detected": pools_detected,
+            "tokens_bought": tokens_bought,
+            "tokens_skipped": sum(stats["tokens_skipped"] for stats in snipers.values()),
+            "success_rate": (tokens_bought / pools_detected * 100) if pools_detected > 0 else 0,
+            "latency_ms": self._combined_latency(),
+            "snipers": snipers,
+            "event_bus": self.bus.get_stats()
+        }
+    
+    def _combined_latency(self) -> Dict[str, Dict[str, float]]:
+        samples = [sample for sniper in self._snipers.values() for sample in sniper.latency.samples]
+        return summarize(samples)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-stage latency of every sniper and of all snipers combined"""
+        return {
+            "latency_ms": self._combined_latency(),
+            "snipers": {
+                key: {
+                    "latency_ms": sniper.latency.summary(),
+                    "slots": {"last": sniper.last_slots, "send_minus_creation": sniper.send_slots.summary()},
+                    "filters": sniper.filters.get_stats()
+                }
+                for key, sniper in self._snipers.items()
+            },
+            "slot": get_slot_clock().slot
+        }
@@ -0,0 +1,74 @@
+"""
+Traded Mint Registry
+Remembers which wallets already bought which mints so a token is never
+bought twice by the same wallet, across restarts
+"""
+
+from typing import Iterable, List, Optional, Set, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import get_db, close_db, Trade
+
+class TradedMintRegistry:
+    """(wallet_id, mint) pairs already bought, loaded from the trades table"""
+
+    def __init__(self):
+        self._traded: Set[Tuple[int, str]] = set()
+        self._loaded = False
+
+    def load(self):
+        """Load every recorded buy (no RPC); raises, staying unloaded, if the database is unreadable"""
+        db = get_db()
+        try:
+            rows = db.query(Trade.wallet_id, Trade.token_address).filter(Trade.trade_type == "buy").distinct().all()
+            self._traded |= {(wallet_id, mint) for wallet_id, mint in rows}
+            self._loaded = True
+        finally:
+            close_db(db)
+
+    def has_traded(self, wallet_id: int, mint: str) -> bool:
+        """True if the wallet bought the mint; also True while the registry cannot load, so no buy goes out"""
+        if not self._loaded:
+            try:
+                self.load()
+            except Exception as e:
+                print(f"✗ Failed to load traded mints: {e}")
+                return True
+        return (wallet_id, mint) in self._traded
+
+    def claim(self, wallet_id: int, mint: str) -> bool:
+        """
+        Reserve a buy of ``mint`` for a wallet before sending it
+
+        Returns:
+            False if the wallet already bought (or is buying) this mint
+        """
+        if self.has_traded(wallet_id, mint):
+            return False
+        self._traded.add((wallet_id, mint))
+        return True
+
+    def claim_many(self, wallet_ids: Iterable[int], mint: str) -> List[int]:
+        """Claim a mint for several wallets; returns the wallets that may buy"""
+        return [wallet_id for wallet_id in wallet_ids if self.claim(wallet_id, mint)]
+
+    def record(self, wallet_id: int, mint: str):
+        """Note a buy that landed outside the claim path (manual, bulk or copy)"""
+        self._traded.add((wallet_id, mint))
+
+    def release(self, wallet_id: int, mint: str):
+        """Give a claim back after the buy did not land"""
+        self._traded.discard((wallet_id, mint))
+
+
+# Singleton
+_traded_mints: Optional[TradedMintRegistry] = None
+
+def get_traded_mints():
+    global _traded_mints
+    if _traded_mints is None:
+        _traded_mints = TradedMintRegistry()
+    return _traded_mints
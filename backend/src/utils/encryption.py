@@ -40,3 +40,43 @@ def decrypt_private_key(encrypted_data: str, password: str) -> str:
         return decrypted.decode()
     except Exception as e:
         raise ValueError(f"Decryption failed: {str(e)}")
+
+def encrypt_bytes(data: bytes, key: bytes, salt: bytes) -> str:
+    """
+    Encrypt raw bytes with an already derived key
+
+    Output uses the same salt + token layout as encrypt_private_key, so many
+    items encrypted under one derive_key() call can be decrypted with one KDF.
+    """
+    f = Fernet(key)
+    combined = salt + f.encrypt(data)
+    return base64.urlsafe_b64encode(combined).decode()
+
+def decrypt_bytes(encrypted_data: str, password: str = None, key_cache: dict = None) -> bytes:
+    """
+    Decrypt data produced by encrypt_bytes
+
+    Args:
+        encrypted_data: Output of encrypt_bytes
+        password: Password to derive the key when it is not cached
+        key_cache: Optional dict of salt -> derived key; filled on first use
+
+    Returns:
+        Decrypted bytes
+    """
+    try:
+        combined = base64.urlsafe_b64decode(encrypted_data.encode())
+        salt = combined[:16]
+        encrypted = combined[16:]
+
+        key = key_cache.get(salt) if key_cache is not None else None
+        if key is None:
+            if password is None:
+                raise ValueError("Vault is locked")
+            key, _ = derive_key(password, salt)
+            if key_cache is not None:
+                key_cache[salt] = key
+
+        return Fernet(key).decrypt(encrypted)
+    except Exception as e:
+        raise ValueError(f"Decryption failed: {str(e)}")
@@ -0,0 +1,53 @@
+"""
+Rate Limiter
+Async token bucket shared by everything that talks to the RPC endpoint
+"""
+
+import asyncio
+import time
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import RPC_RATE_LIMIT
+
+class RateLimiter:
+    """Token bucket: ``rate`` tokens per second, bursting up to ``burst``"""
+
+    def __init__(self, rate: float, burst: int = None):
+        self.rate = rate
+        self.burst = burst or max(int(rate), 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.waited_ms = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: int = 1):
+        """Wait until ``tokens`` can be taken (requests larger than burst are split)"""
+        while tokens > 0:
+            take = min(tokens, self.burst)
+            async with self._lock:
+                self._refill()
+                if self._tokens < take:
+                    wait = (take - self._tokens) / self.rate
+                    self.waited_ms += wait * 1000
+                    await asyncio.sleep(wait)
+                    self._refill()
+                self._tokens -= take
+            tokens -= take
+
+
+# Singleton
+_rate_limiter = None
+
+def get_rate_limiter():
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(RPC_RATE_LIMIT)
+    return _rate_limiter
@@ -0,0 +1,98 @@
+"""
+Latency Timing
+Per-stage timers and percentile summaries for the trade pipeline
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Iterable
+
+class StageTimer:
+    """Record elapsed milliseconds for each named stage of an operation"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block under ``name`` (repeated stages accumulate)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+    def total_ms(self) -> float:
+        """Milliseconds since the timer was created"""
+        return (time.perf_counter() - self.started) * 1000
+
+    def as_dict(self) -> Dict[str, float]:
+        """Stage timings in milliseconds, plus the overall total"""
+        result = {name: round(ms, 3) for name, ms in self.stages.items()}
+        result["total"] = round(self.total_ms(), 3)
+        return result
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """
+    Percentile with linear interpolation between closest ranks
+
+    Args:
+        values: Samples (any order)
+        pct: Percentile in the range 0-100
+
+    Returns:
+        Interpolated percentile, or 0.0 for an empty sample set
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+
+    rank = (len(ordered) - 1) * (pct / 100)
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    weight = rank - lower
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * weight
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """
+    Summarize a list of ``StageTimer.as_dict()`` results per stage
+
+    Returns:
+        {stage: {"count", "mean", "p50", "p95", "p99"}} in milliseconds
+    """
+    by_stage: Dict[str, List[float]] = {}
+    for sample in samples:
+        for name, ms in sample.items():
+            by_stage.setdefault(name, []).append(ms)
+
+    summary = {}
+    for name, values in by_stage.items():
+        summary[name] = {
+            "count": len(values),
+            "mean": round(sum(values) / len(values), 3),
+            "p50": round(percentile(values, 50), 3),
+            "p95": round(percentile(values, 95), 3),
+            "p99": round(percentile(values, 99), 3),
+        }
+    return summary
+
+class RollingStages:
+    """Per-stage summaries over the most recent ``window`` samples"""
+
+    def __init__(self, window: int = 1000):
+        self.samples = deque(maxlen=window)
+
+    def add(self, sample: Dict[str, float]):
+        self.samples.append(sample)
+
+    def last(self) -> Dict[str, float]:
+        return self.samples[-1] if self.samples else {}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return summarize(list(self.samples))
+
+    def __len__(self) -> int:
+        return len(self.samples)
@@ -0,0 +1,86 @@
+"""
+SPL Token Layouts
+Program ids and decoders for raw SPL Token / Token-2022 account data
+"""
+
+import struct
+from typing import NamedTuple, Optional
+
+from solders.pubkey import Pubkey
+
+TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+TOKEN_2022_PROGRAM_ID = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+TOKEN_PROGRAM_IDS = (TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID)
+ASSOCIATED_TOKEN_PROGRAM_ID = "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"
+
+# mint [32], owner [32], amount u64 - identical prefix for both token programs
+TOKEN_ACCOUNT_PREFIX_SIZE = 72
+
+# Mint: mint_authority COption<Pubkey> (u32 tag + [32]), supply u64, decimals u8,
+# is_initialized bool, freeze_authority COption<Pubkey> - identical base for both programs
+MINT_LAYOUT = struct.Struct("<I32sQBBI32s")
+MINT_SIZE = MINT_LAYOUT.size
+
+# Token-2022 pads the base mint to the token account size, then stores the account type
+TOKEN_2022_ACCOUNT_TYPE_OFFSET = 165
+TOKEN_2022_ACCOUNT_TYPE_MINT = 1
+
+def associated_token_address(owner: str, mint: str, token_program: str = TOKEN_PROGRAM_ID) -> str:
+    """Associated token account of ``owner`` for ``mint`` (a PDA, no RPC)"""
+    pda, _ = Pubkey.find_program_address(
+        [bytes(Pubkey.from_string(owner)), bytes(Pubkey.from_string(token_program)), bytes(Pubkey.from_string(mint))],
+        Pubkey.from_string(ASSOCIATED_TOKEN_PROGRAM_ID)
+    )
+    return str(pda)
+
+class TokenAccount(NamedTuple):
+    mint: str
+    owner: str
+    amount: int
+
+def decode_token_account(data: bytes) -> TokenAccount:
+    """Decode mint, owner and amount from the first 72 bytes of a token account"""
+    (amount,) = struct.unpack_from("<Q", data, 64)
+    return TokenAccount(
+        mint=str(Pubkey.from_bytes(data[0:32])),
+        owner=str(Pubkey.from_bytes(data[32:64])),
+        amount=amount
+    )
+
+class MintInfo(NamedTuple):
+    mint_authority: Optional[str]
+    supply: int
+    decimals: int
+    is_initialized: bool
+    freeze_authority: Optional[str]
+    token_program: str
+
+def decode_mint(data: bytes, owner: str = TOKEN_PROGRAM_ID) -> Optional[MintInfo]:
+    """
+    Decode an SPL Token or Token-2022 mint account
+
+    Args:
+        data: Raw account data
+        owner: Owning program of the account
+
+    Returns:
+        MintInfo, or None if the data is not a mint of either token program
+    """
+    if owner not in TOKEN_PROGRAM_IDS or len(data) < MINT_SIZE:
+        return None
+    if len(data) > MINT_SIZE:
+        # Only Token-2022 mints with extensions are longer than the base layout
+        if owner != TOKEN_2022_PROGRAM_ID or len(data) <= TOKEN_2022_ACCOUNT_TYPE_OFFSET:
+            return None
+        if data[TOKEN_2022_ACCOUNT_TYPE_OFFSET] != TOKEN_2022_ACCOUNT_TYPE_MINT:
+            return None
+
+    mint_tag, mint_authority, supply, decimals, initialized, freeze_tag, freeze_authority = MINT_LAYOUT.unpack_from(data, 0)
+    return MintInfo(
+        mint_authority=str(Pubkey.from_bytes(mint_authority)) if mint_tag else None,
+        supply=supply,
+        decimals=decimals,
+        is_initialized=bool(initialized),
+        freeze_authority=str(Pubkey.from_bytes(freeze_authority)) if freeze_tag else None,
+        token_program=owner
+    )
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+COPY TRADER TESTING: Leader Wallet Mirroring
+Tests that leader swaps decode from pump.fun trade logs and from a parsed
+transaction's inner instructions, and that a recorded leader session is
+mirrored by every follower with sizing and per-trade lag reports
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+
+# Add src and benchmarks to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from solders.keypair import Keypair
+
+class FakeExecutor:
+    """Follower executor that always fills after a short delay"""
+
+    def __init__(self, wallet_id, calls):
+        self.wallet_id = wallet_id
+        self.calls = calls
+
+    async def execute_buy(self, token_address, sol_amount, slippage=1.0, strategy="manual"):
+        await asyncio.sleep(0.005)
+        self.calls.append((self.wallet_id, "buy", token_address, sol_amount, strategy))
+        return {"success": True, "signature": f"buy-{self.wallet_id}-{len(self.calls)}"}
+
+    async def execute_sell(self, token_address, percentage=100.0, slippage=1.0, strategy="manual"):
+        await asyncio.sleep(0.005)
+        self.calls.append((self.wallet_id, "sell", token_address, percentage, strategy))
+        return {"success": True, "signature": f"sell-{self.wallet_id}-{len(self.calls)}"}
+
+def test_decode_leader_swaps():
+    """Direction, mint and size from trade logs and from inner transfers"""
+    from monitoring.decoders import decode_pumpfun_swaps, decode_swap_transaction, invokes_swap_program
+    from pool_fixtures import build_copy_fixtures
+
+    leader = str(Keypair().pubkey())
+    fixtures = build_copy_fixtures(leader)
+
+    for fixture in fixtures:
+        value = fixture["notification"]["value"]
+        if fixture["platform"] == "pumpfun":
+            swaps = [swap.as_dict() for swap in decode_pumpfun_swaps(value, {leader})]
+        elif fixture["platform"] == "raydium":
+            assert not decode_pumpfun_swaps(value, {leader}) and invokes_swap_program(value["logs"])
+            swap = decode_swap_transaction(fixture["transaction"], {leader})
+            swaps = [swap.as_dict()]
+            if swap.is_buy:
+                assert swap.sold_fraction is None
+            else:
+                assert swap.sold_fraction == 1.0
+        else:
+            assert not invokes_swap_program(value["logs"])
+            continue
+
+        expected = fixture["expected"]
+        if expected["wallet"] != leader:
+            assert swaps == []
+            continue
+        assert len(swaps) == 1
+        assert {key: swaps[0][key] for key in expected} == expected, (swaps, expected)
+    print("✓ PASSED: leader swaps decoded from logs and inner instructions")
+
+def test_recorded_session_mirrored():
+    """Replay a recorded leader session through the copy trader"""
+    from monitoring.recorder import read_recording
+    from monitoring.slot_clock import SlotClock
+    from monitoring.ws_mux import WebSocketMux
+    from pool_fixtures import build_copy_fixtures
+    from replay import FixtureRpc, write_fixture_recording
+    from trading.copy_trader import CopyTrader
+
+    leader = str(Keypair().pubkey())
+    path = os.path.join(tempfile.mkdtemp(), "leader.rec")
+    transactions = write_fixture_recording(build_copy_fixtures(leader), path, interval=0.01)
+
+    calls = []
+    trader = CopyTrader([leader], [(1, Keypair()), (2, Keypair())],
+                        {"size_mode": "ratio", "size_ratio": 1.0, "max_buy_amount": 0.5},
+                        mux=WebSocketMux(url="ws://replay"), rpc=FixtureRpc(transactions))
+    trader.executors = {wallet_id: FakeExecutor(wallet_id, calls) for wallet_id in trader.executors}
+    trader.slot_clock = SlotClock()
+
+    async def run():
+        reports = []
+        for _, message in read_recording(path):
+            result = json.loads(message)["params"]["result"]
+            reports += await trader.handle(result)
+            # The same transaction arriving on a second leader subscription is ignored
+            reports += await trader.handle(result)
+        return reports
+
+    reports = asyncio.run(run())
+
+    assert [r["side"] for r in reports] == ["buy", "buy", "sell", "sell"]
+    assert [r["sol_amount"] for r in reports[:2]] == [0.5, 0.5]
+    assert [r["percentage"] for r in reports[2:]] == [100.0, 100.0]
+    assert all(r["leader"]["wallet"] == leader for r in reports)
+    assert all(len(r["followers"]) == 2 and r["max_lag_ms"] > 0 for r in reports)
+    assert reports[0]["slot_lag"] == 0 and reports[1]["leader"]["source"] == "transaction"
+    assert len(calls) == 8 and all(call[4] == "copy" for call in calls)
+
+    stats = trader.get_stats()
+    assert stats["notifications"] == 6 and stats["swaps_detected"] == 4 and stats["trades_copied"] == 4
+    assert stats["open_positions"] == {1: 0, 2: 0}
+    assert stats["latency_ms"]["leader_to_follower"]["count"] == 4
+    print(f"✓ PASSED: 4 leader trades mirrored by 2 wallets, "
+          f"p50 lag {stats['latency_ms']['leader_to_follower']['p50']:.1f} ms")
+
+def main():
+    tests = [test_decode_leader_swaps, test_recorded_session_mirrored]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
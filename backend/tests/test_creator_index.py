@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+CREATOR INDEX TESTING: Creator Reputation
+Tests that launches and rugs are counted per creator, survive a reload from
+SQLite and reject a known rugger's pools before any RPC
+"""
+
+import asyncio
+import sys
+import os
+import tempfile
+import threading
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from solders.keypair import Keypair
+
+def _address():
+    return str(Keypair().pubkey())
+
+def _temporary_database():
+    """Point core.database at a fresh SQLite file; returns the previous (engine, SessionLocal)"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    import core.database as database
+
+    previous = database.engine, database.SessionLocal
+    database.engine = create_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'creators.db')}", echo=False)
+    database.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=database.engine)
+    database.init_db()
+    return previous
+
+class CountingAnalyzer:
+    def __init__(self):
+        self.calls = 0
+
+    async def fetch_mint(self, token_address, commitment="confirmed"):
+        self.calls += 1
+        return {"mint_authority": None, "freeze_authority": None}
+
+    def check_mint_authority(self, mint):
+        return True
+
+    def check_freeze_authority(self, mint):
+        return True
+
+def test_launches_and_rugs_persist():
+    """Counters update in memory, are flushed in batches off the loop and reload"""
+    import core.database as database
+    from monitoring.creator_index import CreatorIndex
+
+    previous = _temporary_database()
+    try:
+        creator = _address()
+        tokens = [_address() for _ in range(3)]
+
+        index = CreatorIndex(flush_every=100)
+        index.ensure_loaded()
+        writers = []
+        write = index._write
+        index._write = lambda batch: writers.append(threading.get_ident()) or write(batch)
+
+        async def run():
+            for token in tokens + tokens[:1]:
+                index.record_launch({"creator": creator, "token_address": token})
+            assert index.get(creator).tokens_launched == 3
+            assert index.get_stats()["pending"] > 0
+
+            # A rug report is queued immediately, with the launches before it
+            assert index.report_rug(tokens[1]).rugs_observed == 1
+            assert index.report_rug(tokens[1]).rugs_observed == 1
+            assert index.get_stats()["pending"] == 0
+            return await index.flush_async()
+
+        assert asyncio.run(run())
+        assert writers and threading.get_ident() not in writers
+
+        reloaded = CreatorIndex()
+        record = reloaded.get(creator)
+        assert record.tokens_launched == 3 and record.rugs_observed == 1
+        assert record.first_seen <= record.last_seen
+        # Rugged flag persisted: reporting again from a fresh index does not double count
+        assert reloaded.report_rug(tokens[1]).rugs_observed == 1
+        assert reloaded.report_rug(_address()) is None
+        assert reloaded.flush()
+    finally:
+        database.engine, database.SessionLocal = previous
+    print("✓ PASSED: launches and rugs counted once, written off the loop and reloaded from SQLite")
+
+def test_rugger_rejected_before_rpc():
+    """A creator with a rug on record is rejected at the cached stage"""
+    from monitoring.creator_index import CreatorIndex
+    from trading.filters import FilterContext, build_filter_pipeline
+
+    rugger, fresh = _address(), _address()
+    index = CreatorIndex()
+    index._loaded = True
+    rugged_token = _address()
+    index.record_launch({"creator": rugger, "token_address": rugged_token})
+    index._tokens[rugged_token][1] = True
+    index.get(rugger).rugs_observed = 1
+
+    pipeline = build_filter_pipeline({"min_liquidity": 1, "min_safety_score": 0})
+    analyzer = CountingAnalyzer()
+
+    async def run():
+        rejected = await pipeline.evaluate(
+            {"creator": rugger, "token_address": _address(), "liquidity": 5},
+            FilterContext(analyzer, creators=index))
+        passed = await pipeline.evaluate(
+            {"creator": fresh, "token_address": _address(), "liquidity": 5},
+            FilterContext(analyzer, creators=index))
+        return rejected, passed
+
+    rejected, passed = asyncio.run(run())
+    assert not rejected.passed and rejected.stage == "creator_reputation"
+    assert passed.passed
+    assert analyzer.calls == 1
+    print("✓ PASSED: known rugger rejected without an RPC")
+
+def main():
+    tests = [test_launches_and_rugs_persist, test_rugger_rejected_before_rpc]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
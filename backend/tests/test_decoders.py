@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+DECODER TESTING: Pool Creation Events
+Tests Raydium initialize2 and pump.fun create decoding on the recorded
+notification fixtures, through PoolMonitor
+"""
+
+import asyncio
+import sys
+import os
+
+# Add src and benchmarks to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from pool_fixtures import load_fixtures
+
+class FixtureRpc:
+    """Answers getTransaction from the fixture set"""
+
+    def __init__(self, fixtures):
+        self.transactions = {
+            f["notification"]["value"]["signature"]: f["transaction"] for f in fixtures if "transaction" in f
+        }
+        self.calls = 0
+
+    async def call(self, method, params=None):
+        assert method == "getTransaction"
+        self.calls += 1
+        return self.transactions.get(params[0])
+
+def test_monitor_decodes_fixtures():
+    """Every pool creation decodes to the expected pool_data and noise is ignored"""
+    from monitoring.pool_monitor import PoolMonitor
+
+    fixtures = load_fixtures()
+    rpc = FixtureRpc(fixtures)
+    monitors = {p: PoolMonitor(p, mux=object(), rpc=rpc) for p in ("raydium", "pumpfun")}
+
+    async def run():
+        return [await monitors[f["platform"]]._parse_pool_data(f["notification"]) for f in fixtures]
+
+    decoded = asyncio.run(run())
+    creations = 0
+    for fixture, pool_data in zip(fixtures, decoded):
+        expected = fixture["expected"]
+        if expected is None:
+            assert pool_data is None, pool_data
+            continue
+        creations += 1
+        for key, value in expected.items():
+            assert pool_data[key] == value, (key, pool_data[key], value)
+        assert pool_data["platform"] == fixture["platform"]
+        assert pool_data["slot"] == fixture["notification"]["context"]["slot"]
+
+    assert creations == 10
+    assert rpc.calls == 5, "Only Raydium creations need the transaction"
+    print(f"✓ PASSED: {creations} pool creations decoded, {len(fixtures) - creations} messages ignored")
+
+def test_truncated_create_rejected():
+    """A create event cut short does not raise"""
+    import base64
+    from monitoring.decoders import decode_pumpfun_create
+
+    fixture = next(f for f in load_fixtures() if f["platform"] == "pumpfun" and f["expected"])
+    line = next(l for l in fixture["notification"]["value"]["logs"] if l.startswith("Program data: "))
+    data = base64.b64decode(line[len("Program data: "):])
+
+    assert decode_pumpfun_create(data) is not None
+    assert decode_pumpfun_create(data[:60]) is None
+    print("✓ PASSED: Truncated create rejected")
+
+def main():
+    tests = [test_monitor_decodes_fixtures, test_truncated_create_rejected]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+DEDUP TESTING: Cross-Source Event Deduplication and Traded Mints
+Tests the TTL/LRU dedup set, bus-level dedup and the traded-mint registry
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+def test_ttl_set_bounds():
+    """Entries expire after the TTL and the set never exceeds maxsize"""
+    from monitoring.dedup import TTLSet
+
+    seen = TTLSet(maxsize=3, ttl=0.05)
+    for n in range(5):
+        seen.add(n)
+    assert len(seen) == 3 and 0 not in seen and 4 in seen
+    time.sleep(0.06)
+    assert 4 not in seen and len(seen) == 0
+    print("✓ PASSED: TTL set is bounded and expires")
+
+def test_bus_drops_duplicates():
+    """Same pool via another platform, signature or mint is delivered once"""
+    from monitoring.event_bus import PoolEventBus
+
+    class IdleMonitor:
+        def __init__(self, platform):
+            pass
+
+        async def start(self, on_new_pool):
+            await asyncio.Event().wait()
+
+        async def disconnect(self):
+            pass
+
+    async def run():
+        bus = PoolEventBus(monitor_factory=IdleMonitor)
+        queue = bus.subscribe("a", ["raydium", "pumpfun"])
+        await bus.publish({"platform": "pumpfun", "token_address": "MintA", "signature": "sig1"})
+        await bus.publish({"platform": "pumpfun", "token_address": "MintA", "signature": "sig1", "backfilled": True})
+        await bus.publish({"platform": "raydium", "token_address": "MintA", "pool_address": "PoolA", "signature": "sig2"})
+        await bus.publish({"platform": "raydium", "token_address": "MintB", "pool_address": "PoolB", "signature": "sig3"})
+        stats = bus.get_stats()
+        await bus.stop()
+        return queue.qsize(), stats
+
+    depth, stats = asyncio.run(run())
+    assert depth == 2, depth
+    assert stats["dedup"]["duplicates_dropped"] == 2
+    print("✓ PASSED: duplicate events dropped before the subscribers")
+
+def test_traded_mint_registry():
+    """A wallet can claim a mint once; failed buys release the claim"""
+    from trading.traded_mints import TradedMintRegistry
+
+    registry = TradedMintRegistry()
+    registry._loaded = True  # skip the database
+    assert registry.claim(1, "MintA")
+    assert not registry.claim(1, "MintA")
+    assert registry.claim_many([1, 2, 3], "MintA") == [2, 3]
+    registry.release(1, "MintA")
+    assert registry.claim(1, "MintA")
+    print("✓ PASSED: traded mints are claimed once per wallet")
+
+def test_traded_mints_fail_closed():
+    """No buy is allowed until the registry has loaded from the database"""
+    import trading.traded_mints as traded_mints
+
+    class BrokenDb:
+        def query(self, *columns):
+            raise RuntimeError("database is locked")
+
+        def close(self):
+            pass
+
+    registry = traded_mints.TradedMintRegistry()
+    get_db = traded_mints.get_db
+    traded_mints.get_db = BrokenDb
+    try:
+        assert not registry.claim(1, "MintA") and not registry._loaded
+    finally:
+        traded_mints.get_db = get_db
+    registry._loaded = True  # the database is readable again
+    registry.record(2, "MintA")
+    assert registry.claim(1, "MintA") and registry.has_traded(2, "MintA")
+    print("✓ PASSED: buys skipped while traded mints cannot load")
+
+def main():
+    tests = [test_ttl_set_bounds, test_bus_drops_duplicates, test_traded_mint_registry,
+             test_traded_mints_fail_closed]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+EVENT BUS TESTING: Shared Monitor Feed
+Tests that several sniper instances share one monitor per platform
+and keep separate stats
+"""
+
+import asyncio
+import itertools
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from solders.keypair import Keypair
+
+class FakeMonitor:
+    """Stands in for PoolMonitor; events are pushed by the test"""
+
+    created = []
+
+    def __init__(self, platform):
+        self.platform = platform
+        self.disconnected = False
+        self.callback = None
+        FakeMonitor.created.append(self)
+
+    async def start(self, on_new_pool):
+        self.callback = on_new_pool
+        await asyncio.Event().wait()
+
+    async def disconnect(self):
+        self.disconnected = True
+
+_minted = itertools.count()
+
+def _pool(platform: str, liquidity: float = 1.0) -> dict:
+    # Distinct mints: the bus drops repeated events
+    return {"platform": platform, "token_address": f"MockToken{next(_minted)}", "liquidity": liquidity}
+
+def test_one_monitor_per_platform():
+    """Subscribers share monitors; events reach only matching platforms"""
+    from monitoring.event_bus import PoolEventBus
+
+    async def run():
+        FakeMonitor.created = []
+        bus = PoolEventBus(monitor_factory=FakeMonitor)
+        a = bus.subscribe("a", ["raydium", "pumpfun"])
+        b = bus.subscribe("b", ["raydium"])
+        await asyncio.sleep(0)
+
+        await bus.publish(_pool("raydium"))
+        await bus.publish(_pool("pumpfun"))
+
+        platforms = sorted(m.platform for m in FakeMonitor.created)
+        sizes = (a.qsize(), b.qsize())
+
+        await bus.unsubscribe("a")
+        pumpfun_stopped = bus.monitors.get("pumpfun") is None
+        await bus.stop()
+        return platforms, sizes, pumpfun_stopped
+
+    platforms, sizes, pumpfun_stopped = asyncio.run(run())
+    assert platforms == ["pumpfun", "raydium"], platforms
+    assert sizes == (2, 1), sizes
+    assert pumpfun_stopped, "Monitor without subscribers should stop"
+    print("✓ PASSED: One monitor per platform shared by subscribers")
+
+def test_manager_runs_independent_snipers():
+    """Two snipers see the same events, keep separate stats and stop independently"""
+    from monitoring.event_bus import PoolEventBus
+    from trading.sniper import SniperManager
+
+    async def run():
+        FakeMonitor.created = []
+        bus = PoolEventBus(monitor_factory=FakeMonitor)
+        manager = SniperManager(bus=bus)
+
+        # Liquidity below the minimum: both snipers count and skip every pool
+        config = {"min_liquidity": 1000}
+        await manager.start(1, Keypair(), config, sniper_id="a", platforms=["raydium"])
+        await manager.start(2, Keypair(), config, sniper_id="b", platforms=["raydium"])
+
+        await bus.publish(_pool("raydium"))
+        await asyncio.sleep(0.05)
+        await manager.stop("a")
+
+        await bus.publish(_pool("raydium"))
+        await asyncio.sleep(0.05)
+        status = manager.get_status()
+        await manager.stop()
+        return status, len(FakeMonitor.created)
+
+    status, monitors = asyncio.run(run())
+    assert monitors == 1
+    assert list(status["snipers"]) == ["b"]
+    assert status["snipers"]["b"]["pools_detected"] == 2
+    assert status["pools_detected"] == 2
+    print("✓ PASSED: Snipers run and stop independently on one feed")
+
+def main():
+    tests = [test_one_monitor_per_platform, test_manager_runs_independent_snipers]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+EVENT QUEUE TESTING: Bounded Queue and Worker Pool
+Tests overflow policies, queue metrics and concurrent event handling
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from solders.keypair import Keypair
+
+def _event(n: int, liquidity: float = 10.0) -> dict:
+    return {"platform": "raydium", "token_address": f"Mint{n}", "liquidity": liquidity}
+
+def test_drop_oldest():
+    """A full queue evicts the oldest event and counts it"""
+    from monitoring.event_queue import BoundedEventQueue
+
+    async def run():
+        queue = BoundedEventQueue(maxsize=3)
+        for n in range(5):
+            queue.put_nowait(_event(n))
+        return [(await queue.get())["token_address"] for _ in range(3)], queue.get_stats()
+
+    drained, stats = asyncio.run(run())
+    assert drained == ["Mint2", "Mint3", "Mint4"]
+    assert stats["dropped"]["oldest"] == 2 and stats["max_depth"] == 3
+    assert set(stats["queue_delay_ms"]) == {"p50", "p95", "p99", "max"}
+    print("✓ PASSED: drop_oldest keeps the newest events")
+
+def test_drop_below_liquidity():
+    """Low-liquidity events are evicted (or refused) before good ones"""
+    from monitoring.event_queue import BoundedEventQueue, DROP_BELOW_LIQUIDITY
+
+    async def run():
+        queue = BoundedEventQueue(maxsize=2, policy=DROP_BELOW_LIQUIDITY, min_liquidity=5)
+        queue.put_nowait(_event(0, liquidity=50))
+        queue.put_nowait(_event(1, liquidity=1))
+        queue.put_nowait(_event(2, liquidity=20))     # evicts Mint1
+        accepted = queue.put_nowait(_event(3, liquidity=2))  # refused
+        drained = [(await queue.get())["token_address"] for _ in range(2)]
+        return drained, accepted, queue.get_stats()
+
+    drained, accepted, stats = asyncio.run(run())
+    assert drained == ["Mint0", "Mint2"]
+    assert accepted is False
+    assert stats["dropped"]["below_liquidity"] == 2
+    print("✓ PASSED: drop_below_liquidity protects liquid pools")
+
+def test_workers_handle_concurrently():
+    """A slow handler does not serialize every queued event"""
+    from monitoring.event_bus import PoolEventBus
+    from trading.sniper import SniperBot
+
+    class IdleMonitor:
+        def __init__(self, platform):
+            pass
+
+        async def start(self, on_new_pool):
+            await asyncio.Event().wait()
+
+        async def disconnect(self):
+            pass
+
+    async def run():
+        bus = PoolEventBus(monitor_factory=IdleMonitor)
+        sniper = SniperBot(1, Keypair(), {"workers": 4}, bus=bus)
+        handled = []
+
+        async def slow_handler(pool_data):
+            await asyncio.sleep(0.1)
+            handled.append(pool_data["queue_delay_ms"])
+        sniper.on_new_pool = slow_handler
+
+        task = asyncio.create_task(sniper.start(["raydium"]))
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        for n in range(8):
+            await bus.publish(_event(n))
+        while len(handled) < 8:
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - start
+
+        stats = sniper.get_stats()
+        await sniper.stop()
+        task.cancel()
+        return elapsed, stats
+
+    elapsed, stats = asyncio.run(run())
+    assert elapsed < 0.5, elapsed
+    assert stats["queue"]["dequeued"] == 8
+    print(f"✓ PASSED: 8 slow events handled in {elapsed:.2f}s by 4 workers")
+
+def main():
+    tests = [test_drop_oldest, test_drop_below_liquidity, test_workers_handle_concurrently]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+FILTER PIPELINE TESTING: Cost-Ordered Sniper Checks
+Tests stage ordering, short-circuiting and per-stage rejection counts
+"""
+
+import asyncio
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+class CountingAnalyzer:
+    """Analyzer fake counting the RPC-backed calls"""
+
+    def __init__(self, mint_authority=None, score=100):
+        self.mint_authority = mint_authority
+        self.score = score
+        self.mint_fetches = 0
+        self.analyses = 0
+
+    async def fetch_mint(self, token_address, commitment="confirmed"):
+        self.mint_fetches += 1
+        return {"mint_authority": self.mint_authority}
+
+    def check_mint_authority(self, mint):
+        return mint["mint_authority"] is None
+
+    def check_freeze_authority(self, mint):
+        return True
+
+    async def analyze_token(self, token_address, commitment="confirmed"):
+        self.analyses += 1
+        return {"safety_score": self.score}
+
+def _event(liquidity=10.0):
+    return {"platform": "pumpfun", "token_address": "MintA", "liquidity": liquidity}
+
+def test_local_rejection_costs_no_rpc():
+    """Low-liquidity and already-traded events never reach RPC stages"""
+    from trading.filters import FilterContext, build_filter_pipeline
+    from trading.traded_mints import TradedMintRegistry
+
+    pipeline = build_filter_pipeline({"min_liquidity": 5})
+    analyzer = CountingAnalyzer()
+    traded = TradedMintRegistry()
+    traded._loaded = True  # skip the database
+    traded.claim(1, "MintA")
+
+    async def run():
+        low = await pipeline.evaluate(_event(liquidity=1), FilterContext(analyzer, traded, [1]))
+        seen = await pipeline.evaluate(_event(), FilterContext(analyzer, traded, [1]))
+        return low, seen
+
+    low, seen = asyncio.run(run())
+    assert (low.passed, low.stage) == (False, "liquidity")
+    assert (seen.passed, seen.stage) == (False, "already_traded")
+    assert analyzer.mint_fetches == 0 and analyzer.analyses == 0
+    print("✓ PASSED: local rejections cost no RPC")
+
+def test_stages_ordered_and_counted():
+    """Stages run cheapest first, stop at the first rejection and count rejections"""
+    from trading.filters import FilterContext, build_filter_pipeline
+
+    pipeline = build_filter_pipeline({"min_liquidity": 5, "min_safety_score": 70})
+    costs = [stage.cost for stage in pipeline.stages]
+    assert costs == sorted(costs)
+
+    minting = CountingAnalyzer(mint_authority="Authority")
+    low_score = CountingAnalyzer(score=40)
+    good = CountingAnalyzer()
+
+    async def run():
+        return [
+            await pipeline.evaluate(_event(), FilterContext(minting)),
+            await pipeline.evaluate(_event(), FilterContext(low_score)),
+            await pipeline.evaluate(_event(), FilterContext(good)),
+        ]
+
+    rejected_mint, rejected_score, passed = asyncio.run(run())
+    assert rejected_mint.stage == "mint_authority" and minting.analyses == 0
+    assert rejected_score.stage == "safety_score"
+    assert passed.passed and good.mint_fetches == 1 and good.analyses == 1
+
+    stats = {stage["name"]: stage for stage in pipeline.get_stats()["stages"]}
+    assert stats["mint_authority"]["rejected"] == 1 and stats["safety_score"]["rejected"] == 1
+    assert pipeline.get_stats()["passed"] == 1
+    print("✓ PASSED: stages cost-ordered with per-stage rejection counts")
+
+def main():
+    tests = [test_local_rejection_costs_no_rpc, test_stages_ordered_and_counted]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
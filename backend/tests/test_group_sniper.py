@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+GROUP SNIPER TESTING: One Event, Every Wallet
+Tests that one analyzed pool fires buys from all group wallets off one quote
+against the stand-in Jupiter and RPC servers
+"""
+
+import asyncio
+import sys
+import os
+
+# Add src and benchmarks to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from solders.keypair import Keypair
+
+from standins import JupiterHandler, RpcHandler, StandinServer
+
+class SafeAnalyzer:
+    def __init__(self):
+        self.calls = 0
+
+    async def fetch_mint(self, token_address, commitment="confirmed"):
+        return None
+
+    def check_mint_authority(self, mint):
+        return True
+
+    def check_freeze_authority(self, mint):
+        return True
+
+    async def analyze_token(self, token_address, commitment="confirmed"):
+        self.calls += 1
+        return {"safety_score": 100, "mint_renounced": True, "freeze_renounced": True}
+
+def test_group_buy_fires_every_wallet():
+    """Analysis runs once, quote is fetched once and every wallet sends"""
+    from core.database import init_db, get_db, close_db, Trade
+    from core.rpc import AsyncRpc
+    from monitoring.event_bus import PoolEventBus
+    from trading.jupiter import JupiterClient
+    from trading.sender import TransactionSender
+    from trading.sniper import GroupSniper
+    from utils.rate_limiter import RateLimiter
+
+    init_db()
+    quotes = {"count": 0}
+
+    with StandinServer(JupiterHandler) as jupiter_server, StandinServer(RpcHandler) as rpc_server:
+        async def run():
+            jupiter = JupiterClient(api_url=jupiter_server.url, rpc_endpoint=rpc_server.url)
+            get_quote = jupiter.get_quote
+
+            async def counted_quote(*args, **kwargs):
+                quotes["count"] += 1
+                return await get_quote(*args, **kwargs)
+            jupiter.get_quote = counted_quote
+
+            rpc = AsyncRpc(rpc_server.url, limiter=RateLimiter(rate=10_000, burst=10_000))
+            sender = TransactionSender(rpc, rebroadcast_interval=0.01)
+            wallets = [(1000 + i, Keypair()) for i in range(8)]
+            sniper = GroupSniper(
+                7, wallets, {"min_liquidity": 0}, bus=PoolEventBus(monitor_factory=None),
+                jupiter=jupiter, sender=sender
+            )
+            sniper.analyzer = SafeAnalyzer()
+
+            token = str(Keypair().pubkey())
+            await sniper.on_new_pool({"platform": "raydium", "token_address": token, "liquidity": 10})
+            stats = sniper.get_stats()
+            await jupiter.close()
+            await rpc.close()
+            return sniper, token, stats
+
+        sniper, token, stats = asyncio.run(run())
+
+    db = get_db()
+    try:
+        recorded = db.query(Trade).filter(Trade.token_address == token, Trade.strategy == "group_snipe").count()
+    finally:
+        close_db(db)
+
+    assert sniper.analyzer.calls == 1
+    assert quotes["count"] == 1
+    assert stats["wallet_buys"] == 8 and stats["wallet_failures"] == 0
+    assert recorded == 8
+    assert stats["latency_ms"]["receive_to_last_send"]["count"] == 1
+    print(f"✓ PASSED: 8 wallets bought, event → last send {stats['last_receive_to_last_send_ms']} ms")
+
+def test_unwind_sells_only_holders():
+    """An unwind sells from the wallets that bought, through executors sharing one client"""
+    from monitoring.event_bus import PoolEventBus
+    from trading.jupiter import JupiterClient
+    from trading.sniper import GroupSniper
+
+    sells = []
+
+    class FakeExecutor:
+        def __init__(self, wallet_id, succeed):
+            self.wallet_id = wallet_id
+            self.succeed = succeed
+
+        async def execute_sell(self, token_address, percentage=100.0, slippage=1.0, strategy="manual"):
+            sells.append((self.wallet_id, token_address, strategy))
+            return {"success": self.succeed}
+
+    async def run():
+        jupiter = JupiterClient()
+        wallets = [(2000 + i, Keypair()) for i in range(4)]
+        sniper = GroupSniper(8, wallets, {}, bus=PoolEventBus(monitor_factory=None), jupiter=jupiter)
+        assert sniper._executor(2000).jupiter is jupiter
+        sniper.executors = {2001: FakeExecutor(2001, True), 2003: FakeExecutor(2003, False)}
+        sniper.positions["MintA"] = {2001, 2003}
+        unwound = await sniper.unwind("MintA", strategy="speculative_exit")
+        nothing = await sniper.unwind("MintB")
+        await jupiter.close()
+        return sniper, unwound, nothing
+
+    sniper, unwound, nothing = asyncio.run(run())
+    assert sorted(sells) == [(2001, "MintA", "speculative_exit"), (2003, "MintA", "speculative_exit")]
+    assert not unwound and not nothing
+    assert sniper.positions["MintA"] == {2003}
+    print("✓ PASSED: unwind sold from the 2 holding wallets only")
+
+def main():
+    tests = [test_group_buy_fires_every_wallet, test_unwind_sells_only_holders]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
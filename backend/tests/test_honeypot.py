@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+HONEYPOT TESTING: Sell Simulation
+Tests that the effective sell tax is computed from a simulated holder sell
+against the stand-in Jupiter and RPC servers, and that the sell_tax stage
+overlaps the simulation with the buy quote
+"""
+
+import asyncio
+import base64
+import struct
+import sys
+import os
+import time
+
+# Add src and benchmarks to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from solders.pubkey import Pubkey
+
+from standins import JupiterHandler, RpcHandler, StandinServer
+
+def _token_account(amount):
+    return bytes(32) + bytes(32) + struct.pack("<Q", amount) + bytes(93)
+
+class HolderAnalyzer:
+    def __init__(self, holders):
+        self.holders = holders
+
+    async def fetch_holders(self, token_address):
+        return self.holders
+
+def test_sell_tax_from_simulation():
+    """Tax is the quoted SOL minus the simulated WSOL proceeds; errors are honeypots"""
+    from core.rpc import AsyncRpc
+    from trading.honeypot import HoneypotChecker
+    from trading.jupiter import JupiterClient
+    from utils.rate_limiter import RateLimiter
+
+    holder = str(Pubkey.new_unique())
+    simulated = {"err": None, "received": 0}
+
+    def simulate(params):
+        config = params[1]
+        assert not config["sigVerify"] and config["replaceRecentBlockhash"]
+        data = base64.b64encode(_token_account(simulated["received"])).decode()
+        return {"context": {"slot": 1000}, "value": {
+            "err": simulated["err"], "logs": [],
+            "accounts": [{"lamports": 2039280, "data": [data, "base64"]}]
+        }}
+
+    def accounts(params):
+        # The holder has no WSOL account before the sell
+        return {"context": {"slot": 1000}, "value": [None for _ in params[0]]}
+
+    overrides = {"simulateTransaction": simulate, "getMultipleAccounts": accounts}
+    with StandinServer(JupiterHandler) as jupiter_server, StandinServer(RpcHandler, overrides=overrides) as rpc_server:
+        async def run():
+            rpc = AsyncRpc(rpc_server.url, limiter=RateLimiter(rate=10_000, burst=10_000))
+            jupiter = JupiterClient(api_url=jupiter_server.url, rpc_endpoint=rpc_server.url)
+            # The Raydium authority is skipped; the wallet behind it is sold from
+            analyzer = HolderAnalyzer([("5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1", 10**12), (holder, 10**9)])
+            checker = HoneypotChecker(jupiter, analyzer, rpc=rpc)
+            token = str(Pubkey.new_unique())
+
+            # 1% of 1e9 tokens quotes 1e10 lamports in the stand-in
+            simulated["received"] = 7 * 10**9
+            taxed = await checker.check(token)
+            simulated["err"] = {"InstructionError": [2, {"Custom": 6001}]}
+            blocked = await checker.check(token)
+            checker.analyzer = HolderAnalyzer([])
+            unknown = await checker.check(token)
+            await jupiter.close()
+            await rpc.close()
+            return checker, taxed, blocked, unknown
+
+        checker, taxed, blocked, unknown = asyncio.run(run())
+
+    assert taxed["success"] and taxed["holder"] == holder
+    assert taxed["sell_tax"] == 30.0 and not taxed["honeypot"], taxed
+    assert blocked["honeypot"] and blocked["sell_tax"] == 100.0
+    assert not unknown["success"] and unknown["sell_tax"] is None
+    assert checker.get_stats() == {"checks": 3, "honeypots": 1, "inconclusive": 1}
+    print("✓ PASSED: 30% sell tax measured, failing sell flagged as honeypot")
+
+def test_sell_check_overlaps_buy_quote():
+    """The sell_tax stage costs the slower of quote and simulation, not both"""
+    from trading.filters import FilterContext, build_filter_pipeline
+
+    class SlowChecker:
+        def __init__(self, tax):
+            self.tax = tax
+
+        async def check(self, token_address):
+            await asyncio.sleep(0.05)
+            return {"success": True, "sell_tax": self.tax, "honeypot": False}
+
+    async def quoter(token_address):
+        await asyncio.sleep(0.05)
+        return {"outAmount": "1000"}
+
+    pipeline = build_filter_pipeline({"min_liquidity": 0, "min_safety_score": 0, "require_mint_renounced": False,
+                                      "require_freeze_renounced": False, "max_sell_tax": 10.0})
+
+    async def run():
+        event = {"token_address": str(Pubkey.new_unique())}
+        started = time.perf_counter()
+        passed = await pipeline.evaluate(event, FilterContext(None, honeypot=SlowChecker(2.5), quoter=quoter))
+        elapsed = time.perf_counter() - started
+        rejected = await pipeline.evaluate(event, FilterContext(None, honeypot=SlowChecker(25.0), quoter=quoter))
+        return passed, elapsed, rejected
+
+    passed, elapsed, rejected = asyncio.run(run())
+    assert passed.passed and passed.context.quote == {"outAmount": "1000"}
+    assert elapsed < 0.09, elapsed
+    assert not rejected.passed and rejected.stage == "sell_tax"
+    print(f"✓ PASSED: quote and simulation overlapped ({elapsed * 1000:.0f} ms)")
+
+def main():
+    tests = [test_sell_tax_from_simulation, test_sell_check_overlaps_buy_quote]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
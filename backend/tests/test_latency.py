@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+LATENCY TESTING: Swap Pipeline Timing
+Tests stage timers, percentile summaries and a timed swap against stand-ins
+"""
+
+import asyncio
+import sys
+import os
+
+# Add src and benchmarks to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+def test_percentile():
+    """Percentiles interpolate between ranks"""
+    from utils.timing import percentile
+
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50.5
+    assert percentile(values, 100) == 100
+    assert percentile([], 95) == 0.0
+    print("✓ PASSED: Percentile interpolation")
+
+def test_summarize():
+    """Summaries are computed per stage"""
+    from utils.timing import summarize
+
+    samples = [{"quote": float(i), "total": float(i * 2)} for i in range(1, 11)]
+    summary = summarize(samples)
+
+    assert summary["quote"]["count"] == 10
+    assert summary["quote"]["p50"] == 5.5
+    assert summary["total"]["mean"] == 11.0
+    print("✓ PASSED: Stage summary")
+
+def test_timed_swap():
+    """A swap against stand-in servers reports every pipeline stage"""
+    from solders.keypair import Keypair
+    from standins import JupiterHandler, RpcHandler, StandinServer, SOL_MINT
+    from trading.jupiter import JupiterClient
+    from utils.timing import StageTimer
+
+    with StandinServer(JupiterHandler) as jupiter, StandinServer(RpcHandler) as rpc:
+        client = JupiterClient(api_url=jupiter.url, rpc_endpoint=rpc.url)
+        timer = StageTimer()
+        token = str(Keypair().pubkey())
+        signature = asyncio.run(client.swap(Keypair(), SOL_MINT, token, 1000, timer=timer))
+
+    timings = timer.as_dict()
+    assert signature, "Swap should return a signature"
+    for stage in ("quote", "swap_transaction", "decode", "sign", "send", "confirm", "total"):
+        assert stage in timings, f"Missing stage {stage}"
+    print(f"✓ PASSED: Timed swap ({timings['total']} ms)")
+
+def main():
+    tests = [test_percentile, test_summarize, test_timed_swap]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+LOOKUP TABLE TESTING: Packed v0 Transactions
+Tests that group transfers pack into size-limited v0 transactions
+"""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from solders.keypair import Keypair
+from solders.hash import Hash
+from solders.pubkey import Pubkey
+from solders.system_program import TransferParams, transfer
+from solders.address_lookup_table_account import AddressLookupTableAccount
+
+def _transfers(payer, count):
+    wallets = [Keypair().pubkey() for _ in range(count)]
+    ixs = [
+        transfer(TransferParams(from_pubkey=payer.pubkey(), to_pubkey=w, lamports=1000))
+        for w in wallets
+    ]
+    return wallets, ixs
+
+def test_packing_respects_size_limit():
+    """Every packed transaction fits the packet size and keeps all instructions"""
+    from core.lookup_tables import compile_packed_transactions, PACKET_DATA_SIZE
+
+    payer = Keypair()
+    _, ixs = _transfers(payer, 100)
+    packed = compile_packed_transactions(payer, ixs, [], Hash.default())
+
+    assert sum(count for _, count in packed) == 100
+    for tx, count in packed:
+        assert len(bytes(tx)) <= PACKET_DATA_SIZE
+        assert len(tx.message.instructions) == count
+    print(f"✓ PASSED: 100 transfers packed into {len(packed)} transactions")
+
+def test_lookup_table_packs_more():
+    """Resolving wallets through a lookup table packs several times more transfers"""
+    from core.lookup_tables import compile_packed_transactions
+
+    payer = Keypair()
+    wallets, ixs = _transfers(payer, 200)
+    table = AddressLookupTableAccount(key=Pubkey.new_unique(), addresses=wallets)
+
+    plain = compile_packed_transactions(payer, ixs, [], Hash.default())
+    with_table = compile_packed_transactions(payer, ixs, [table], Hash.default())
+
+    assert len(with_table) * 2 < len(plain), (len(with_table), len(plain))
+    assert with_table[0][0].message.address_table_lookups
+    print(f"✓ PASSED: {len(plain)} plain vs {len(with_table)} lookup-table transactions")
+
+def main():
+    tests = [test_packing_respects_size_limit, test_lookup_table_packs_more]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+NONCE VAULT TESTING: Pre-signed Exit Transactions
+Tests nonce parsing, nonce transaction layout and batch vault encryption
+"""
+
+import struct
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from solders.keypair import Keypair
+from solders.hash import Hash
+from solders.pubkey import Pubkey
+from solders.system_program import TransferParams, transfer
+
+def test_parse_nonce_value():
+    """The durable nonce is read from the raw account layout"""
+    from core.nonce_vault import parse_nonce_value
+
+    nonce = Hash.new_unique()
+    data = struct.pack("<II", 1, 1) + bytes(Pubkey.new_unique()) + bytes(nonce) + struct.pack("<Q", 5000)
+
+    assert len(data) == 80
+    assert parse_nonce_value(data) == nonce
+    print("✓ PASSED: Nonce value parsed")
+
+def test_nonce_transaction_layout():
+    """Advance-nonce comes first and the nonce replaces the blockhash"""
+    from core.nonce_vault import build_nonce_transaction
+
+    signer = Keypair()
+    nonce_address = Pubkey.new_unique()
+    nonce = Hash.new_unique()
+    ix = transfer(TransferParams(from_pubkey=signer.pubkey(), to_pubkey=Pubkey.new_unique(), lamports=1))
+
+    tx = build_nonce_transaction(signer, nonce_address, nonce, [ix])
+    message = tx.message
+    first = message.instructions[0]
+
+    assert message.recent_blockhash == nonce
+    assert message.account_keys[first.program_id_index] == Pubkey.from_string("11111111111111111111111111111111")
+    assert first.data[:4] == struct.pack("<I", 4), "First instruction should be AdvanceNonceAccount"
+    assert len(message.instructions) == 2
+    print("✓ PASSED: Nonce transaction layout")
+
+def test_batch_encryption_single_kdf():
+    """Items encrypted under one derived key decrypt with one cached key"""
+    from utils.encryption import derive_key, encrypt_bytes, decrypt_bytes
+
+    key, salt = derive_key("vault-password")
+    items = [encrypt_bytes(bytes([i]) * 32, key, salt) for i in range(5)]
+
+    cache = {}
+    decrypted = [decrypt_bytes(item, "vault-password", cache) for item in items]
+    assert decrypted == [bytes([i]) * 32 for i in range(5)]
+    assert len(cache) == 1
+
+    # With the cache filled no password is needed
+    assert decrypt_bytes(items[0], None, cache) == bytes(32)
+    print("✓ PASSED: Batch encryption derives one key")
+
+def main():
+    tests = [test_parse_nonce_value, test_nonce_transaction_layout, test_batch_encryption_single_kdf]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
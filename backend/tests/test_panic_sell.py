@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+PANIC SELL TESTING: Position Scan and Rate Limiting
+Tests batched position discovery and the shared RPC rate limiter
+"""
+
+import asyncio
+import base64
+import sys
+import os
+import time
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from solders.pubkey import Pubkey
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+
+def _token_account(mint: str, owner: str, amount: int) -> dict:
+    data = bytes(Pubkey.from_string(mint)) + bytes(Pubkey.from_string(owner)) + amount.to_bytes(8, "little")
+    return {"account": {"data": [base64.b64encode(data).decode(), "base64"]}}
+
+class FakeRpc:
+    """Answers getTokenAccountsByOwner batches from a fixed table"""
+
+    def __init__(self, holdings):
+        self.holdings = holdings
+        self.batches = 0
+
+    async def batch(self, calls):
+        self.batches += 1
+        results = []
+        for method, params in calls:
+            assert method == "getTokenAccountsByOwner"
+            owner, program = params[0], params[1]["programId"]
+            results.append({"value": self.holdings.get((owner, program), [])})
+        return results
+
+def test_find_positions():
+    """Positions are aggregated per wallet and mint; zero and WSOL balances are skipped"""
+    from core.panic_sell import PanicSeller
+    from utils.token_layout import TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID
+
+    owner_a, owner_b = str(Pubkey.new_unique()), str(Pubkey.new_unique())
+    mint_x, mint_y = str(Pubkey.new_unique()), str(Pubkey.new_unique())
+    rpc = FakeRpc({
+        (owner_a, TOKEN_PROGRAM_ID): [_token_account(mint_x, owner_a, 100), _token_account(SOL_MINT, owner_a, 5)],
+        (owner_a, TOKEN_2022_PROGRAM_ID): [_token_account(mint_y, owner_a, 7)],
+        (owner_b, TOKEN_PROGRAM_ID): [_token_account(mint_x, owner_b, 0)],
+    })
+    wallets = [SimpleNamespace(id=1, public_key=owner_a), SimpleNamespace(id=2, public_key=owner_b)]
+
+    seller = PanicSeller(rpc=rpc, jupiter=object())
+    positions = asyncio.run(seller.find_positions(wallets))
+
+    assert rpc.batches == 1
+    assert sorted((p["mint"], p["amount"]) for p in positions[1]) == sorted([(mint_x, 100), (mint_y, 7)])
+    assert 2 not in positions
+    print("✓ PASSED: Positions found in one batch")
+
+def test_rate_limiter():
+    """Requests beyond the burst wait for refill"""
+    from utils.rate_limiter import RateLimiter
+
+    async def run():
+        limiter = RateLimiter(rate=200, burst=10)
+        start = time.monotonic()
+        for _ in range(30):
+            await limiter.acquire()
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+    assert elapsed >= 0.09, elapsed
+    print(f"✓ PASSED: Rate limiter throttled 30 requests over {elapsed:.3f}s")
+
+def main():
+    tests = [test_find_positions, test_rate_limiter]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
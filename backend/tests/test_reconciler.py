@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+RECONCILER TESTING: Processed-Commitment Fast Mode
+Tests promotion to finalized with per-level detection latency, and flagging
+of positions bought on events that were dropped
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add src and benchmarks to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from solders.keypair import Keypair
+
+from standins import RpcHandler, StandinServer
+
+def _reconciler(url: str, drop_after: float = 60.0):
+    from core.rpc import AsyncRpc
+    from monitoring.reconciler import CommitmentReconciler
+    from utils.rate_limiter import RateLimiter
+
+    rpc = AsyncRpc(url, limiter=RateLimiter(rate=10_000, burst=10_000))
+    return CommitmentReconciler(rpc, interval=0.01, drop_after=drop_after)
+
+def _event(signature: str) -> dict:
+    return {
+        "platform": "pumpfun",
+        "token_address": f"Mint-{signature}",
+        "signature": signature,
+        "slot": 7,
+        "commitment": "processed",
+        "detected_at": time.time()
+    }
+
+def test_finalized_latency_per_level():
+    """A processed event is followed to finalized and latency is kept per level"""
+    levels = iter(["processed", "confirmed", "confirmed", "finalized"])
+
+    def statuses(params):
+        status = {"err": None, "confirmationStatus": next(levels, "finalized")}
+        return {"context": {"slot": 9}, "value": [status for _ in params[0]]}
+
+    overrides = {"getSignatureStatuses": statuses, "getBlockTime": lambda params: int(time.time()) - 1}
+    with StandinServer(RpcHandler, overrides=overrides) as rpc:
+        async def run():
+            reconciler = _reconciler(rpc.url)
+            reconciler.track(_event("sigA"))
+            while reconciler.get_stats()["pending"]:
+                await asyncio.sleep(0.01)
+            return reconciler.get_stats()
+
+        stats = asyncio.run(run())
+
+    assert stats["finalized"] == 1 and stats["dropped"] == 0
+    latency = stats["detection_latency_ms"]
+    assert set(latency) == {"processed", "confirmed", "finalized"}, latency
+    assert latency["processed"]["p50"] <= latency["confirmed"]["p50"] <= latency["finalized"]["p50"]
+    print("✓ PASSED: detection latency measured per commitment level")
+
+def test_dropped_event_flags_position():
+    """A sniper that bought on a dropped event flags the position"""
+    from monitoring.event_bus import PoolEventBus
+    from trading.sniper import SniperBot
+
+    statuses = lambda params: {"context": {"slot": 9}, "value": [None for _ in params[0]]}
+
+    class IdleMonitor:
+        def __init__(self, platform):
+            pass
+
+        async def start(self, on_new_pool):
+            await asyncio.Event().wait()
+
+        async def disconnect(self):
+            pass
+
+    with StandinServer(RpcHandler, overrides={"getSignatureStatuses": statuses}) as rpc:
+        async def run():
+            bus = PoolEventBus(monitor_factory=IdleMonitor, reconciler=_reconciler(rpc.url, drop_after=0.05))
+            sniper = SniperBot(1, Keypair(), {}, bus=bus)
+
+            async def instant_buy(pool_data):
+                sniper.bought_tokens.add(pool_data["token_address"])
+            sniper.on_new_pool = instant_buy
+
+            task = asyncio.create_task(sniper.start(["pumpfun"]))
+            await asyncio.sleep(0)
+            await bus.publish(_event("sigB"))
+            while not sniper.flagged_positions:
+                await asyncio.sleep(0.01)
+
+            stats = bus.get_stats()["reconciler"]
+            await sniper.stop()
+            task.cancel()
+            return sniper.flagged_positions, stats
+
+        flagged, stats = asyncio.run(run())
+
+    assert flagged == [{"token_address": "Mint-sigB", "signature": "sigB", "reason": "not_confirmed", "unwound": False}]
+    assert stats["dropped"] == 1
+    print("✓ PASSED: position on a dropped event is flagged")
+
+def main():
+    tests = [test_finalized_latency_per_level, test_dropped_event_flags_position]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
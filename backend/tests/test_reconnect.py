@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+RECONNECT TESTING: Resubscribe and Gap Backfill
+Tests WebSocket reconnection with resubscription, backfill of pools missed
+during the gap and the sniper's staleness policy for backfilled pools
+"""
+
+import asyncio
+import json
+import sys
+import os
+import time
+
+# Add src and benchmarks to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+import websockets
+from solders.keypair import Keypair
+
+from pool_fixtures import load_fixtures
+
+def test_reconnect_resubscribes():
+    """A dropped socket is reopened, subscriptions restored and on_reconnect fired"""
+    from monitoring.ws_mux import WebSocketMux
+
+    async def run():
+        state = {"connections": 0, "subscribes": 0}
+
+        async def handler(websocket):
+            state["connections"] += 1
+            connection = state["connections"]
+            async for message in websocket:
+                request = json.loads(message)
+                state["subscribes"] += 1
+                sub_id = 100 + state["subscribes"]
+                await websocket.send(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": sub_id}))
+                await websocket.send(json.dumps({
+                    "jsonrpc": "2.0", "method": "logsNotification",
+                    "params": {"subscription": sub_id, "result": {"value": f"conn-{connection}"}}
+                }))
+                if connection == 1:
+                    await websocket.close()
+                    return
+
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            mux = WebSocketMux(f"ws://127.0.0.1:{port}", backoff_base=0.01, backoff_max=0.05)
+            received, reconnected = [], asyncio.Event()
+
+            async def on_notification(result):
+                received.append(result["value"])
+
+            async def on_reconnect():
+                reconnected.set()
+
+            await mux.subscribe("logsSubscribe", [{"mentions": ["x"]}], on_notification, on_reconnect=on_reconnect)
+            await asyncio.wait_for(reconnected.wait(), timeout=5)
+            await asyncio.sleep(0.05)
+            stats = mux.get_stats()
+            await mux.close()
+            return state, received, stats
+
+    state, received, stats = asyncio.run(run())
+    assert state["connections"] == 2 and state["subscribes"] == 2
+    assert received == ["conn-1", "conn-2"], received
+    assert stats["reconnects"] == 1
+    print("✓ PASSED: Reconnected and resubscribed")
+
+class BackfillRpc:
+    """Serves getSignaturesForAddress and getTransaction from the fixture set"""
+
+    def __init__(self, fixtures):
+        # Program history, newest first like the RPC
+        self.history = {}
+        for fixture in fixtures:
+            value = fixture["notification"]["value"]
+            tx = dict(fixture.get("transaction") or {"transaction": None, "meta": {"err": None}})
+            tx["slot"] = fixture["notification"]["context"]["slot"]
+            tx["blockTime"] = int(time.time())
+            tx["meta"] = dict(tx["meta"], logMessages=value["logs"])
+            self.history.setdefault(fixture["platform"], []).insert(0, (value["signature"], tx))
+        self.transactions = {sig: tx for entries in self.history.values() for sig, tx in entries}
+
+    async def call(self, method, params=None):
+        assert method == "getSignaturesForAddress"
+        from monitoring.pool_monitor import PROGRAM_IDS
+        platform = next(p for p, program in PROGRAM_IDS.items() if program == params[0])
+        config = params[1]
+        page = []
+        skipping = "before" in config
+        for signature, _ in self.history[platform]:
+            if signature == config["until"] or len(page) == config["limit"]:
+                break
+            if skipping:
+                skipping = signature != config["before"]
+                continue
+            page.append({"signature": signature, "err": None})
+        return page
+
+    async def batch(self, calls):
+        return [self.transactions[params[0]] for method, params in calls]
+
+def test_backfill_marks_missed_pools():
+    """Pools after the last seen signature are replayed oldest first and marked backfilled"""
+    from monitoring.pool_monitor import PoolMonitor
+
+    fixtures = load_fixtures()
+    rpc = BackfillRpc(fixtures)
+    pumpfun = [f for f in fixtures if f["platform"] == "pumpfun"]
+    # Saw the first pump.fun message live, missed the rest
+    monitor = PoolMonitor("pumpfun", mux=object(), rpc=rpc)
+    monitor.is_running = True
+    monitor.last_signature = pumpfun[0]["notification"]["value"]["signature"]
+
+    emitted = []
+
+    async def on_new_pool(pool_data):
+        emitted.append(pool_data)
+    monitor.on_new_pool = on_new_pool
+
+    asyncio.run(monitor.backfill())
+
+    expected = [f["expected"]["token_address"] for f in pumpfun[1:] if f["expected"]]
+    assert [p["token_address"] for p in emitted] == expected
+    assert all(p["backfilled"] for p in emitted)
+    assert monitor.last_signature == pumpfun[-1]["notification"]["value"]["signature"]
+    print(f"✓ PASSED: {len(emitted)} missed pools backfilled in order")
+
+def test_backfill_truncation_counted():
+    """A gap past max_signatures is counted and live progress is not rewound"""
+    import monitoring.pool_monitor as pool_monitor
+    from monitoring.pool_monitor import PoolMonitor
+
+    fixtures = load_fixtures()
+    rpc = BackfillRpc(fixtures)
+    pumpfun = [f for f in fixtures if f["platform"] == "pumpfun"]
+    monitor = PoolMonitor("pumpfun", mux=object(), rpc=rpc)
+    monitor.is_running = True
+    monitor.last_signature = pumpfun[0]["notification"]["value"]["signature"]
+    monitor.on_new_pool = None
+
+    async def live_batch(calls):
+        # A live notification lands while the backfill fetches transactions
+        monitor.last_signature = "live-signature"
+        return [rpc.transactions[params[0]] for method, params in calls]
+    rpc.batch = live_batch
+
+    page_size = pool_monitor.SIGNATURE_PAGE_SIZE
+    pool_monitor.SIGNATURE_PAGE_SIZE = 2
+    try:
+        asyncio.run(monitor.backfill(max_signatures=2))
+    finally:
+        pool_monitor.SIGNATURE_PAGE_SIZE = page_size
+
+    assert len(pumpfun) > 3 and monitor.backfill_truncations == 1
+    assert monitor.last_signature == "live-signature"
+    print("✓ PASSED: truncated backfill counted, live signature kept")
+
+def test_stale_backfilled_pool_skipped():
+    """The sniper skips backfilled pools older than max_backfill_age"""
+    from monitoring.event_bus import PoolEventBus
+    from trading.sniper import SniperBot
+
+    class FailingAnalyzer:
+        async def analyze_token(self, token_address, commitment="confirmed"):
+            raise AssertionError("Stale pool must not be analyzed")
+
+    sniper = SniperBot(1, Keypair(), {"min_liquidity": 0, "max_backfill_age": 10}, bus=PoolEventBus(None))
+    sniper.analyzer = FailingAnalyzer()
+    pool = {"platform": "pumpfun", "token_address": "Mint", "liquidity": 5,
+            "backfilled": True, "block_time": int(time.time()) - 60}
+    asyncio.run(sniper.on_new_pool(pool))
+
+    assert sniper.tokens_skipped == 1
+    print("✓ PASSED: Stale backfilled pool skipped")
+
+def main():
+    tests = [test_reconnect_resubscribes, test_backfill_marks_missed_pools, test_backfill_truncation_counted,
+             test_stale_backfilled_pool_skipped]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+SENDER TESTING: Rebroadcast Until Landed
+Tests rebroadcasting, blockhash expiry, re-signing and landing-rate stats
+against the stand-in RPC server
+"""
+
+import asyncio
+import sys
+import os
+
+# Add src and benchmarks to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction
+
+from standins import RpcHandler, StandinServer
+
+def _signed_transfer() -> bytes:
+    signer = Keypair()
+    ix = transfer(TransferParams(from_pubkey=signer.pubkey(), to_pubkey=Pubkey.new_unique(), lamports=1))
+    return bytes(Transaction.new_signed_with_payer([ix], signer.pubkey(), [signer], Hash.new_unique()))
+
+def _sender(url: str):
+    from core.rpc import AsyncRpc
+    from trading.sender import TransactionSender
+    from utils.rate_limiter import RateLimiter
+
+    rpc = AsyncRpc(url, limiter=RateLimiter(rate=10_000, burst=10_000))
+    return TransactionSender(rpc, rebroadcast_interval=0.01, max_resigns=2)
+
+def test_rebroadcast_until_landed():
+    """The same bytes are resent until the signature shows up as confirmed"""
+    sent = []
+    polls = {"count": 0}
+
+    def send_transaction(params):
+        sent.append(params[0])
+        return "ignored"
+
+    def statuses(params):
+        polls["count"] += 1
+        status = {"err": None, "confirmationStatus": "confirmed"} if polls["count"] >= 3 else None
+        return {"context": {"slot": 1}, "value": [status for _ in params[0]]}
+
+    overrides = {"sendTransaction": send_transaction, "getSignatureStatuses": statuses}
+    with StandinServer(RpcHandler, overrides=overrides) as rpc:
+        sender = _sender(rpc.url)
+        outcome = asyncio.run(sender.send(_signed_transfer(), "transfer", last_valid_block_height=10_000))
+
+    assert outcome["landed"], outcome
+    assert outcome["broadcasts"] == 3
+    assert len(set(sent)) == 1, "Rebroadcasts must reuse the signed bytes"
+    stats = sender.get_stats()["transfer"]
+    assert stats["landed"] == 1 and stats["landing_rate"] == 100
+    print(f"✓ PASSED: Landed after {outcome['broadcasts']} broadcasts")
+
+def test_expiry_resigns_then_gives_up():
+    """After lastValidBlockHeight passes the resigner is used up to the limit"""
+    height = {"value": 100}
+
+    def block_height(params):
+        height["value"] += 10
+        return height["value"]
+
+    overrides = {"getBlockHeight": block_height}
+    with StandinServer(RpcHandler, confirmation_status=None, overrides=overrides) as rpc:
+        sender = _sender(rpc.url)
+        resigned = []
+
+        async def resign():
+            raw = _signed_transfer()
+            resigned.append(raw)
+            return raw, height["value"] + 5
+
+        async def run():
+            swap = await sender.send(_signed_transfer(), "swap", last_valid_block_height=105)
+            transfer_outcome = await sender.send(_signed_transfer(), "transfer", last_valid_block_height=105, resign=resign)
+            return swap, transfer_outcome
+
+        swap, transfer_outcome = asyncio.run(run())
+
+    assert swap["state"] == "expired" and swap["resigns"] == 0
+    assert transfer_outcome["state"] == "expired" and transfer_outcome["resigns"] == 2
+    assert len(resigned) == 2
+    stats = sender.get_stats()
+    assert stats["swap"]["expired"] == 1 and stats["swap"]["landing_rate"] == 0
+    assert stats["transfer"]["resigned"] == 2
+    print("✓ PASSED: Expired transactions re-signed up to the limit")
+
+def test_failed_transaction_not_rebroadcast():
+    """A status with an error finishes the transaction as failed"""
+    def statuses(params):
+        status = {"err": {"InstructionError": [0, "Custom"]}, "confirmationStatus": "confirmed"}
+        return {"context": {"slot": 1}, "value": [status for _ in params[0]]}
+
+    with StandinServer(RpcHandler, overrides={"getSignatureStatuses": statuses}) as rpc:
+        sender = _sender(rpc.url)
+        outcome = asyncio.run(sender.send(_signed_transfer(), "transfer", last_valid_block_height=10_000))
+
+    assert outcome["state"] == "failed" and not outcome["landed"]
+    assert outcome["broadcasts"] == 1
+    print("✓ PASSED: Failed transaction reported")
+
+def test_idle_height_read_again():
+    """A height cached before idle time is re-read, not reused, for a default expiry"""
+    import time
+    polls = {"count": 0}
+
+    def statuses(params):
+        polls["count"] += 1
+        status = {"err": None, "confirmationStatus": "confirmed"} if polls["count"] >= 2 else None
+        return {"context": {"slot": 1}, "value": [status for _ in params[0]]}
+
+    overrides = {"getBlockHeight": lambda params: 5000, "getSignatureStatuses": statuses}
+    with StandinServer(RpcHandler, overrides=overrides) as rpc:
+        sender = _sender(rpc.url)
+        # Primed an hour ago, then idle
+        sender._set_block_height(10)
+        sender._block_height_at = time.monotonic() - 3600
+        outcome = asyncio.run(sender.send(_signed_transfer(), "swap"))
+
+    assert outcome["landed"], outcome
+    assert sender._block_height == 5000
+    print("✓ PASSED: stale block height re-read before defaulting the expiry")
+
+def main():
+    tests = [test_rebroadcast_until_landed, test_expiry_resigns_then_gives_up, test_failed_transaction_not_rebroadcast,
+             test_idle_height_read_again]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+SPECULATIVE TESTING: Buy-First, Verify-in-Parallel
+Tests that speculative mode buys while the RPC checks run, exits positions
+that fail them and falls back to verify-then-buy once the cap is reached
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from solders.keypair import Keypair
+
+class SlowAnalyzer:
+    """Mint lookups take 50 ms; mints named "bad..." keep their mint authority"""
+
+    def __init__(self):
+        self.done = {}
+
+    async def fetch_mint(self, token_address, commitment="confirmed"):
+        await asyncio.sleep(0.05)
+        self.done[token_address] = time.perf_counter()
+        return {"renounced": not token_address.startswith("bad")}
+
+    def check_mint_authority(self, mint):
+        return mint["renounced"]
+
+def _sniper(config):
+    from monitoring.creator_index import CreatorIndex
+    from monitoring.event_bus import PoolEventBus
+    from trading.sniper import SniperBot
+    from trading.traded_mints import TradedMintRegistry
+
+    sniper = SniperBot(1, Keypair(), {"min_liquidity": 1, "require_freeze_renounced": False,
+                                      "min_safety_score": 0, "warm_up": False, **config},
+                       bus=PoolEventBus(monitor_factory=None, creators=CreatorIndex()))
+    sniper.creators._loaded = True
+    sniper.traded = TradedMintRegistry()
+    sniper.traded._loaded = True
+    sniper.analyzer = SlowAnalyzer()
+    sniper.buys, sniper.exits = {}, []
+
+    async def fake_buy(token_address, received, trace=None):
+        sniper.buys[token_address] = time.perf_counter()
+        await asyncio.sleep(0.02)
+        sniper.bought_tokens.add(token_address)
+
+    async def fake_unwind(token_address, strategy="unwind"):
+        sniper.exits.append((token_address, strategy))
+        return True
+
+    sniper.buy, sniper.unwind = fake_buy, fake_unwind
+    return sniper
+
+def test_buy_runs_alongside_verification():
+    """The buy is sent before analysis completes; failed tokens are exited"""
+    sniper = _sniper({"speculative": True, "max_speculative_positions": 4})
+
+    async def run():
+        await sniper.on_new_pool({"platform": "pumpfun", "token_address": "goodMint", "liquidity": 5})
+        await sniper.on_new_pool({"platform": "pumpfun", "token_address": "badMint", "liquidity": 5})
+        await sniper.on_new_pool({"platform": "pumpfun", "token_address": "dustMint", "liquidity": 0.1})
+
+    asyncio.run(run())
+
+    assert sniper.buys["goodMint"] < sniper.analyzer.done["goodMint"]
+    assert sniper.exits == [("badMint", "speculative_exit")]
+    assert "dustMint" not in sniper.buys
+    stats = sniper.get_stats()["speculative"]
+    assert stats["entries"] == 2 and stats["verified"] == 1 and stats["exits"] == 1 and stats["open"] == 0
+    outcomes = {o["token_address"]: o for o in stats["recent"]}
+    assert outcomes["badMint"]["reason"] == "Mint authority not renounced" and outcomes["badMint"]["exited"]
+    assert sniper.get_stats()["latency_ms"]["speculative.verify"]["count"] == 2
+    print("✓ PASSED: buys overlap verification and failed entries are exited")
+
+def test_cap_falls_back_to_verify_first():
+    """With the cap in use, further events are verified before buying"""
+    sniper = _sniper({"speculative": True, "max_speculative_positions": 1})
+
+    async def run():
+        await asyncio.gather(
+            sniper.on_new_pool({"platform": "pumpfun", "token_address": "firstMint", "liquidity": 5}),
+            sniper.on_new_pool({"platform": "pumpfun", "token_address": "secondMint", "liquidity": 5}),
+            sniper.on_new_pool({"platform": "pumpfun", "token_address": "badSecond", "liquidity": 5})
+        )
+
+    asyncio.run(run())
+
+    assert sniper.buys["firstMint"] < sniper.analyzer.done["firstMint"]
+    assert sniper.buys["secondMint"] > sniper.analyzer.done["secondMint"]
+    assert "badSecond" not in sniper.buys and not sniper.exits
+    assert sniper.get_stats()["speculative"]["entries"] == 1
+    filters = sniper.get_stats()["filters"]
+    assert filters["evaluated"] == 3 and filters["passed"] == 2
+    print("✓ PASSED: speculative positions capped, the rest verified first")
+
+def main():
+    tests = [test_buy_runs_alongside_verification, test_cap_falls_back_to_verify_first]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
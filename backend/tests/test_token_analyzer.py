@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+TOKEN ANALYZER TESTING: Async Safety Analysis
+Tests mint decoding, batched mint loading and single-pass analysis against
+the stand-in RPC server
+"""
+
+import asyncio
+import base64
+import struct
+import sys
+import os
+
+# Add src and benchmarks to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from solders.pubkey import Pubkey
+
+from standins import RpcHandler, StandinServer
+
+def _analyzer(url: str):
+    from core.rpc import AsyncRpc
+    from monitoring.token_analyzer import TokenAnalyzer
+    from utils.rate_limiter import RateLimiter
+
+    return TokenAnalyzer(AsyncRpc(url, limiter=RateLimiter(rate=10_000, burst=10_000)))
+
+TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+TOKEN_2022_PROGRAM_ID = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+
+def _mint_data(mint_authority=None, freeze_authority=None, supply=10**15, decimals=6) -> bytes:
+    def option(key):
+        return (1, bytes(key)) if key else (0, bytes(32))
+    return struct.pack("<I32sQBBI32s", *option(mint_authority), supply, decimals, 1, *option(freeze_authority))
+
+def _accounts(datas: dict):
+    """getMultipleAccounts override answering from {address: (data, owner)}"""
+    calls = []
+
+    def get_multiple_accounts(params):
+        calls.append(list(params[0]))
+        data_slice = params[1].get("dataSlice")
+        value = []
+        for address in params[0]:
+            data, owner = datas.get(address, (None, None))
+            if data is not None and data_slice:
+                data = data[data_slice["offset"]:data_slice["offset"] + data_slice["length"]]
+            value.append(None if data is None else
+                         {"data": [base64.b64encode(data).decode(), "base64"], "owner": owner,
+                          "lamports": 1, "executable": False, "rentEpoch": 0})
+        return {"context": {"slot": 1}, "value": value}
+    return get_multiple_accounts, calls
+
+def _largest(accounts: list = ()):
+    """getTokenLargestAccounts override answering with [(address, amount)]"""
+    return lambda params: {"context": {"slot": 1}, "value": [
+        {"address": address, "amount": str(amount), "decimals": 6, "uiAmount": amount / 1e6}
+        for address, amount in accounts
+    ]}
+
+def test_decode_mint_layouts():
+    """SPL Token and Token-2022 mints decode; other accounts are rejected"""
+    from utils.token_layout import decode_mint
+
+    authority = Pubkey.new_unique()
+    spl = decode_mint(_mint_data(mint_authority=authority), TOKEN_PROGRAM_ID)
+    assert spl.mint_authority == str(authority) and spl.freeze_authority is None
+    assert spl.supply == 10**15 and spl.decimals == 6 and spl.is_initialized
+
+    extended = _mint_data(freeze_authority=authority).ljust(165, b"\0") + bytes([1]) + bytes(8)
+    token_2022 = decode_mint(extended, TOKEN_2022_PROGRAM_ID)
+    assert token_2022.mint_authority is None and token_2022.freeze_authority == str(authority)
+
+    token_account = bytes(165) + bytes([2])
+    assert decode_mint(token_account, TOKEN_2022_PROGRAM_ID) is None
+    assert decode_mint(_mint_data(), "11111111111111111111111111111111") is None
+    print("✓ PASSED: mint layouts decoded for both token programs")
+
+def test_analyze_token_single_pass():
+    """Authorities come from the decoded mint; same result keys as before"""
+    renounced, minting = str(Pubkey.new_unique()), str(Pubkey.new_unique())
+    override, calls = _accounts({
+        renounced: (_mint_data(), TOKEN_PROGRAM_ID),
+        minting: (_mint_data(mint_authority=Pubkey.new_unique(), freeze_authority=Pubkey.new_unique()), TOKEN_PROGRAM_ID),
+    })
+
+    with StandinServer(RpcHandler, overrides={"getMultipleAccounts": override, "getTokenLargestAccounts": _largest()}) as rpc:
+        analyzer = _analyzer(rpc.url)
+        safe = asyncio.run(analyzer.analyze_token(renounced))
+        unsafe = asyncio.run(analyzer.analyze_token(minting))
+
+    assert {"address", "mint_renounced", "freeze_renounced", "top_holders", "safety_score", "is_safe"} <= set(safe)
+    assert safe["mint_renounced"] and safe["freeze_renounced"]
+    assert not unsafe["mint_renounced"] and not unsafe["freeze_renounced"]
+    assert unsafe["safety_score"] == safe["safety_score"] - 50
+    assert calls == [[renounced], [minting]], calls
+    print("✓ PASSED: analysis fetches once and scores once")
+
+def test_burst_loads_mints_in_one_request():
+    """Concurrent analyses of a burst of pools share one getMultipleAccounts"""
+    mints = [str(Pubkey.new_unique()) for _ in range(20)]
+    override, calls = _accounts({mint: (_mint_data(), TOKEN_PROGRAM_ID) for mint in mints})
+
+    with StandinServer(RpcHandler, overrides={"getMultipleAccounts": override, "getTokenLargestAccounts": _largest()}) as rpc:
+        analyzer = _analyzer(rpc.url)
+
+        async def run():
+            return await asyncio.gather(*[analyzer.analyze_token(mint) for mint in mints])
+
+        results = asyncio.run(run())
+
+    assert all(r["mint_renounced"] for r in results)
+    assert len(calls) == 1 and sorted(calls[0]) == sorted(mints), calls
+    assert analyzer.mints.get_stats()["avg_batch_size"] == 20
+    print("✓ PASSED: 20 mints loaded in one batched request")
+
+def test_cache_ttls_and_negative_caching():
+    """Renounced mints stay cached, missing mints are not, failures are cached briefly, LRU is capped"""
+    from monitoring.token_analyzer import AnalysisCache
+
+    renounced, missing, failing = (str(Pubkey.new_unique()) for _ in range(3))
+    override, calls = _accounts({renounced: (_mint_data(), TOKEN_PROGRAM_ID)})
+    commitments = []
+
+    def accounts(params):
+        if failing in params[0]:
+            raise Exception("node behind")
+        commitments.append(params[1]["commitment"])
+        return override(params)
+
+    with StandinServer(RpcHandler, overrides={"getMultipleAccounts": accounts, "getTokenLargestAccounts": _largest()}) as rpc:
+        analyzer = _analyzer(rpc.url)
+        analyzer.cache = AnalysisCache(negative_ttl=0.05)
+
+        async def run():
+            for _ in range(3):
+                await analyzer.analyze_token(renounced)
+                # A pool seen at processed reads its mint at processed
+                await analyzer.analyze_token(missing, "processed")
+            errors = 0
+            for _ in range(2):
+                try:
+                    await analyzer.fetch_mint(failing)
+                except Exception:
+                    errors += 1
+            return errors
+
+        errors = asyncio.run(run())
+
+    assert calls == [[renounced], [missing], [missing], [missing]], calls
+    assert commitments == ["confirmed", "processed", "processed", "processed"]
+    assert errors == 2
+    stats = analyzer.get_stats()["cache"]
+    assert stats["fields"]["mint"]["hits"] == 3 and stats["fields"]["mint"]["misses"] == 5
+
+    lru = AnalysisCache(maxsize=2)
+    for mint in ("A", "B", "C"):
+        lru.put("mint", mint, None, 60)
+    assert lru.get("mint", "A") == (False, None) and lru.get("mint", "C")[0]
+    assert lru.get_stats()["evictions"] == 1
+    print("✓ PASSED: cache honours per-field TTLs, negative caching and size cap")
+
+def test_holder_concentration():
+    """Vaults, bonding curve and burns are excluded; top-N and HHI use the rest"""
+    from monitoring.token_analyzer import pumpfun_bonding_curve
+
+    mint = str(Pubkey.new_unique())
+    whale, shrimp = Pubkey.new_unique(), Pubkey.new_unique()
+    owners = {
+        "vault": Pubkey.from_string("5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1"),
+        "curve": Pubkey.from_string(pumpfun_bonding_curve(mint)),
+        "burn": Pubkey.from_string("1nc1nerator11111111111111111111111111111111"),
+        "whale1": whale, "whale2": whale, "shrimp": shrimp,
+    }
+    amounts = {"vault": 400, "curve": 300, "burn": 100, "whale1": 120, "whale2": 30, "shrimp": 50}
+    token_account = lambda owner: bytes(32) + bytes(owner) + bytes(101)
+    datas = {name: (token_account(owner), TOKEN_PROGRAM_ID) for name, owner in owners.items()}
+    datas[mint] = (_mint_data(supply=1000), TOKEN_PROGRAM_ID)
+    override, calls = _accounts(datas)
+    largest = _largest(sorted(amounts.items(), key=lambda item: -item[1]))
+
+    with StandinServer(RpcHandler, overrides={"getMultipleAccounts": override, "getTokenLargestAccounts": largest}) as rpc:
+        result = asyncio.run(_analyzer(rpc.url).analyze_token(mint))
+
+    # Circulating 200: whale 150 (two accounts), shrimp 50
+    assert result["top_holders"] == [{"address": str(whale), "percentage": 75.0},
+                                     {"address": str(shrimp), "percentage": 25.0}]
+    concentration = result["holder_concentration"]
+    assert concentration["top_1_pct"] == 75.0 and concentration["top_10_pct"] == 100.0
+    assert concentration["hhi"] == 75.0 ** 2 + 25.0 ** 2
+    assert len(calls) == 2, calls
+    print("✓ PASSED: holder concentration excludes vaults and burns")
+
+def main():
+    tests = [test_decode_mint_layouts, test_analyze_token_single_pass, test_burst_loads_mints_in_one_request,
+             test_cache_ttls_and_negative_caching, test_holder_concentration]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
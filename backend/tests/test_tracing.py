@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+TRACING TESTING: End-to-End Sniper Latency
+Tests that an event's receive, decode, dequeue, filter and buy stages land in
+the sniper's rolling latency summary along with send-vs-creation slots
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from solders.keypair import Keypair
+
+class IdleMonitor:
+    def __init__(self, platform):
+        pass
+
+    async def start(self, on_new_pool):
+        await asyncio.Event().wait()
+
+    async def disconnect(self):
+        pass
+
+def test_trace_stages_and_slots():
+    """Every stage of a traced event is summarized; slots are compared"""
+    from monitoring.event_bus import PoolEventBus
+    from monitoring.slot_clock import SlotClock
+    from trading.sniper import SniperManager
+
+    config = {"min_liquidity": 1, "require_mint_renounced": False,
+              "require_freeze_renounced": False, "min_safety_score": 0}
+
+    async def run():
+        bus = PoolEventBus(monitor_factory=IdleMonitor)
+        manager = SniperManager(bus=bus)
+        await manager.start(1, Keypair(), config, sniper_id="traced", platforms=["pumpfun"])
+        sniper = manager._snipers["traced"]
+        sniper.slot_clock = SlotClock()
+        sniper.slot_clock.observe(105)
+
+        async def fake_buy(token_address, received, trace=None):
+            trace["send_slot"] = sniper.slot_clock.slot
+            trace["stages"]["buy.send"] = 1.5
+        sniper.buy = fake_buy
+
+        await asyncio.sleep(0)
+        now = time.perf_counter()
+        await bus.publish({"platform": "pumpfun", "token_address": "MintT", "liquidity": 3, "slot": 100,
+                           "trace": {"received": now - 0.004, "decoded": now - 0.001}})
+        await bus.publish({"platform": "pumpfun", "token_address": "MintU", "liquidity": 0.5, "slot": 101,
+                           "trace": {"received": now, "decoded": now}})
+        while sniper.pools_detected < 2:
+            await asyncio.sleep(0.01)
+
+        metrics = manager.get_metrics()
+        status = manager.get_status()
+        await manager.stop()
+        return metrics, status
+
+    metrics, status = asyncio.run(run())
+    latency = metrics["snipers"]["traced"]["latency_ms"]
+    for stage in ("decode", "queue", "filter.liquidity", "receive_to_decision", "buy.send", "receive_to_done"):
+        assert stage in latency, (stage, sorted(latency))
+    assert latency["decode"]["p50"] >= 0 and latency["filter.liquidity"]["count"] == 2
+    assert latency["buy.send"]["count"] == 1
+    assert metrics["snipers"]["traced"]["slots"]["last"] == {"creation_slot": 100, "send_slot": 105}
+    assert metrics["snipers"]["traced"]["slots"]["send_minus_creation"]["send_minus_creation"]["p50"] == 5
+    assert status["latency_ms"]["receive_to_decision"]["count"] == 2
+    print("✓ PASSED: latency traced from receive to send with slot deltas")
+
+def main():
+    tests = [test_trace_stages_and_slots]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
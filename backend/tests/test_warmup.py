@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+WARM-UP TESTING: Sniper Pre-warm Stage
+Tests that warm-up opens the pooled clients and fills the balance, block
+height and priority fee caches the first buy then uses, against the stand-in
+Jupiter and RPC servers
+"""
+
+import asyncio
+import sys
+import os
+
+# Add src and benchmarks to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from solders.keypair import Keypair
+
+from standins import JupiterHandler, RpcHandler, StandinServer
+
+def test_warm_up_primes_first_buy():
+    """The first buy reads no balance and reuses the warmed HTTP client"""
+    from core.database import init_db
+    from core.rpc import AsyncRpc
+    from monitoring.event_bus import PoolEventBus
+    from trading.executor import TradeExecutor
+    from trading.jupiter import JupiterClient
+    from trading.priority_fees import PriorityFeeCache
+    from trading.sender import TransactionSender
+    from trading.sniper import SniperBot
+    from utils.rate_limiter import RateLimiter
+
+    init_db()
+    calls = {"getBalance": 0}
+
+    def get_balance(params):
+        calls["getBalance"] += 1
+        return {"context": {"slot": 1000}, "value": 3 * 10**9}
+
+    def recent_fees(params):
+        return [{"slot": 990 + i, "prioritizationFee": fee} for i, fee in enumerate([0, 100, 200, 300, 400])]
+
+    overrides = {"getBalance": get_balance, "getRecentPrioritizationFees": recent_fees}
+    with StandinServer(JupiterHandler) as jupiter_server, StandinServer(RpcHandler, overrides=overrides) as rpc_server:
+        async def run():
+            keypair = Keypair()
+            sniper = SniperBot(1, keypair, {"buy_amount": 0.5}, bus=PoolEventBus(monitor_factory=None))
+            rpc = AsyncRpc(rpc_server.url, limiter=RateLimiter(rate=10_000, burst=10_000))
+            sniper.sender = TransactionSender(rpc, rebroadcast_interval=0.01)
+            sniper.priority_fees = PriorityFeeCache(rpc, pct=50)
+            sniper.jupiter = JupiterClient(api_url=jupiter_server.url, rpc_endpoint=rpc_server.url,
+                                           sender=sniper.sender, priority_fees=sniper.priority_fees)
+            sniper.executor = TradeExecutor(1, keypair, jupiter=sniper.jupiter, rpc=rpc)
+
+            timings = await sniper.warm_up()
+            http = sniper.jupiter._http
+            result = await sniper.executor.execute_buy(str(Keypair().pubkey()), 0.5, strategy="snipe")
+            reused = sniper.jupiter._http is http
+            await sniper.jupiter.close()
+            await rpc.close()
+            return sniper, timings, result, reused
+
+        sniper, timings, result, reused = asyncio.run(run())
+
+    assert {"jupiter", "block_height", "balance", "priority_fee", "total"} <= set(timings), timings
+    assert sniper.priority_fees.fee == 250
+    assert sniper.sender._block_height == 1000
+    assert result["success"], result
+    assert calls["getBalance"] == 1 and reused
+    assert sniper.executor.balance == 2.5
+    print(f"✓ PASSED: warm-up took {timings['total']} ms; first buy used warm caches")
+
+def main():
+    tests = [test_warm_up_primes_first_buy]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
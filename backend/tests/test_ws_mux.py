@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+WEBSOCKET MUX TESTING: Shared Subscriptions
+Tests that monitors share one connection, identical subscriptions are sent
+once and notifications are routed by subscription id
+"""
+
+import asyncio
+import json
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import websockets
+
+class FakeSolanaWs:
+    """Minimal pub/sub server: numbered subscriptions and pushed notifications"""
+
+    def __init__(self):
+        self.connections = 0
+        self.subscribes = []
+        self.unsubscribes = []
+        self.clients = []
+
+    async def handler(self, websocket):
+        self.connections += 1
+        self.clients.append(websocket)
+        async for message in websocket:
+            request = json.loads(message)
+            if request["method"].endswith("Unsubscribe"):
+                self.unsubscribes.append(request["params"][0])
+                result = True
+            else:
+                self.subscribes.append(request["params"][0])
+                result = 100 + len(self.subscribes)
+            await websocket.send(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result}))
+
+    async def notify(self, subscription: int, value):
+        message = {
+            "jsonrpc": "2.0",
+            "method": "programNotification",
+            "params": {"subscription": subscription, "result": {"value": value}}
+        }
+        for client in self.clients:
+            await client.send(json.dumps(message))
+
+def test_shared_connection_and_routing():
+    """Duplicate subscriptions collapse to one and each handler gets its own notifications"""
+    from monitoring.ws_mux import WebSocketMux
+
+    async def run():
+        server = FakeSolanaWs()
+        async with websockets.serve(server.handler, "127.0.0.1", 0) as ws_server:
+            port = ws_server.sockets[0].getsockname()[1]
+            mux = WebSocketMux(f"ws://127.0.0.1:{port}")
+
+            received = {"a": [], "b": [], "c": []}
+
+            def collect(name):
+                async def handler(result):
+                    received[name].append(result["value"])
+                return handler
+
+            raydium = ["675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8", {"commitment": "finalized"}]
+            pumpfun = ["6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P", {"commitment": "finalized"}]
+            handle_a = await mux.subscribe("programSubscribe", raydium, collect("a"))
+            await mux.subscribe("programSubscribe", raydium, collect("b"))
+            await mux.subscribe("programSubscribe", pumpfun, collect("c"))
+
+            await server.notify(101, "raydium-1")
+            await server.notify(102, "pumpfun-1")
+            await asyncio.sleep(0.05)
+
+            await mux.unsubscribe(handle_a)
+            await server.notify(101, "raydium-2")
+            await asyncio.sleep(0.05)
+
+            stats = mux.get_stats()
+            await mux.close()
+            return server, received, stats
+
+    server, received, stats = asyncio.run(run())
+    assert server.connections == 1
+    assert len(server.subscribes) == 2, server.subscribes
+    assert server.unsubscribes == [], "Subscription still has a handler"
+    assert received == {"a": ["raydium-1"], "b": ["raydium-1", "raydium-2"], "c": ["pumpfun-1"]}, received
+    assert stats["subscriptions"] == 2 and stats["handlers"] == 2
+    print("✓ PASSED: One connection, deduplicated subscriptions, routed notifications")
+
+def main():
+    tests = [test_shared_connection_and_routing]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ FAILED: {test.__name__} - {e}")
+    print(f"TOTAL: {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())